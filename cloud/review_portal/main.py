@@ -14,6 +14,8 @@ Endpoints:
 import os
 import json
 import hashlib
+import hmac
+import functools
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -25,6 +27,7 @@ app = Flask(__name__)
 GCS_BUCKET = os.environ.get("OMEGA_JOBS_BUCKET", "omega-jobs-subtitle-project")
 GCS_PREFIX = os.environ.get("OMEGA_JOBS_PREFIX", "jobs")
 SECRET_KEY = os.environ.get("OMEGA_REVIEW_SECRET", "omega-review-secret-2024")
+_SECRET_BYTES = SECRET_KEY.encode()
 TOKEN_EXPIRY_HOURS = 72
 
 # Lazy GCS client initialization
@@ -53,19 +56,30 @@ def get_bucket():
 
 def generate_token(job_id: str, expiry_hours: int = TOKEN_EXPIRY_HOURS) -> tuple[str, int]:
     """Generate a secure review token for a job."""
-    expiry_ts = int(time.time()) + (expiry_hours * 3600)
+    expiry_ts = -(-int(time.time()) // 60) * 60 + (expiry_hours * 3600)
+    return _token(job_id, expiry_ts), expiry_ts
+
+
+@functools.lru_cache(maxsize=4096)
+def _token(job_id: str, expiry_ts: int) -> str:
+    """Token for (job, expiry); cached since every page/API hit re-verifies the same link."""
+    payload = f"{job_id}:{expiry_ts}".encode()
+    return hmac.new(_SECRET_BYTES, payload, hashlib.sha256).hexdigest()[:32]
+
+
+def _legacy_token(job_id: str, expiry_ts: int) -> str:
+    """Pre-HMAC sha256(job:exp:secret) tokens; drop once links older than TOKEN_EXPIRY_HOURS are gone."""
     payload = f"{job_id}:{expiry_ts}:{SECRET_KEY}"
-    token = hashlib.sha256(payload.encode()).hexdigest()[:32]
-    return token, expiry_ts
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
 
 
 def verify_token(job_id: str, token: str, expiry_ts: int) -> bool:
     """Verify a review token is valid and not expired."""
     if time.time() > expiry_ts:
         return False
-    expected_payload = f"{job_id}:{expiry_ts}:{SECRET_KEY}"
-    expected_token = hashlib.sha256(expected_payload.encode()).hexdigest()[:32]
-    return token == expected_token
+    token = token.encode()
+    return (hmac.compare_digest(token, _token(job_id, expiry_ts).encode())
+            or hmac.compare_digest(token, _legacy_token(job_id, expiry_ts).encode()))
 
 
 # =============================================================================
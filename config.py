@@ -83,6 +83,13 @@ WHISPER_BIN = (
     os.environ.get("OMEGA_WHISPER_BIN", "").strip()
     or str(BASE_DIR / "scripts" / "whisperx_wrapper.py")
 )
+# Keep one WhisperX worker with models loaded across files (scripts/whisperx_daemon.py,
+# run with the same interpreter as the wrapper) instead of one CLI run per pass.
+WHISPER_DAEMON = os.environ.get("OMEGA_WHISPERX_DAEMON", "0").strip().lower() in {"1", "true", "yes", "on"}
+WHISPER_DAEMON_BIN = (
+    os.environ.get("OMEGA_WHISPER_DAEMON_BIN", "").strip()
+    or str(BASE_DIR / "scripts" / "whisperx_daemon.py")
+)
 
 # --- STORAGE READINESS ---
 _WRITE_PROBE_CACHE = {}
@@ -166,6 +173,10 @@ MODEL_EDITOR = "gemini-3-pro-preview"      # The "Brain" for Review
 MODEL_POLISH = os.environ.get("OMEGA_MODEL_POLISH", MODEL_TRANSLATOR).strip() or MODEL_TRANSLATOR
 MODEL_ASSISTANT = "gemini-3-flash-preview"   # Officially verified Gemini 3 Flash string
 GEMINI_LOCATION = "global"                 # Required for Preview models
+# Local translation via Vertex batch prediction (half price, queued): "off",
+# "auto" (jobs not flagged for human review) or "all". Submitted jobs wait in
+# TRANSLATING_BATCH (no translation slot held) and are polled every minute.
+OMEGA_TRANSLATE_BATCH_MODE = os.environ.get("OMEGA_TRANSLATE_BATCH_MODE", "off").strip().lower()
 
 # --- CLOUD ARTIFACTS (GCS) ---
 # Store per-job JSON artifacts (skeleton/termbook/translation/approved/checkpoints) in GCS.
@@ -209,6 +220,8 @@ OMEGA_DEMUCS_ENABLED = os.environ.get("OMEGA_DEMUCS_ENABLED", "1").strip().lower
 OMEGA_DEMUCS_MODEL = os.environ.get("OMEGA_DEMUCS_MODEL", "htdemucs").strip()
 # Device: "mps" (Apple Silicon GPU), "cpu", or "cuda" (Nvidia)
 OMEGA_DEMUCS_DEVICE = os.environ.get("OMEGA_DEMUCS_DEVICE", "mps").strip()
+# Half-precision Demucs inference (~2x on MPS); falls back to fp32 if an op is unsupported
+OMEGA_DEMUCS_FP16 = os.environ.get("OMEGA_DEMUCS_FP16", "0").strip().lower() in {"1", "true", "yes", "on"}
 
 # Style Map
 STYLE_MAP = {
@@ -238,6 +251,9 @@ BURN_METHOD_MAP = {
 # --- DELIVERY PROFILES (MEDIA ENCODING) ---
 # Select the appropriate profile when burning subtitles based on client requirements.
 # Use dashboard dropdown or set DEFAULT_DELIVERY_PROFILE for automatic selection.
+# Optional keys: "hwaccel" (decoder, e.g. "vaapi"; videotoolbox encoders default to
+# "videotoolbox") and "movflags" (default "+faststart"; "+frag_keyframe+empty_moov"
+# writes a fragmented MP4 with no end-of-file moov rewrite, for targets that accept it).
 
 DELIVERY_PROFILES = {
     "broadcast_hevc": {
@@ -303,6 +319,31 @@ DELIVERY_PROFILES = {
 # Default profile when no specific profile is selected
 DEFAULT_DELIVERY_PROFILE = os.environ.get("OMEGA_DELIVERY_PROFILE", "broadcast_hevc").strip()
 
+# libx264 threads per burn. The manager runs up to OMEGA_MAX_CONCURRENT_BURNS (2)
+# burns at once; each libx264 defaulting to 1.5x cores would oversubscribe the CPU.
+# 0 leaves it to libx264.
+try:
+    BURN_ENCODER_THREADS = int(os.environ.get("OMEGA_BURN_THREADS", "") or max(1, (os.cpu_count() or 2) // 2))
+except ValueError:
+    BURN_ENCODER_THREADS = 0
+
+# Split-and-stitch for long RuvBox (libx264) burns: programmes at least this long are
+# cut into OMEGA_PARALLEL_BURN_SEGMENTS pieces, encoded in parallel, then concatenated.
+# 0 (default) always burns in a single ffmpeg pass.
+try:
+    PARALLEL_BURN_MIN_SECONDS = float(os.environ.get("OMEGA_PARALLEL_BURN_MIN_SECONDS", "0") or 0)
+    PARALLEL_BURN_SEGMENTS = max(2, int(os.environ.get("OMEGA_PARALLEL_BURN_SEGMENTS", "4") or 4))
+except ValueError:
+    PARALLEL_BURN_MIN_SECONDS = 0.0
+    PARALLEL_BURN_SEGMENTS = 4
+
+# Kill a burn whose ffmpeg has produced no output (progress or errors) for this long.
+# -progress reports every ~0.5s, so silence means a wedged encoder, not a slow one.
+try:
+    BURN_STALL_TIMEOUT_SECONDS = float(os.environ.get("OMEGA_BURN_STALL_TIMEOUT", "600") or 600)
+except ValueError:
+    BURN_STALL_TIMEOUT_SECONDS = 600.0
+
 # --- CLIENT PATTERNS ---
 # Auto-detect client from filename. Keys are lowercase patterns to match, values are display names.
 # Matched in order, first match wins. Add your clients here.
@@ -2284,7 +2284,7 @@ def api_v2_pipeline_stats():
         "stages": [
             {"name": "INGESTING", "count": stage_counts.get("INGESTING", 0)},
             {"name": "TRANSCRIBING", "count": stage_counts.get("TRANSCRIBING", 0)},
-            {"name": "TRANSLATING", "count": stage_counts.get("TRANSLATING", 0) + stage_counts.get("CLOUD_TRANSLATING", 0)},
+            {"name": "TRANSLATING", "count": stage_counts.get("TRANSLATING", 0) + stage_counts.get("TRANSLATING_BATCH", 0) + stage_counts.get("CLOUD_TRANSLATING", 0)},
             {"name": "REVIEWING", "count": stage_counts.get("AWAITING_REVIEW", 0) + stage_counts.get("AWAITING_APPROVAL", 0)},
             {"name": "BURNING", "count": stage_counts.get("BURNING", 0) + stage_counts.get("FINALIZING", 0)},
             {"name": "DUBBING", "count": stage_counts.get("DUBBING", 0)},
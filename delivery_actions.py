@@ -6,8 +6,12 @@ Handles the "Mark Delivered" workflow:
 2. Copy files to delivery location
 3. Log delivery in database
 """
+import os
+import sys
 import shutil
 import json
+import ctypes
+import ctypes.util
 from pathlib import Path
 from datetime import datetime
 import config
@@ -15,6 +19,28 @@ import omega_db
 from delivery_templates import render_template
 
 
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a (multi-GB) deliverable without pushing bytes through Python.
+
+    On macOS/APFS, clonefile() makes a copy-on-write clone in O(1); the
+    clone stays independent if the source is re-burned later. Otherwise
+    shutil.copy2 already uses the kernel fast paths (sendfile on Linux,
+    fcopyfile on macOS).
+    """
+    if sys.platform == "darwin":
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            if dst.exists():
+                dst.unlink()  # clonefile refuses to overwrite
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                shutil.copystat(src, dst)
+                return
+        except Exception:
+            pass
+    shutil.copy2(src, dst)
+
+
 def mark_delivered(job_stem: str, notes: str = "") -> dict:
     """
     Mark a job as delivered.
@@ -74,7 +100,7 @@ def mark_delivered(job_stem: str, notes: str = "") -> dict:
     for video_file in video_candidates:
         dest_filename = f"{delivery_filename_base}.mp4"
         dest_path = delivery_dir / dest_filename
-        shutil.copy2(video_file, dest_path)
+        _clone_or_copy(video_file, dest_path)
         delivered_files.append(str(dest_path))
     
     if not delivered_files:
@@ -29,7 +29,7 @@ const stageToPhaseIndex = (stage: string) => {
   const value = stage.toUpperCase();
   if (["INGEST"].includes(value)) return 0;
   if (["TRANSCRIBED"].includes(value)) return 1;
-  if (["TRANSLATING", "TRANSLATING_CLOUD_SUBMITTED", "CLOUD_TRANSLATING", "CLOUD_REVIEWING"].includes(value)) return 2;
+  if (["TRANSLATING", "TRANSLATING_BATCH", "TRANSLATING_CLOUD_SUBMITTED", "CLOUD_TRANSLATING", "CLOUD_REVIEWING"].includes(value)) return 2;
   if (["TRANSLATED", "REVIEWING", "REVIEWED"].includes(value)) return 3;
   if (["FINALIZING", "FINALIZED"].includes(value)) return 4;
   if (["BURNING"].includes(value)) return 5;
@@ -61,6 +61,7 @@ export const STAGE_LABELS: Record<string, string> = {
     TRANSCRIBED: "Transcript Ready",
     TRANSLATING: "Translating...",
     TRANSLATING_CLOUD_SUBMITTED: "Translating...",
+    TRANSLATING_BATCH: "Batch Translation Queued",
     CLOUD_TRANSLATING: "Lead Translator",
     CLOUD_REVIEWING: "AI Review in Progress",
     CLOUD_POLISHING: "Senior Polish",
@@ -18,6 +18,27 @@ def _connect() -> sqlite3.Connection:
         pass
     return conn
 
+_GCS_UPLOADS_DDL = '''
+    CREATE TABLE IF NOT EXISTS gcs_uploads (
+        blob_name TEXT PRIMARY KEY,
+        size INTEGER,
+        mtime REAL,
+        uri TEXT,
+        uploaded_at TIMESTAMP
+    )
+'''
+
+_SEGMENT_MEMO_DDL = '''
+    CREATE TABLE IF NOT EXISTS segment_memo (
+        key TEXT PRIMARY KEY,
+        lang TEXT,
+        text TEXT,
+        used_at REAL
+    )
+'''
+SEGMENT_MEMO_MAX = 20000  # least recently used entries beyond this are pruned
+
+
 def init_db():
     """Initialize the database if it doesn't exist."""
     conn = _connect()
@@ -121,6 +142,12 @@ def init_db():
         )
     ''')
     
+    # GCS_UPLOADS table: audio already in the bucket (workers/translator.py)
+    c.execute(_GCS_UPLOADS_DDL)
+
+    # SEGMENT_MEMO table: translations of short stock phrases (workers/translator.py)
+    c.execute(_SEGMENT_MEMO_DDL)
+
     # Create indexes for common queries
     c.execute('CREATE INDEX IF NOT EXISTS idx_tracks_program ON tracks(program_id)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_tracks_stage ON tracks(stage)')
@@ -506,6 +533,117 @@ def get_jobs_since(last_version_processed):
     return get_all_jobs()
 
 
+# =============================================================================
+# GCS UPLOAD MEMO
+# =============================================================================
+
+def get_gcs_upload(blob_name, size, mtime):
+    """URI of a previous upload of this exact local file (size + mtime), or None."""
+    if not DB_PATH.exists():
+        return None
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT uri FROM gcs_uploads WHERE blob_name=? AND size=? AND mtime=?",
+                (blob_name, size, mtime),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def record_gcs_upload(blob_name, size, mtime, uri):
+    """Remember that blob_name holds the local file with this size/mtime."""
+    if not DB_PATH.exists():
+        init_db()
+    try:
+        conn = _connect()
+        try:
+            conn.execute(_GCS_UPLOADS_DDL)
+            conn.execute(
+                "INSERT OR REPLACE INTO gcs_uploads (blob_name, size, mtime, uri, uploaded_at) VALUES (?, ?, ?, ?, ?)",
+                (blob_name, size, mtime, uri, datetime.now().isoformat()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ GCS upload memo write failed: {e}")
+
+
+def forget_gcs_upload(blob_name):
+    """Drop the memo once the blob is deleted (or turns out to be unusable)."""
+    if not DB_PATH.exists():
+        return
+    try:
+        conn = _connect()
+        try:
+            conn.execute("DELETE FROM gcs_uploads WHERE blob_name=?", (blob_name,))
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ GCS upload memo delete failed: {e}")
+
+
+# =============================================================================
+# SEGMENT TRANSLATION MEMO
+# =============================================================================
+
+def get_segment_translations(keys):
+    """Returns {key: translation} for the memoized keys and marks them recently used."""
+    if not keys or not DB_PATH.exists():
+        return {}
+    keys = list(keys)
+    try:
+        conn = _connect()
+        try:
+            found = {}
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                found.update(conn.execute(f"SELECT key, text FROM segment_memo WHERE key IN ({marks})", chunk).fetchall())
+            if found:
+                now = time.time()
+                conn.executemany("UPDATE segment_memo SET used_at=? WHERE key=?", [(now, k) for k in found])
+                conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    return found
+
+
+def record_segment_translations(lang, items):
+    """Stores (key, translation) pairs, keeping the SEGMENT_MEMO_MAX most recently used."""
+    items = list(items)
+    if not items:
+        return
+    if not DB_PATH.exists():
+        init_db()
+    try:
+        conn = _connect()
+        try:
+            conn.execute(_SEGMENT_MEMO_DDL)
+            now = time.time()
+            conn.executemany(
+                "INSERT OR REPLACE INTO segment_memo (key, lang, text, used_at) VALUES (?, ?, ?, ?)",
+                [(key, lang, text, now) for key, text in items],
+            )
+            conn.execute(
+                "DELETE FROM segment_memo WHERE key IN (SELECT key FROM segment_memo ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (SEGMENT_MEMO_MAX,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ Segment memo write failed: {e}")
+
+
 # =============================================================================
 # PROGRAMS & TRACKS (Localization Platform API)
 # =============================================================================
@@ -760,6 +898,54 @@ def update_track(track_id: str, **kwargs) -> bool:
         conn.close()
 
 
+def update_job_and_track(file_stem: str, track_id: str = None,
+                         progress: float = None, status: str = None) -> bool:
+    """
+    Write job + track progress in a single transaction.
+
+    Lightweight path for hot progress loops: only progress/status/updated_at
+    are touched (no stage/status timeline bookkeeping like update()).
+    If track_id is None, the track linked via tracks.job_id is updated.
+    """
+    if progress is None and status is None:
+        return False
+    if not DB_PATH.exists():
+        return False
+
+    now = datetime.now().isoformat()
+    job_fields = ["updated_at=?"]
+    job_values = [now]
+    if progress is not None:
+        job_fields.append("progress=?")
+        job_values.append(progress)
+    if status is not None:
+        job_fields.append("status=?")
+        job_values.append(status)
+
+    conn = _connect()
+    conn.isolation_level = None
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN IMMEDIATE")
+        c.execute(f"UPDATE jobs SET {', '.join(job_fields)} WHERE file_stem=?", (*job_values, file_stem))
+        updated = c.rowcount > 0
+        if progress is not None:
+            if track_id:
+                c.execute("UPDATE tracks SET progress=?, updated_at=? WHERE id=?", (progress, now, track_id))
+            else:
+                c.execute("UPDATE tracks SET progress=?, updated_at=? WHERE job_id=?", (progress, now, file_stem))
+            updated = updated or c.rowcount > 0
+        _increment_version(c)
+        c.execute("COMMIT")
+        return updated
+    except Exception as e:
+        print(f"❌ DB Progress Update Failed: {e}")
+        conn.rollback()
+        return False
+    finally:
+        conn.close()
+
+
 def get_track_by_job(job_id: str) -> dict:
     """Find track by linked job ID."""
     conn = _connect()
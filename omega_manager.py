@@ -47,6 +47,10 @@ _task_lock = threading.Lock()
 
 MAX_TASK_FAILURES = 5
 
+# TRANSLATING_BATCH jobs: earliest time.time() to poll their Vertex batch job again
+_batch_poll_after = {}
+TRANSLATE_BATCH_POLL_SECONDS = 60.0
+
 # --- Thread-safe helpers for active_tasks ---
 def _is_task_active(stem: str) -> bool:
     """Thread-safe check if a task is currently active."""
@@ -117,6 +121,17 @@ def _polish_pass_enabled(meta: dict) -> bool:
         return False
     return bool(meta.get("review_required")) or str(meta.get("mode") or "").upper() == "REVIEW"
 
+def _translate_batch_mode(meta: dict) -> bool:
+    mode = str(getattr(config, "OMEGA_TRANSLATE_BATCH_MODE", "off") or "off").strip().lower()
+    if mode in {"1", "true", "yes", "on", "all"}:
+        return True
+    if mode != "auto":
+        return False
+    # Unattended jobs can wait in the batch queue; review jobs have someone waiting.
+    if not isinstance(meta, dict):
+        return True
+    return not (bool(meta.get("review_required")) or str(meta.get("mode") or "").upper() in {"REVIEW", "REMOTE_REVIEW"})
+
 def _review_portal_url() -> str:
     return str(os.environ.get("OMEGA_REVIEW_PORTAL_URL", "") or "").strip()
 
@@ -809,6 +824,24 @@ def process_jobs(executor):
             executor.submit(task_wrapper, stem, "IngestRecovery", _run_ingest_recovery, stem, video_vault)
             continue
 
+    # 1a. TRANSLATING_BATCH -> TRANSCRIBED once the Vertex batch job has finished.
+    # Queued batch jobs hold no translation slot; only this short poll runs here.
+    for job in jobs:
+        stem = job.get("file_stem")
+        if not stem or stem in active_tasks or is_in_cooldown(stem):
+            continue
+        if (job.get("stage") or "").upper() != "TRANSLATING_BATCH":
+            continue
+        if _job_meta(job).get("halted") or time.time() < _batch_poll_after.get(stem, 0.0):
+            continue
+        skel = config.VAULT_DATA / f"{stem}_SKELETON.json"
+        if not skel.exists():
+            continue
+        _batch_poll_after[stem] = time.time() + TRANSLATE_BATCH_POLL_SECONDS
+        _add_task(stem)
+        executor.submit(task_wrapper, stem, "Translate (Batch Poll)", _run_translate_batch_poll,
+                        skel, stem, job.get("target_language", "is"))
+
     # 2. TRANSCRIBED -> TRANSLATING (submit to Cloud Run or local worker)
     # Calculate initial translating count for concurrency gate
     MAX_CONCURRENT_TRANSLATIONS = int(os.environ.get("OMEGA_MAX_CONCURRENT_TRANSLATIONS", "2"))
@@ -819,6 +852,7 @@ def process_jobs(executor):
     )
 
     # 1. TRANSCRIBED -> TRANSLATING (submit to Cloud Run or local worker)
+    prefetched = False
     for job in jobs:
         stem = job.get("file_stem")
         if not stem or stem in active_tasks:
@@ -866,6 +900,10 @@ def process_jobs(executor):
         if currently_translating >= MAX_CONCURRENT_TRANSLATIONS:
             # Skip this job for now; it will be picked up in the next cycle
             logger.debug(f"⏳ Waiting to translate {stem}: {currently_translating} jobs already translating (max {MAX_CONCURRENT_TRANSLATIONS})")
+            if not prefetched and not _cloud_pipeline_enabled():
+                # Upload the next job's audio while the running translations wait on Gemini.
+                translator.prefetch_audio(stem)
+                prefetched = True
             continue
         
         _add_task(stem)
@@ -1445,13 +1483,28 @@ def _run_translate(skel, stem, target_language):
         skel,
         target_language_code=target_language,
         program_profile=program_profile,
+        batch_mode=_translate_batch_mode(job.get("meta")),
     )
+    if output_path is None:
+        # Handed to Vertex batch prediction: give the translation slot back
+        # while it queues; _run_translate_batch_poll picks it up again.
+        omega_db.update(stem, stage="TRANSLATING_BATCH", progress=40.0)
+        return
     
     done_skel = config.VAULT_DATA / f"{stem}_SKELETON_DONE.json"
     shutil.move(str(skel), str(done_skel))
     
     omega_db.update(stem, stage="TRANSLATED", status="Ready for Review", progress=55.0, meta={"translation_path": str(output_path)})
 
+def _run_translate_batch_poll(skel, stem, target_language):
+    job = omega_db.get_job(stem) or {}
+    program_profile = (job.get("program_profile") or "standard").strip() or "standard"
+    if not translator.poll_batch_translation(skel, target_language_code=target_language, program_profile=program_profile):
+        return
+    _batch_poll_after.pop(stem, None)
+    logger.info(f"📦 Batch translation finished: {stem}; queueing the online pass")
+    omega_db.update(stem, stage="TRANSCRIBED", status="Batch translated; finishing online", progress=45.0)
+
 def _run_translate_cloud(skel, stem, target_language):
     """
     Cloud-first path: upload job artifacts to GCS and let the cloud worker do
@@ -1653,6 +1706,7 @@ import signal
 
 def cleanup(signum, frame):
     logger.info(f"🛑 Received signal {signum}. Cleaning up...")
+    translator.request_shutdown()  # don't let retry backoff hold up the executor join
     sys.exit(0)
 
 def main():
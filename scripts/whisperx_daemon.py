@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Long-lived WhisperX worker for workers/transcriber.py (OMEGA_WHISPERX_DAEMON=1).
+
+Keeps the ASR and alignment models loaded between files instead of paying the
+multi-GB model load on every CLI run (and again for the safety pass).
+
+Protocol: one JSON request per line on stdin, e.g.
+    {"audio": "/path/x.wav", "output_dir": "/path", "model": "large-v3",
+     "language": "en", "compute_type": "float32", "device": "cpu",
+     "batch_size": 1, "print_progress": true,
+     "vad_onset": 0.35, "vad_offset": 0.12, "chunk_size": 20}
+Writes the same <audio stem>.json the CLI would (output_format json), echoes the
+CLI's progress lines on stdout, then ends every request with
+    OMEGA_WHISPERX_DONE {"ok": true, "json": "/path/x.json"}
+With "return_segments": true nothing is written; the reply carries the result
+segments instead: {"ok": true, "segments": [...]}.
+Exits when stdin closes.
+"""
+import sys
+import json
+from pathlib import Path
+
+import torch
+import omegaconf
+
+# Same PyTorch 2.6+ pyannote VAD fix as whisperx_wrapper.py
+try:
+    torch.serialization.add_safe_globals([omegaconf.listconfig.ListConfig])
+except AttributeError:
+    pass
+
+import whisperx
+
+DONE_MARKER = "OMEGA_WHISPERX_DONE"
+
+_asr_models = {}
+_align_models = {}
+
+
+def _asr_model(req):
+    key = (req["model"], req["device"], req["compute_type"], req.get("language"))
+    vad_options = {k: req[k] for k in ("vad_onset", "vad_offset") if req.get(k) is not None}
+    model = _asr_models.get(key)
+    if model is None:
+        _asr_models.clear()  # one ASR model resident at a time
+        model = whisperx.load_model(
+            req["model"], req["device"],
+            compute_type=req["compute_type"],
+            language=req.get("language"),
+        )
+        model._omega_default_vad = dict(getattr(model, "_vad_params", {}) or {})
+        _asr_models[key] = model
+    # VAD thresholds are per request (the safety pass uses its own)
+    if hasattr(model, "_vad_params"):
+        model._vad_params = {**model._omega_default_vad, **vad_options}
+    elif vad_options:
+        model = whisperx.load_model(
+            req["model"], req["device"],
+            compute_type=req["compute_type"],
+            language=req.get("language"),
+            vad_options=vad_options,
+        )
+    return model
+
+
+def _align_model(language, device):
+    key = (language, device)
+    if key not in _align_models:
+        _align_models[key] = whisperx.load_align_model(language_code=language, device=device)
+    return _align_models[key]
+
+
+def handle(req):
+    audio_path = Path(req["audio"])
+    print_progress = bool(req.get("print_progress"))
+    audio = whisperx.load_audio(str(audio_path))
+
+    model = _asr_model(req)
+    print(">>Performing transcription...", flush=True)
+    result = model.transcribe(
+        audio,
+        batch_size=int(req.get("batch_size") or 1),
+        chunk_size=int(req.get("chunk_size") or 30),
+        print_progress=print_progress,
+    )
+
+    language = result.get("language") or req.get("language") or "en"
+    print(">>Performing alignment...", flush=True)
+    align_model, metadata = _align_model(language, req["device"])
+    result = whisperx.align(
+        result["segments"], align_model, metadata, audio, req["device"],
+        return_char_alignments=False, print_progress=print_progress,
+    )
+    result["language"] = language
+    if req.get("return_segments"):
+        return {"segments": result["segments"]}
+
+    out_path = Path(req["output_dir"]) / f"{audio_path.stem}.json"
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, default=float)
+    return {"json": str(out_path)}
+
+
+def main():
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            reply = {"ok": True, **handle(json.loads(line))}
+        except Exception as e:
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        print(f"{DONE_MARKER} {json.dumps(reply, default=float)}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+omega_db helper unit tests (throwaway SQLite file per test).
+Run: pytest tests/test_omega_db.py -v
+"""
+import pytest
+
+import omega_db
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point omega_db at a fresh database under tmp_path."""
+    monkeypatch.setattr(omega_db, "DB_PATH", tmp_path / "test.db")
+    omega_db.init_db()
+    return omega_db
+
+
+class TestGcsUploadMemo:
+    """get/record/forget_gcs_upload."""
+
+    def test_round_trip(self, db):
+        """A recorded upload is found for the same size + mtime."""
+        db.record_gcs_upload("audio_cache/job.flac", 1234, 1700000000.5, "gs://b/audio_cache/job.flac")
+        assert db.get_gcs_upload("audio_cache/job.flac", 1234, 1700000000.5) == "gs://b/audio_cache/job.flac"
+
+    def test_changed_file_misses(self, db):
+        """A different size or mtime means a different local file."""
+        db.record_gcs_upload("audio_cache/job.flac", 1234, 1700000000.5, "gs://b/x")
+        assert db.get_gcs_upload("audio_cache/job.flac", 1235, 1700000000.5) is None
+        assert db.get_gcs_upload("audio_cache/job.flac", 1234, 1700000001.0) is None
+
+    def test_forget(self, db):
+        """forget_gcs_upload() drops the memo."""
+        db.record_gcs_upload("audio_cache/job.flac", 1, 2.0, "gs://b/x")
+        db.forget_gcs_upload("audio_cache/job.flac")
+        assert db.get_gcs_upload("audio_cache/job.flac", 1, 2.0) is None
+
+    def test_missing_db(self, tmp_path, monkeypatch):
+        """Reads and deletes are no-ops before the DB exists."""
+        monkeypatch.setattr(omega_db, "DB_PATH", tmp_path / "absent.db")
+        assert omega_db.get_gcs_upload("x", 1, 2.0) is None
+        omega_db.forget_gcs_upload("x")
+        assert not (tmp_path / "absent.db").exists()
+
+
+class TestSegmentMemo:
+    """get/record_segment_translations."""
+
+    def test_round_trip(self, db):
+        """Recorded keys come back; unknown keys are absent."""
+        db.record_segment_translations("is", [("k1", "Amen."), ("k2", "Hallelúja!")])
+        assert db.get_segment_translations({"k1", "k2", "k3"}) == {"k1": "Amen.", "k2": "Hallelúja!"}
+
+    def test_empty_inputs(self, db):
+        """No keys, no query; no items, no write."""
+        assert db.get_segment_translations(set()) == {}
+        db.record_segment_translations("is", [])
+        assert db.get_segment_translations({"k1"}) == {}
+
+    def test_replace(self, db):
+        """Recording a key again overwrites its translation."""
+        db.record_segment_translations("is", [("k1", "old")])
+        db.record_segment_translations("is", [("k1", "new")])
+        assert db.get_segment_translations({"k1"}) == {"k1": "new"}
+
+    def test_prunes_least_recently_used(self, db, monkeypatch):
+        """Only SEGMENT_MEMO_MAX entries survive; a lookup counts as a use."""
+        monkeypatch.setattr(omega_db, "SEGMENT_MEMO_MAX", 2)
+        times = iter([100.0, 200.0, 300.0, 400.0])
+        monkeypatch.setattr(omega_db.time, "time", lambda: next(times))
+        db.record_segment_translations("is", [("a", "A")])   # used_at 100
+        db.record_segment_translations("is", [("b", "B")])   # used_at 200
+        db.get_segment_translations({"a"})                   # a -> 300
+        db.record_segment_translations("is", [("c", "C")])   # used_at 400, prunes b
+        monkeypatch.setattr(omega_db.time, "time", lambda: 500.0)
+        assert db.get_segment_translations({"a", "b", "c"}) == {"a": "A", "c": "C"}
+
+    def test_many_keys(self, db):
+        """Lookups are chunked under SQLite's bound-parameter limit."""
+        db.record_segment_translations("is", [(f"k{i}", str(i)) for i in range(1200)])
+        found = db.get_segment_translations({f"k{i}" for i in range(1200)})
+        assert len(found) == 1200 and found["k1199"] == "1199"
+
+
+class TestUpdateJobAndTrack:
+    """update_job_and_track() writes job + track progress together."""
+
+    @pytest.fixture
+    def job(self, db):
+        db.update("job1", stage="BURNING", status="Burning", progress=0.0)
+        program_id = db.create_program("Sermon")
+        track_id = db.create_track(program_id, language_code="is", job_id="job1")
+        return track_id
+
+    def test_updates_job_and_linked_track(self, db, job):
+        """Without a track_id the track is found via tracks.job_id."""
+        assert db.update_job_and_track("job1", progress=42.0, status="Burning 42%") is True
+        row = db.get_job("job1")
+        assert row["progress"] == 42.0 and row["status"] == "Burning 42%"
+        assert db.get_track(job)["progress"] == 42.0
+
+    def test_explicit_track_id(self, db, job):
+        """An explicit track_id is updated directly."""
+        db.update_job_and_track("job1", track_id=job, progress=10.0)
+        assert db.get_track(job)["progress"] == 10.0
+
+    def test_status_only_leaves_progress(self, db, job):
+        """A status-only write doesn't touch progress on either row."""
+        db.update_job_and_track("job1", progress=30.0)
+        db.update_job_and_track("job1", status="Muxing")
+        assert db.get_job("job1")["progress"] == 30.0
+        assert db.get_track(job)["progress"] == 30.0
+
+    def test_bumps_db_version(self, db, job):
+        """The frontend refetch counter moves on every write."""
+        def version():
+            conn = db._connect()
+            try:
+                return int(conn.execute("SELECT value FROM system_state WHERE key='db_version'").fetchone()[0])
+            finally:
+                conn.close()
+        before = version()
+        db.update_job_and_track("job1", progress=5.0)
+        assert version() == before + 1
+
+    def test_nothing_to_write(self, db, job):
+        """No progress and no status is a no-op."""
+        assert db.update_job_and_track("job1") is False
+
+    def test_unknown_job(self, db):
+        """Nothing matched reports False."""
+        assert db.update_job_and_track("missing", progress=1.0) is False
@@ -0,0 +1,157 @@
+"""
+Publisher helper unit tests (no ffmpeg needed).
+Run: pytest tests/test_publisher.py -v
+"""
+import subprocess
+import sys
+from collections import deque
+
+import pytest
+
+import config
+from workers import publisher
+
+
+class TestDecoderArgs:
+    """build_decoder_args() against the real delivery profiles."""
+
+    def test_real_profiles(self):
+        """Every configured profile builds decoder args (dict profiles, no cache TypeError)."""
+        for key, profile in config.DELIVERY_PROFILES.items():
+            args = publisher.build_decoder_args(profile)
+            assert isinstance(args, list), key
+
+    def test_videotoolbox_profile_uses_hwaccel(self):
+        """A videotoolbox encoder decodes on videotoolbox too."""
+        args = publisher.build_decoder_args(config.DELIVERY_PROFILES["broadcast_hevc"])
+        assert args == ["-hwaccel", "videotoolbox"]
+
+    def test_software_profile_has_no_hwaccel(self):
+        """libx264 profiles decode in software."""
+        assert publisher.build_decoder_args(config.DELIVERY_PROFILES["broadcast_h264"]) == []
+
+    def test_explicit_hwaccel(self):
+        """An explicit "hwaccel" key wins over the encoder default."""
+        profile = {"encoder": "libx264", "hwaccel": "vaapi"}
+        assert publisher.build_decoder_args(profile) == ["-hwaccel", "vaapi"]
+
+    def test_repeat_call_returns_fresh_list(self):
+        """Callers splat the result; mutating one must not leak into the next."""
+        profile = config.DELIVERY_PROFILES["web"]
+        first = publisher.build_decoder_args(profile)
+        first.append("-x")
+        assert publisher.build_decoder_args(profile) == ["-hwaccel", "videotoolbox"]
+
+
+class TestEncoderArgs:
+    """build_encoder_args() memoizes on a frozen profile."""
+
+    def test_real_profiles(self):
+        """Every configured profile (lists inside) builds encoder args."""
+        for key, profile in config.DELIVERY_PROFILES.items():
+            args = publisher.build_encoder_args(profile)
+            assert args[:2] == ["-c:v", profile["encoder"]], key
+
+
+class TestProgressParsing:
+    """FFmpeg -progress stream helpers."""
+
+    def test_parse_progress_line(self):
+        """out_time_us lines give seconds; everything else is ignored."""
+        assert publisher._parse_progress_line(b"out_time_us=2500000") == 2.5
+        assert publisher._parse_progress_line(b"out_time_us=N/A") is None
+        assert publisher._parse_progress_line(b"frame=12") is None
+
+    def test_iter_pipe_lines_splits_cr_and_lf(self):
+        """'\\r' and '\\n' both end a line; stderr goes to the tail only."""
+        script = ("import sys; sys.stdout.write('a=1\\rb=2\\nc=3'); "
+                  "sys.stderr.write('err1\\nerr2\\n')")
+        proc = subprocess.Popen([sys.executable, "-c", script],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        tail = deque(maxlen=5)
+        lines = list(publisher._iter_pipe_lines(proc.stdout, stderr_pipe=proc.stderr, stderr_tail=tail))
+        proc.wait()
+        assert lines == [b"a=1", b"b=2", b"c=3"]
+        assert list(tail) == [b"err1", b"err2"]
+
+
+class TestRunFfmpegWithProgress:
+    """_run_ffmpeg_with_progress() never leaves the child running."""
+
+    def test_db_error_kills_child(self, monkeypatch, tmp_path):
+        """A progress write that raises must kill and reap the encoder."""
+        spawned = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            proc = real_popen(*args, **kwargs)
+            spawned.append(proc)
+            return proc
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(publisher.subprocess, "Popen", popen)
+        monkeypatch.setattr(publisher, "_probe_duration", lambda *a, **k: 10.0)
+        monkeypatch.setattr(publisher.omega_db, "update_job_and_track", boom)
+
+        # Emits one progress line, then hangs like a long encode
+        script = ("import sys, time; print('out_time_us=5000000', flush=True); "
+                  "time.sleep(60)")
+        with pytest.raises(RuntimeError):
+            publisher._run_ffmpeg_with_progress([sys.executable, "-c", script], "stem",
+                                                tmp_path / "out.mp4", tmp_path / "in.mp4",
+                                                job={}, track_id=None)
+        assert spawned and spawned[0].poll() is not None
+
+
+class TestFramesDirCleanup:
+    """Background frame cleanup must not touch a re-created frames dir."""
+
+    def test_async_cleanup_renames_before_deleting(self, tmp_path):
+        """The fixed-name dir is free for reuse as soon as the call returns."""
+        frames = tmp_path / "temp_frames_stem"
+        frames.mkdir()
+        (frames / "000001.png").write_bytes(b"old")
+        publisher._remove_frames_dir_async(frames)
+        assert not frames.exists()
+
+        frames.mkdir()
+        (frames / "000001.png").write_bytes(b"new")
+        for t in list(publisher.threading.enumerate()):
+            if t is not publisher.threading.current_thread() and t.daemon:
+                t.join(timeout=5)
+        assert (frames / "000001.png").read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["temp_frames_stem"]
+
+    def test_async_cleanup_missing_dir(self, tmp_path):
+        """A dir that is already gone is not an error."""
+        publisher._remove_frames_dir_async(tmp_path / "missing")
+
+
+class TestIterSrtBlocks:
+    """iter_srt_blocks() single-regex SRT parser."""
+
+    def test_basic_cues(self):
+        """Timestamps become ms; multi-line text is split per line."""
+        srt = (
+            "1\n00:00:01,500 --> 00:00:03,000\nHello\n\n"
+            "2\n01:02:03,004 --> 01:02:05,000\nLine one\nLine two\n"
+        )
+        assert list(publisher.iter_srt_blocks(srt)) == [
+            (1500, 3000, ["Hello"]),
+            (3723004, 3725000, ["Line one", "Line two"]),
+        ]
+
+    def test_dot_separator_and_trailing_settings(self):
+        """'.' millisecond separators and position settings after the arrow are accepted."""
+        srt = "1\n00:00:00.250 --> 00:00:01.000 X1:0 X2:10\nHi\n"
+        assert list(publisher.iter_srt_blocks(srt)) == [(250, 1000, ["Hi"])]
+
+    def test_surrounding_whitespace(self):
+        """Leading/trailing blank lines don't produce phantom cues."""
+        srt = "\n\n1\n00:00:01,000 --> 00:00:02,000\nA\n\n\n"
+        assert list(publisher.iter_srt_blocks(srt)) == [(1000, 2000, ["A"])]
+
+    def test_empty(self):
+        assert list(publisher.iter_srt_blocks("")) == []
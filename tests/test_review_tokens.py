@@ -0,0 +1,76 @@
+"""
+Review magic-link token unit tests (signing in workers/review_notifier.py,
+verification in cloud/review_portal/main.py).
+Run: pytest tests/test_review_tokens.py -v
+"""
+import hashlib
+import hmac
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from workers import review_notifier
+
+PORTAL_MAIN = Path(__file__).resolve().parent.parent / "cloud" / "review_portal" / "main.py"
+
+
+@pytest.fixture(scope="module")
+def portal():
+    """The review portal module (needs flask)."""
+    pytest.importorskip("flask")
+    spec = importlib.util.spec_from_file_location("review_portal_main", PORTAL_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestSigning:
+    """generate_review_token() / build_review_url()."""
+
+    def test_hmac_of_job_and_expiry(self):
+        """The token is the truncated HMAC-SHA256 of "job:expiry"."""
+        token, expiry_ts = review_notifier.generate_review_token("JOB_1")
+        expected = hmac.new(review_notifier.SECRET_KEY.encode(), f"JOB_1:{expiry_ts}".encode(),
+                            hashlib.sha256).hexdigest()[:32]
+        assert token == expected
+
+    def test_expiry_rounded_to_minute(self, monkeypatch):
+        """Calls within one minute get the same (cached) token and expiry."""
+        monkeypatch.setattr(review_notifier.time, "time", lambda: 1_700_000_041.0)
+        first = review_notifier.generate_review_token("JOB_1", expiry_hours=1)
+        monkeypatch.setattr(review_notifier.time, "time", lambda: 1_700_000_099.0)
+        assert review_notifier.generate_review_token("JOB_1", expiry_hours=1) == first
+        assert first[1] % 60 == 0 and first[1] - 1_700_000_041 >= 3600
+
+    def test_per_job(self):
+        assert review_notifier.generate_review_token("A")[0] != review_notifier.generate_review_token("B")[0]
+
+    def test_url(self):
+        url = review_notifier.build_review_url("JOB_1")
+        token, expiry_ts = review_notifier.generate_review_token("JOB_1")
+        assert url.endswith(f"/review/JOB_1?token={token}&exp={expiry_ts}")
+
+
+class TestVerification:
+    """The portal accepts exactly what the notifier signs."""
+
+    def test_round_trip(self, portal):
+        token, expiry_ts = review_notifier.generate_review_token("JOB_1")
+        assert portal.verify_token("JOB_1", token, expiry_ts)
+
+    def test_rejects_other_job_or_expiry(self, portal):
+        token, expiry_ts = review_notifier.generate_review_token("JOB_1")
+        assert not portal.verify_token("JOB_2", token, expiry_ts)
+        assert not portal.verify_token("JOB_1", token, expiry_ts + 60)
+
+    def test_rejects_expired(self, portal, monkeypatch):
+        token, expiry_ts = review_notifier.generate_review_token("JOB_1", expiry_hours=1)
+        monkeypatch.setattr(portal.time, "time", lambda: expiry_ts + 1)
+        assert not portal.verify_token("JOB_1", token, expiry_ts)
+
+    def test_legacy_token(self, portal):
+        """Pre-HMAC links keep working until they expire."""
+        _, expiry_ts = review_notifier.generate_review_token("JOB_1")
+        legacy = hashlib.sha256(f"JOB_1:{expiry_ts}:{portal.SECRET_KEY}".encode()).hexdigest()[:32]
+        assert portal.verify_token("JOB_1", legacy, expiry_ts)
@@ -0,0 +1,50 @@
+"""
+Transcriber helper unit tests (no audio models needed).
+Run: pytest tests/test_transcriber.py -v
+"""
+from workers import transcriber
+
+
+def seg(start, end, text="words"):
+    return {"start": start, "end": end, "text": text}
+
+
+class TestMergeSafetySegments:
+    """_merge_safety_segments() adds only uncovered safety-pass segments."""
+
+    def test_no_safety(self):
+        """Nothing to add returns the primary list untouched."""
+        primary = [seg(0, 1)]
+        assert transcriber._merge_safety_segments(primary, [], 60) == (primary, 0)
+
+    def test_adds_gap_segment_in_order(self):
+        """A safety segment in a primary gap is added and the result is sorted."""
+        primary = [seg(0, 2, "a"), seg(10, 12, "c")]
+        merged, added = transcriber._merge_safety_segments(primary, [seg(5, 7, "b")], 60)
+        assert added == 1
+        assert [s["text"] for s in merged] == ["a", "b", "c"]
+
+    def test_overlap_is_skipped(self):
+        """Anything overlapping a primary (within the pad) is dropped."""
+        primary = [seg(0, 5)]
+        safety = [seg(4, 6), seg(5.2, 6)]  # overlaps; starts inside the 0.25 s pad
+        assert transcriber._merge_safety_segments(primary, safety, 60)[1] == 0
+
+    def test_long_primary_covers_later_start(self):
+        """An early primary that runs long still covers later safety segments."""
+        primary = [seg(0, 30), seg(1, 2)]
+        assert transcriber._merge_safety_segments(primary, [seg(20, 22)], 60)[1] == 0
+
+    def test_filters(self):
+        """Outside the window, empty/inverted and music markers are ignored."""
+        safety = [seg(70, 72), seg(5, 5), seg(6, 7, "  "), seg(8, 9, "(MUSIC)")]
+        assert transcriber._merge_safety_segments([], safety, 60)[1] == 0
+
+    def test_pre_sorted_matches_unsorted(self):
+        """The pre_sorted fast path gives the same result."""
+        primary = [seg(0, 1, "a"), seg(20, 21, "d")]
+        safety = [seg(5, 6, "b"), seg(10, 11, "c")]
+        slow = transcriber._merge_safety_segments(list(primary), safety, 60)
+        fast = transcriber._merge_safety_segments(list(primary), safety, 60, pre_sorted=True)
+        assert slow == fast
+        assert [s["text"] for s in fast[0]] == ["a", "b", "c", "d"]
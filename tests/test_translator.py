@@ -0,0 +1,265 @@
+"""
+Translator helper unit tests (pure functions; no Vertex calls are made).
+Needs requirements.txt installed (google-cloud-storage, google-cloud-aiplatform).
+Run: pytest tests/test_translator.py -v
+"""
+import json
+from concurrent.futures import Future
+
+import pytest
+
+from workers import translator
+
+
+def segs(*texts, start_id=1):
+    return [{"id": start_id + i, "text": text} for i, text in enumerate(texts)]
+
+
+
+
+class TestParseTranslation:
+    """_parse_translation() validates the model's JSON reply."""
+
+    def test_orders_by_input(self):
+        """Output follows the batch order, whatever order the model used."""
+        reply = json.dumps([{"id": 2, "text": "B"}, {"id": 1, "text": "A"}])
+        assert translator._parse_translation(reply, segs("a", "b")) == [
+            {"id": 1, "text": "A"}, {"id": 2, "text": "B"},
+        ]
+
+    def test_coerces_string_ids_and_ignores_junk(self):
+        """String ids are coerced; unknown ids and malformed items are skipped."""
+        reply = json.dumps([{"id": "1", "text": "A"}, {"id": 99, "text": "?"}, "junk", {"id": 2}, {"id": 2, "text": "B"}])
+        assert [item["text"] for item in translator._parse_translation(reply, segs("a", "b"))] == ["A", "B"]
+
+    def test_markdown_fence(self):
+        """A fenced ```json reply is still accepted."""
+        reply = '```json\n[{"id": 1, "text": "A"}]\n```'
+        assert translator._parse_translation(reply, segs("a")) == [{"id": 1, "text": "A"}]
+
+    def test_missing_ids(self):
+        with pytest.raises(ValueError, match="Missing IDs"):
+            translator._parse_translation(json.dumps([{"id": 1, "text": "A"}]), segs("a", "b"))
+
+    def test_not_a_list(self):
+        with pytest.raises(ValueError, match="not a JSON array"):
+            translator._parse_translation('{"id": 1, "text": "A"}', segs("a"))
+
+
+class TestCheckpointDelta:
+    """_replay_checkpoint_delta() merges the append-only delta log."""
+
+    def test_replay_over_snapshot(self, tmp_path):
+        """Delta lines win over the snapshot; later lines win over earlier ones."""
+        checkpoint = tmp_path / "job.is.standard.translate_checkpoint.json"
+        translator._checkpoint_delta_path(checkpoint).write_bytes(
+            b'{"id": 1, "text": "one"}\n{"id": 2, "text": "two"}\n{"id": 1, "text": "ONE"}\n'
+        )
+        translated = {"1": "old", "3": "three"}
+        translator._replay_checkpoint_delta(checkpoint, translated)
+        assert translated == {"1": "ONE", "2": "two", "3": "three"}
+
+    def test_torn_last_line(self, tmp_path):
+        """A line cut short by a crash is skipped."""
+        checkpoint = tmp_path / "c.json"
+        translator._checkpoint_delta_path(checkpoint).write_bytes(b'{"id": 1, "text": "one"}\n{"id": 2, "te')
+        translated = {}
+        translator._replay_checkpoint_delta(checkpoint, translated)
+        assert translated == {"1": "one"}
+
+    def test_no_delta(self, tmp_path):
+        translated = {"1": "x"}
+        translator._replay_checkpoint_delta(tmp_path / "c.json", translated)
+        assert translated == {"1": "x"}
+
+    def test_load_checkpoint_applies_delta(self, tmp_path):
+        """_load_checkpoint() returns the snapshot plus the delta log."""
+        checkpoint = tmp_path / "c.json"
+        base = translator._load_checkpoint(checkpoint, stem="job", target_language_code="is",
+                                           program_profile="standard", source_count=2)
+        base["translated"] = {"1": "A"}
+        checkpoint.write_text(json.dumps(base))
+        translator._checkpoint_delta_path(checkpoint).write_bytes(b'{"id": 2, "text": "B"}\n')
+        loaded = translator._load_checkpoint(checkpoint, stem="job", target_language_code="is",
+                                             program_profile="standard", source_count=2)
+        assert loaded["translated"] == {"1": "A", "2": "B"}
+
+
+class TestPrefetchedUpload:
+    """Prefetched audio uploads are claimed by translate() and never leaked."""
+
+    @pytest.fixture
+    def skeleton(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(translator.config, "VAULT_DIR", tmp_path / "vault")
+        monkeypatch.setattr(translator.config, "EDITOR_DIR", tmp_path / "editor")
+        (tmp_path / "vault" / "Audio").mkdir(parents=True)
+        (tmp_path / "editor").mkdir()
+        (tmp_path / "vault" / "Audio" / "job.wav").write_bytes(b"RIFF")
+        skeleton = tmp_path / "job_SKELETON.json"
+        skeleton.write_text(json.dumps({"segments": segs("a")}))
+        return skeleton
+
+    def test_no_credentials(self, skeleton, monkeypatch):
+        """Without credentials nothing is queued."""
+        monkeypatch.setattr(translator, "ensure_credentials", lambda: False)
+        translator.prefetch_audio("job")
+        assert "job" not in translator._prefetched_uploads
+
+    def test_early_return_deletes_prefetch(self, skeleton, monkeypatch):
+        """An existing editor output hands the unused upload to the cleanup pool."""
+        monkeypatch.setattr(translator, "ensure_credentials", lambda: True)
+        cleaned = []
+        monkeypatch.setattr(translator, "_submit_cleanup", lambda label, fn, *args: cleaned.append((fn, args)))
+        upload = Future()
+        upload.set_result("gs://bucket/audio_cache/job.wav")
+        monkeypatch.setitem(translator._prefetched_uploads, "job", upload)
+        output = translator.config.EDITOR_DIR / "job_IS.json"
+        output.write_text(json.dumps({"source_data": [], "translated_data": []}))
+
+        assert translator.translate(skeleton, "is") == output
+        assert "job" not in translator._prefetched_uploads
+        assert cleaned == [(translator._delete_uploaded_audio, (upload, translator._audio_path("job"), "job"))]
+
+
+class TestRestoreAudioBlob:
+    """_restore_audio_blob() re-uploads a memoized blob only when it is gone."""
+
+    URI = f"gs://{translator.BUCKET_NAME}/audio_cache/job.wav"
+
+    @pytest.fixture
+    def uploads(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(translator.config, "VAULT_DIR", tmp_path)
+        (tmp_path / "Audio").mkdir()
+        (tmp_path / "Audio" / "job.wav").write_bytes(b"RIFF")
+        calls = []
+
+        def upload_to_gcs(local_path, destination_name, *, force=False):
+            calls.append((local_path.name, destination_name, force))
+            return f"gs://{translator.BUCKET_NAME}/{destination_name}"
+
+        monkeypatch.setattr(translator, "upload_to_gcs", upload_to_gcs)
+        return calls
+
+    def bucket(self, monkeypatch, exists):
+        blob = type("Blob", (), {"exists": lambda self: exists})()
+        monkeypatch.setattr(translator, "_get_bucket", lambda: type("Bucket", (), {"blob": lambda self, name: blob})())
+
+    def test_missing_blob_is_forced(self, uploads, monkeypatch):
+        self.bucket(monkeypatch, exists=False)
+        assert translator._restore_audio_blob(self.URI, "job") is True
+        assert uploads == [("job.wav", "audio_cache/job.wav", True)]
+
+    def test_existing_blob_left_alone(self, uploads, monkeypatch):
+        """A live blob means the cache failed for another reason; nothing is re-sent."""
+        self.bucket(monkeypatch, exists=True)
+        assert translator._restore_audio_blob(self.URI, "job") is False
+        assert uploads == []
+
+
+class TestBatchTranslation:
+    """Batch mode submits and returns; poll_batch_translation() collects later."""
+
+    RECORD = {"resource_name": "projects/p/locations/l/batchPredictionJobs/1", "input_blob": "batch_in/1.jsonl",
+              "batches": [[1, 2]], "deadline": 0}
+
+    @pytest.fixture
+    def skeleton(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(translator.config, "VAULT_DIR", tmp_path / "vault")
+        monkeypatch.setattr(translator.config, "VAULT_DATA", tmp_path / "vault" / "Data")
+        monkeypatch.setattr(translator.config, "EDITOR_DIR", tmp_path / "editor")
+        (tmp_path / "vault" / "Audio").mkdir(parents=True)
+        (tmp_path / "editor").mkdir()
+        (tmp_path / "vault" / "Audio" / "job.wav").write_bytes(b"RIFF")
+        monkeypatch.setattr(translator, "ensure_credentials", lambda: True)
+        monkeypatch.setattr(translator, "_init_vertex", lambda: None)
+        monkeypatch.setattr(translator, "BatchPredictionJob", object)
+        skeleton = tmp_path / "job_SKELETON.json"
+        skeleton.write_text(json.dumps({"segments": segs("a", "b")}))
+        return skeleton
+
+    def write_checkpoint(self, **fields):
+        path = translator._checkpoint_path("job", "is", "standard")
+        checkpoint = translator._load_checkpoint(path, stem="job", target_language_code="is",
+                                                 program_profile="standard", source_count=2)
+        checkpoint.update(fields)
+        path.write_text(json.dumps(checkpoint))
+        return path
+
+    def test_pending_job_returns_none(self, skeleton):
+        """translate() doesn't wait on (or resubmit) a queued batch job."""
+        self.write_checkpoint(batch_job=self.RECORD)
+        assert translator.translate(skeleton, "is") is None
+
+    def test_poll_still_running(self, skeleton, monkeypatch):
+        path = self.write_checkpoint(batch_job=self.RECORD)
+        monkeypatch.setattr(translator, "_collect_batch_translation", lambda record: None)
+        assert translator.poll_batch_translation(skeleton, "is") is False
+        assert json.loads(path.read_text())["batch_job"] == self.RECORD
+
+    def test_poll_merges_results(self, skeleton, monkeypatch):
+        """Finished rows land in the checkpoint; the rest is left to the online pass."""
+        path = self.write_checkpoint(batch_job=self.RECORD)
+        monkeypatch.setattr(translator, "_collect_batch_translation", lambda record: {"1": "A"})
+        cleaned = []
+        monkeypatch.setattr(translator, "_submit_cleanup", lambda label, fn, *args: cleaned.append(fn))
+        assert translator.poll_batch_translation(skeleton, "is") is True
+        checkpoint = json.loads(path.read_text())
+        assert "batch_job" not in checkpoint and checkpoint["batch_done"]
+        assert checkpoint["translated"] == {"1": "A"} and checkpoint["translated_count"] == 1
+        assert cleaned == []  # segment 2 still needs the audio blob
+
+    def test_poll_complete_deletes_audio(self, skeleton, monkeypatch):
+        self.write_checkpoint(batch_job=self.RECORD)
+        monkeypatch.setattr(translator, "_collect_batch_translation", lambda record: {"1": "A", "2": "B"})
+        cleaned = []
+        monkeypatch.setattr(translator, "_submit_cleanup", lambda label, fn, *args: cleaned.append(fn))
+        assert translator.poll_batch_translation(skeleton, "is") is True
+        assert cleaned == [translator._delete_uploaded_audio]
+
+    def test_no_batch_job(self, skeleton):
+        assert translator.poll_batch_translation(skeleton, "is") is True
+
+
+class TestPackBatches:
+    """_pack_batches() greedy in-order packing."""
+
+    def test_segment_cap(self):
+        """max_segments splits short lines evenly, in order."""
+        batches = translator._pack_batches(segs(*["Amen."] * 5), max_segments=2, max_tokens=10_000)
+        assert [[s["id"] for s in b] for b in batches] == [[1, 2], [3, 4], [5]]
+
+    def test_token_cap(self):
+        """Long lines close a batch before the segment cap."""
+        long_line = "x" * 400  # ~112 estimated tokens
+        batches = translator._pack_batches(segs(long_line, long_line, "hi"), max_segments=150, max_tokens=200)
+        assert [len(b) for b in batches] == [1, 2]
+
+    def test_oversized_segment_alone(self):
+        """A segment over the token budget still gets its own batch."""
+        batches = translator._pack_batches(segs("y" * 10_000, "hi"), max_segments=150, max_tokens=50)
+        assert [len(b) for b in batches] == [1, 1]
+
+    def test_empty(self):
+        assert translator._pack_batches([], 10, 100) == []
+
+
+class TestSegmentMemoKeys:
+    """_segment_memo_keys() is opt-in and limited to stock phrases."""
+
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("OMEGA_TRANSLATE_SEGMENT_MEMO", raising=False)
+        assert translator._segment_memo_keys(segs("Amen."), "is", "standard") == {}
+
+    def test_only_stock_phrases(self, monkeypatch):
+        """Case and punctuation are ignored; context-dependent short lines never match."""
+        monkeypatch.setenv("OMEGA_TRANSLATE_SEGMENT_MEMO", "1")
+        keys = translator._segment_memo_keys(segs("Amen.", "PRAISE the Lord!", "I'm ready.", "Yes, he is."),
+                                             "is", "standard")
+        assert sorted(keys) == ["1", "2"]
+
+    def test_key_includes_language_and_profile(self, monkeypatch):
+        monkeypatch.setenv("OMEGA_TRANSLATE_SEGMENT_MEMO", "1")
+        one = translator._segment_memo_keys(segs("Amen."), "is", "standard")["1"]
+        assert one == translator._segment_memo_keys(segs("amen"), "is", "standard")["1"]
+        assert one != translator._segment_memo_keys(segs("Amen."), "de", "standard")["1"]
+        assert one != translator._segment_memo_keys(segs("Amen."), "is", "kids")["1"]
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 import time
@@ -81,6 +82,18 @@ def _load_job_file(job_id: str) -> Tuple[Optional[Path], Optional[Dict]]:
     return None, None
 
 
+_TIMECODE_RE = re.compile(r"(\d+):(\d+):(\d+)(?:[,.](\d+))?")
+
+def _timecode_to_seconds(tc: str) -> float:
+    """Convert HH:MM:SS,mmm (or .mmm) to float seconds; 0.0 if unparseable."""
+    m = _TIMECODE_RE.match(tc)
+    if not m:
+        return 0.0
+    hours, minutes, seconds, frac = m.groups()
+    total = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    return total + int(frac) / 10 ** len(frac) if frac else float(total)
+
+
 def _parse_srt(srt_path: Path) -> list:
     """
     Parse SRT file into segment list.
@@ -88,18 +101,6 @@ def _parse_srt(srt_path: Path) -> list:
     """
     segments = []
     
-    def timecode_to_seconds(tc: str) -> float:
-        """Convert HH:MM:SS,mmm to float seconds."""
-        try:
-            tc = tc.replace(',', '.')  # SRT uses comma for milliseconds
-            parts = tc.split(':')
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = float(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-        except Exception:
-            return 0.0
-    
     try:
         with open(srt_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -126,8 +127,8 @@ def _parse_srt(srt_path: Path) -> list:
             start_tc = timecode_parts[0].strip()
             end_tc = timecode_parts[1].strip()
             
-            start = timecode_to_seconds(start_tc)
-            end = timecode_to_seconds(end_tc)
+            start = _timecode_to_seconds(start_tc)
+            end = _timecode_to_seconds(end_tc)
             
             # Lines 3+: Text
             text = '\n'.join(lines[2:])
@@ -5,6 +5,14 @@ import subprocess
 import re
 import json
 import logging
+import functools
+import selectors
+import shlex
+import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import config
@@ -40,32 +48,53 @@ Style: Default,Arial,48,&H00FFFFFF,&H000000FF,&H8A000000,&H8A000000,-1,0,0,0,100
 Style: RuvBox,SF Pro Display,65,&H00FFFFFF,&H000000FF,&H33000000,&H33000000,0,0,0,0,100,100,0,0,3,2,0,2,50,50,65,1
 """
 
+# Everything before the first Dialogue line, encoded once
+ASS_PREAMBLE = (
+    ASS_HEADER + "\n[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+).encode("utf-8")
+
 def iso_now():
     return datetime.now().isoformat()
 
-def adjust_ass_time(time_str, delta_ms):
-    parts = time_str.split(':')
-    h = int(parts[0])
-    m = int(parts[1])
-    s_parts = parts[2].split('.')
-    s = int(s_parts[0])
-    cs = int(s_parts[1])
-    total_ms = (h * 3600 + m * 60 + s) * 1000 + (cs * 10)
-    new_ms = max(0, total_ms + delta_ms)
-    
-    new_h = new_ms // 3600000
-    rem = new_ms % 3600000
-    new_m = rem // 60000
-    rem = rem % 60000
-    new_s = rem // 1000
-    new_cs = (rem % 1000) // 10
-    return f"{new_h}:{new_m:02d}:{new_s:02d}.{new_cs:02d}"
+
+# Escaping for a path inside ass='...' in an ffmpeg filtergraph, in one pass:
+# backslashes -> '/', ':' -> '\:', "'" -> close quote, escaped quote, reopen.
+_ASS_ESCAPE_TABLE = str.maketrans({"\\": "/", ":": "\\:", "'": "'\\\\''"})
+
+# Optional libass text shaping override for our burns. Unset keeps libass's
+# default (HarfBuzz "complex" shaping + kerning); OMEGA_ASS_SHAPING=simple trades
+# that for speed on Latin-only jobs.
+ASS_SHAPING = os.environ.get("OMEGA_ASS_SHAPING", "").strip()
+_ASS_SHAPING_OPT = f":shaping={ASS_SHAPING}" if ASS_SHAPING else ""
+
+def _ms_to_ass(total_ms):
+    # milliseconds -> H:MM:SS.cc (truncated to centiseconds)
+    h, rem = divmod(total_ms // 10, 360000)
+    m, rem = divmod(rem, 6000)
+    s, cs = divmod(rem, 100)
+    return f"{h}:{m:02d}:{s:02d}.{cs:02d}"
+
+def _x264_thread_args():
+    # Burns already run concurrently on the manager's thread pool; cap each encoder's share
+    if config.BURN_ENCODER_THREADS > 0:
+        return ["-threads", str(config.BURN_ENCODER_THREADS)]
+    return []
 
 def build_encoder_args(profile: dict) -> list:
     """
     Build FFmpeg encoder arguments from a delivery profile.
     Supports both hardware (videotoolbox) and software (libx264) encoders.
+    Memoized per distinct profile, so a batch on one profile builds it once.
     """
+    frozen = tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in profile.items()
+    ))
+    return list(_build_encoder_args(frozen))
+
+@functools.lru_cache(maxsize=32)
+def _build_encoder_args(frozen_profile: tuple) -> tuple:
+    profile = dict(frozen_profile)
     encoder = profile.get("encoder", "hevc_videotoolbox")
     args = ["-c:v", encoder]
     
@@ -92,110 +121,228 @@ def build_encoder_args(profile: dict) -> list:
             args.extend(["-maxrate", profile["maxrate"]])
         if profile.get("bufsize"):
             args.extend(["-bufsize", profile["bufsize"]])
+        args.extend(_x264_thread_args())
     
     # Add any extra profile-specific args
     if profile.get("extra_args"):
         args.extend(profile["extra_args"])
         
-    return args
+    return tuple(args)
 
-def _run_ffmpeg_with_progress(cmd, stem, output_file, video_path):
+def build_decoder_args(profile: dict) -> list:
+    """
+    Build FFmpeg input-side hwaccel arguments for a delivery profile.
+    The ass/overlay filters are CPU-only, so frames are still downloaded for
+    compositing, but decode runs on the media engine when the encoder does.
+    A profile may set "hwaccel" explicitly (e.g. "vaapi" on Linux hosts).
+    """
+    hwaccel = profile.get("hwaccel")
+    if hwaccel is None and "videotoolbox" in profile.get("encoder", "hevc_videotoolbox"):
+        hwaccel = "videotoolbox"
+    if not hwaccel:
+        return []
+    return ["-hwaccel", hwaccel]
+
+JOB_CACHE_TTL_SECONDS = 10
+
+@functools.lru_cache(maxsize=64)
+def _get_job_ttl(stem, ttl_bucket):
+    return omega_db.get_job(stem) or {}
+
+def _get_job_cached(stem):
+    """
+    omega_db.get_job() behind a 10 s TTL (the bucket is part of the cache key).
+    Publisher only reads job fields (style, meta, program/track ids), which
+    don't change mid-burn, so back-to-back lookups for one stem share a row.
+    """
+    return _get_job_ttl(stem, int(time.time() // JOB_CACHE_TTL_SECONDS))
+
+@functools.lru_cache(maxsize=512)
+def _ffprobe_media_info(video_path_str, mtime, size):
+    """
+    Runs ffprobe once for container duration + first video stream frame rate.
+    Keyed on (path, mtime, size) so a replaced file is probed again; one
+    spawn per source per process instead of one per field per burn.
+    Returns (duration_seconds, r_frame_rate string).
+
+    close_fds=False (here and for the ffmpeg Popen) lets subprocess use
+    posix_spawn instead of fork+exec when the binary path is absolute, so a
+    large worker heap isn't page-table-copied per spawn. Our own fds are
+    non-inheritable (PEP 446), so nothing leaks to the child.
+    """
+    probe_cmd = [
+        config.FFPROBE_BIN,
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "format=duration:stream=r_frame_rate",
+        "-of", "json",
+        video_path_str
+    ]
+    info = json.loads(subprocess.check_output(probe_cmd, close_fds=False))
+    duration = float((info.get("format") or {}).get("duration") or 0)
+    streams = info.get("streams") or [{}]
+    return duration, streams[0].get("r_frame_rate") or "25/1"
+
+def _probe_media_info(video_path):
+    st = video_path.stat()
+    return _ffprobe_media_info(str(video_path), st.st_mtime, st.st_size)
+
+def _probe_duration(video_path, program_id=None):
+    """
+    Returns the source duration in seconds (0 if unknown).
+    Prefers programs.duration_seconds; on a miss, probes the file once and
+    writes the result back so later burns/retries skip ffprobe entirely.
+    """
+    if program_id:
+        prog = omega_db.get_program(program_id)
+        if prog:
+            duration = float(prog.get("duration_seconds") or 0)
+            if duration > 0:
+                return duration
+
+    if not video_path.exists():
+        return 0
+
+    duration, _ = _probe_media_info(video_path)
+    if program_id and duration > 0:
+        try:
+            omega_db.update_program(program_id, duration_seconds=duration)
+        except Exception as e:
+            logger.warning(f"Could not persist duration for program {program_id}: {e}")
+    return duration
+
+_PIPE_LINE_SPLIT = re.compile(rb"[\r\n]")
+
+def _iter_pipe_lines(pipe, chunk_size=65536, stderr_pipe=None, stderr_tail=None, stall_timeout=None):
+    """
+    Yields raw lines (bytes) from a subprocess pipe.
+    Waits on the fd with a selector and drains it in large chunks instead of
+    one readline() per line. FFmpeg ends stats lines with '\r', so both
+    '\r' and '\n' count as line breaks.
+
+    If stderr_pipe is given it is drained on the same selector (neither pipe
+    can fill up and stall ffmpeg); its lines go into stderr_tail (a bounded
+    deque) instead of being yielded, so they are never decoded unless needed.
+
+    Raises TimeoutError if no output at all arrives for stall_timeout seconds
+    (a wedged encoder); the caller owns killing the process.
+    """
+    out_fd = pipe.fileno()
+    pending = {out_fd: b""}
+    if stderr_pipe is not None:
+        pending[stderr_pipe.fileno()] = b""
+    with selectors.DefaultSelector() as sel:
+        for fd in pending:
+            os.set_blocking(fd, False)
+            sel.register(fd, selectors.EVENT_READ)
+        open_fds = len(pending)
+        last_output_at = time.monotonic()
+        while open_fds:
+            events = sel.select(timeout=1.0)
+            if not events:
+                if stall_timeout and time.monotonic() - last_output_at > stall_timeout:
+                    raise TimeoutError(f"no output for {stall_timeout:.0f}s")
+                continue
+            last_output_at = time.monotonic()
+            for key, _ in events:
+                fd = key.fd
+                try:
+                    chunk = os.read(fd, chunk_size)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    sel.unregister(fd)
+                    open_fds -= 1
+                    lines = [pending[fd]]
+                else:
+                    lines = _PIPE_LINE_SPLIT.split(pending[fd] + chunk)
+                    pending[fd] = lines.pop()
+                if fd == out_fd:
+                    for line in lines:
+                        if line:
+                            yield line
+                elif stderr_tail is not None:
+                    stderr_tail.extend(line for line in lines if line)
+
+# Structured progress on stdout (out_time_us=..., progress=continue|end)
+# instead of scraping the human-readable stats line from stderr.
+FFMPEG_PROGRESS_ARGS = ["-progress", "pipe:1", "-nostats", "-loglevel", "error"]
+
+def _parse_progress_line(line):
+    """Returns encoded seconds from an `out_time_us=` progress line, else None."""
+    key, _, value = line.partition(b"=")
+    if key != b"out_time_us":
+        return None
+    try:
+        return int(value) / 1_000_000
+    except ValueError:
+        # "N/A" until the first frame is muxed
+        return None
+
+def _run_ffmpeg_with_progress(cmd, stem, output_file, video_path, job=None, track_id=None):
     """
     Runs FFmpeg with real-time progress tracking updates to DB.
+    Shared by publish() and burn(); pass `job` if already fetched, and
+    `track_id` if known (otherwise the track is matched on job_id).
     """
     try:
         # Use Popen for real-time progress parsing
         logger.info(f"   🐢 Encoding with progress tracking...")
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT, 
-            universal_newlines=True,
-            bufsize=1
-        )
+        # stdout carries only the -progress stream; stderr (errors only) is
+        # drained alongside it and kept for the failure log
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False)
+        stderr_tail = deque(maxlen=20)
         
-        # Get total duration for progress calculation
-        total_duration = 0
         try:
-            # Try getting from DB first using stem (job_id)
-            job = omega_db.get_job(stem) or {}
-            
-            if job.get("program_id"):
-                prog = omega_db.get_program(job.get("program_id"))
-                if prog:
-                    total_duration = float(prog.get("duration_seconds") or 0)
-            
-            # Fallback: estimate from video file if DB missing
-            if total_duration <= 0 and video_path.exists():
-                probe_cmd = [
-                    config.FFPROBE_BIN, 
-                    "-v", "error", 
-                    "-show_entries", "format=duration", 
-                    "-of", "default=noprint_wrappers=1:nokey=1", 
-                    str(video_path)
-                ]
-                total_duration = float(subprocess.check_output(probe_cmd).strip())
-        except Exception as e:
-            logger.warning(f"Could not determine duration for progress: {e}")
+            # Get total duration for progress calculation
             total_duration = 0
+            try:
+                # Try getting from DB first using stem (job_id)
+                if job is None:
+                    job = _get_job_cached(stem)
+                total_duration = _probe_duration(video_path, job.get("program_id"))
+            except Exception as e:
+                logger.warning(f"Could not determine duration for progress: {e}")
+                total_duration = 0
 
-        logger.info(f"   Duration: {total_duration}s")
-        
-        # Progress loop
-        import re
-        time_pattern = re.compile(r"time=(\d{2}):(\d{2}):(\d{2}\.\d{2})")
-        last_progress_update = 0
-        
-        while True:
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
+            logger.info(f"   Duration: {total_duration}s")
             
-            if line:
-                # Parse time=00:00:00.00
-                match = time_pattern.search(line)
-                if match and total_duration > 0:
-                    h, m, s = match.groups()
-                    current_seconds = int(h) * 3600 + int(m) * 60 + float(s)
-                    progress = min(99.0, (current_seconds / total_duration) * 100)
-                    
-                    # Update DB every 2 seconds or 5% change to save DB writes
-                    now = time.time()
-                    if (now - last_progress_update > 2.0):
-                         # Find track? We only have stem/job_id.
-                         # Need to update job progress.
-                         omega_db.update(stem, progress=progress, status=f"Burning {int(progress)}%")
-                         
-                         # Also try to update TRACK if we can find it
-                         # We can iterate tracks for job?
-                         # Or just update job and let UI poll job?
-                         # Dashboard UI polls TRACK.
-                         # Does omega_db.update(stem) update track? NO.
-                         # We need to find the track.
-                         if job.get('tracks'):
-                              # This is messy. Job structure varies.
-                              pass
-                         
-                         # Try finding subtitle track for this job in BURNING stage
-                         # Optimization: Don't do heavy query every loop.
-                         # Assuming backend logic links job->track.
-                         # But wait, dashboard uses track.progress.
-                         # We need to update track!
-                         # Let's try to update track if job has 'meta.track_id'?
-                         # Or query once at start.
-                         
-                         # For now, just update job. ProgramDetailView might use job progress?
-                         # No, it uses track.progress.
-                         # Let's verify if we can find the track_id.
-                         last_progress_update = now
-        
+            # Progress loop (-progress pipe:1 key=value stream)
+            # Flush to DB every 5 s or on a >=5% jump, whichever comes first;
+            # job + track are written in one transaction (track found via job_id).
+            last_flush_at = 0
+            last_flushed_progress = 0.0
+            
+            try:
+                for line in _iter_pipe_lines(process.stdout, stderr_pipe=process.stderr, stderr_tail=stderr_tail,
+                                             stall_timeout=config.BURN_STALL_TIMEOUT_SECONDS):
+                    current_seconds = _parse_progress_line(line)
+                    if current_seconds is not None and total_duration > 0:
+                        progress = min(99.0, (current_seconds / total_duration) * 100)
+                        now = time.time()
+                        if now - last_flush_at >= 5.0 or progress - last_flushed_progress >= 5.0:
+                            omega_db.update_job_and_track(stem, track_id, progress=progress, status=f"Burning {int(progress)}%")
+                            last_flush_at = now
+                            last_flushed_progress = progress
+            except TimeoutError:
+                raise subprocess.TimeoutExpired(cmd, config.BURN_STALL_TIMEOUT_SECONDS, stderr=b"\n".join(stderr_tail))
+            
+            process.wait()
+        finally:
+            # Any error above (DB write, stall, Ctrl-C) must not orphan ffmpeg
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
         if process.returncode != 0:
-            raise subprocess.CalledProcessError(process.returncode, cmd)
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=b"\n".join(stderr_tail))
             
         return output_file
         
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         logger.error(f"Burn Failed: {e}")
+        if e.stderr:
+            logger.error(e.stderr.decode("utf-8", errors="replace"))
         raise e
 
 
@@ -254,28 +401,35 @@ def publish(video_path: Path, srt_path: Path, subtitle_style: str = "Classic",
         logger.info("🍎 Using Apple Style (Overlay Engine)")
         
         # 1. Convert SRT to JSON for the Overlay Engine
-        temp_json_path = config.VAULT_DATA / f"{stem}_OVERLAY_INPUT.json"
+        temp_json_path = _temp_artifact_path(stem, "_OVERLAY_INPUT.json")
         parse_srt_to_overlay_json(srt_path, temp_json_path)
         
-        # 2. Render Overlay (ProRes 4444 MOV)
-        overlay_mov_path = config.VAULT_DATA / f"{stem}_OVERLAY.mov"
-        
-        render_overlay(
-            video_path=str(video_path),
-            subs_json_path=str(temp_json_path),
-            output_path=str(overlay_mov_path),
-            profile_name="AppleTV_IS",
-            stem=stem
-        )
+        # 2. Render Overlay as a PNG frame sequence (no ProRes 4444 intermediate)
+        try:
+            overlay_frames_dir = render_overlay(
+                video_path=str(video_path),
+                subs_json_path=str(temp_json_path),
+                # skip_encoding: only the parent dir is used (frames land in VAULT_DATA)
+                output_path=str(config.VAULT_DATA / f"{stem}_OVERLAY.mov"),
+                profile_name="AppleTV_IS",
+                stem=stem,
+                skip_encoding=True
+            )
+        finally:
+            temp_json_path.unlink(missing_ok=True)
+        _, frame_rate = _probe_media_info(video_path)
         
-        # 3. Composite Overlay onto Video (uses delivery profile encoder)
+        # 3. Composite Overlay onto Video in one decode/encode pass (delivery profile encoder)
+        # eof_action=pass keeps the programme running if the frame sequence ends early.
         logger.info("   Compositing Overlay...")
         cmd = [
-            config.FFMPEG_BIN, "-y",
+            config.FFMPEG_BIN, "-y", *FFMPEG_PROGRESS_ARGS,
+            *build_decoder_args(profile),
             "-i", str(video_path),
-            "-i", str(overlay_mov_path),
-            "-filter_complex", "[0:v][1:v]overlay=0:0,format=yuv420p",
-            "-map", "0:a",
+            "-framerate", frame_rate,
+            "-i", str(Path(overlay_frames_dir) / "%06d.png"),
+            "-filter_complex", "[0:v][1:v]overlay=0:0:eof_action=pass,format=yuv420p[v]",
+            "-map", "[v]", "-map", "0:a",
         ]
         # Add encoder args from profile
         cmd.extend(build_encoder_args(profile))
@@ -285,28 +439,35 @@ def publish(video_path: Path, srt_path: Path, subtitle_style: str = "Classic",
             "-color_trc", "1", 
             "-colorspace", "1",
             "-pix_fmt", "yuv420p",
-            "-movflags", "+faststart",
+            "-movflags", profile.get("movflags", "+faststart"),
             "-c:a", "copy",
             str(output_path)
         ])
         
+        logger.info("   Running FFmpeg (%s): %s", profile['name'], shlex.join(cmd))
+        try:
+            return _run_ffmpeg_with_progress(cmd, stem, output_path, video_path)
+        finally:
+            _remove_frames_dir_async(overlay_frames_dir)
+        
     else:
         # Standard ASS Burn-in (Classic / Modern)
         
         # 1. Generate ASS
-        ass_path = config.VAULT_DATA / f"{stem}.ass"
+        ass_path = _temp_artifact_path(stem, ".ass")
         generate_ass_from_srt(srt_path, ass_path, style_name=ass_style_name)
         
         # ESCAPE PATH FOR FFMPEG FILTER
         ass_path_str = str(ass_path)
-        ass_path_escaped = ass_path_str.replace("\\", "/").replace(":", "\\:").replace("'", "'\\\\''"  )
+        ass_path_escaped = ass_path_str.translate(_ASS_ESCAPE_TABLE)
         
         # Build filter chain: ass with fontsdir, then format conversion
-        vf_filter = f"ass='{ass_path_escaped}':fontsdir='/System/Library/Fonts/',format=yuv420p"
+        vf_filter = f"ass='{ass_path_escaped}':fontsdir='/System/Library/Fonts/'{_ASS_SHAPING_OPT},format=yuv420p"
         
         # Build command with delivery profile encoder
         cmd = [
-            config.FFMPEG_BIN, "-y",
+            config.FFMPEG_BIN, "-y", *FFMPEG_PROGRESS_ARGS,
+            *build_decoder_args(profile),
             "-i", str(video_path),
             "-map", "0:v", "-map", "0:a",
             "-vf", vf_filter,
@@ -319,17 +480,40 @@ def publish(video_path: Path, srt_path: Path, subtitle_style: str = "Classic",
             "-color_trc", "1",
             "-colorspace", "1",
             "-pix_fmt", "yuv420p",
-            "-movflags", "+faststart",
+            "-movflags", profile.get("movflags", "+faststart"),
             "-c:a", "copy",
             str(output_path)
         ])
     
-    logger.info(f"   Running FFmpeg ({profile['name']}): {' '.join(cmd)}")
+    logger.info("   Running FFmpeg (%s): %s", profile['name'], shlex.join(cmd))
     # Prevent SIGTTOU suspension by explicitly detaching stdin
-    return _run_ffmpeg_with_progress(cmd, stem, output_path, video_path)
+    try:
+        return _run_ffmpeg_with_progress(cmd, stem, output_path, video_path)
+    finally:
+        ass_path.unlink(missing_ok=True)
     
     return output_path
 
+# One cue: index line, "start --> end" line, then text up to the next blank line.
+# Text must start on the timing line's next line, so an empty cue can't swallow its neighbour.
+SRT_BLOCK_RE = re.compile(
+    r"^\d+[ \t]*\n"
+    r"(\d+):(\d+):(\d+)[,.](\d+)[ \t]*-->[ \t]*(\d+):(\d+):(\d+)[,.](\d+)[^\n]*\n"
+    r"([^\n].*?)(?=\n\n|\Z)",
+    re.S | re.M,
+)
+
+def iter_srt_blocks(srt_content):
+    """
+    Yields (start_ms, end_ms, text_lines) for each SRT cue.
+    Single regex pass over the file; our SRTs are clean so no library needed.
+    """
+    for match in SRT_BLOCK_RE.finditer(srt_content.strip()):
+        h1, m1, s1, ms1, h2, m2, s2, ms2, text = match.groups()
+        start_ms = ((int(h1) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1)
+        end_ms = ((int(h2) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2)
+        yield start_ms, end_ms, text.split('\n')
+
 def parse_srt_to_overlay_json(srt_path, json_path):
     """
     Parses SRT and saves as JSON for subs_render_overlay.
@@ -337,30 +521,12 @@ def parse_srt_to_overlay_json(srt_path, json_path):
     with open(srt_path, 'r', encoding='utf-8') as f:
         srt_content = f.read()
         
-    blocks = srt_content.strip().split('\n\n')
     events = []
     
-    for block in blocks:
-        lines = block.split('\n')
-        if len(lines) < 3: continue
-        
-        time_line = lines[1]
-        text_lines = lines[2:]
-        
-        start_str, end_str = time_line.split(' --> ')
-        
-        # Convert time to seconds
-        def time_to_sec(t_str):
-            # 00:00:01,500
-            h, m, s = t_str.replace(',', '.').split(':')
-            return int(h) * 3600 + int(m) * 60 + float(s)
-            
-        start_sec = time_to_sec(start_str)
-        end_sec = time_to_sec(end_str)
-        
+    for start_ms, end_ms, text_lines in iter_srt_blocks(srt_content):
         events.append({
-            "start": start_sec,
-            "end": end_sec,
+            "start": start_ms / 1000,
+            "end": end_ms / 1000,
             "lines": [l.strip() for l in text_lines]
         })
         
@@ -370,17 +536,19 @@ def parse_srt_to_overlay_json(srt_path, json_path):
         "events": events
     }
     
+    # Machine-read only (subs_render_overlay): compact, single write
     with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, separators=(",", ":")))
 
-def convert_srt_time_to_ass(srt_time):
-    # 00:00:01,500 -> 0:00:01.50
-    try:
-        h, m, s_ms = srt_time.split(':')
-        s, ms = s_ms.split(',')
-        return f"{int(h)}:{m}:{s}.{ms[:2]}"
-    except ValueError:
-        return "0:00:00.00"
+# RuvBox stacks one event per line: MarginV = base + i * line height.
+RUVBOX_BASE_MARGIN_V = 65
+RUVBOX_LINE_HEIGHT = 68  # Balanced spacing (65 Font + 2 Outline + 1px Overlap)
+
+def _ruvbox_margins(count):
+    return tuple(RUVBOX_BASE_MARGIN_V + i * RUVBOX_LINE_HEIGHT for i in range(count))
+
+# Precomputed for the common case (cues rarely exceed 5 lines)
+RUVBOX_MARGINS = _ruvbox_margins(5)
 
 def generate_ass_from_srt(srt_path, ass_path, style_name="RuvBox"):
     """
@@ -389,87 +557,200 @@ def generate_ass_from_srt(srt_path, ass_path, style_name="RuvBox"):
     with open(srt_path, 'r', encoding='utf-8') as f:
         srt_content = f.read()
         
-    # Parse SRT (simple regex or library)
-    # We can use a simple parser since our SRTs are clean.
-    blocks = srt_content.strip().split('\n\n')
-    
     events = []
-    for block in blocks:
-        lines = block.split('\n')
-        if len(lines) < 3: continue
-        
-        # index = lines[0]
-        time_line = lines[1]
-        
-        start_str, end_str = time_line.split(' --> ')
-        start_ass = convert_srt_time_to_ass(start_str)
-        end_ass = convert_srt_time_to_ass(end_str)
+    for start_ms, end_ms, text_lines in iter_srt_blocks(srt_content):
+        start_ass = _ms_to_ass(start_ms)
 
         # Custom RuvBox Logic: Split lines to control box overlap/spacing
         if style_name == "RuvBox":
             # FORCE CLEARANCE: Subtract 100ms from end time to prevent stacking
-            # Use end_ass (H:MM:SS.cs) not end_str (H:MM:SS,mmm) to avoid math errors
-            end_ass_adjusted = adjust_ass_time(end_ass, -100)
+            end_ass_adjusted = _ms_to_ass(max(0, end_ms - 100))
             
-            base_margin_v = 65
-            line_height = 68 # Balanced spacing (65 Font + 2 Outline + 1px Overlap)
+            margins = RUVBOX_MARGINS if len(text_lines) <= len(RUVBOX_MARGINS) else _ruvbox_margins(len(text_lines))
             
             # Check for Top positioning override
-            raw_lines = lines[2:]
+            raw_lines = text_lines
             is_top = False
             if raw_lines and raw_lines[0].startswith("{\\an8}"):
                 is_top = True
                 raw_lines[0] = raw_lines[0].replace("{\\an8}", "")
             
+            # Constant per block; the per-line work only formats margin + text
+            prefix = f"Dialogue: 0,{start_ass},{end_ass_adjusted},{style_name},,0,0,"
             if is_top:
                 # Top Alignment: Render specific events Top-Down
                 # We interpret {\an8} as request for Top positioning.
                 # Since we are generating separate events, we must tag EACH event with {\an8}
                 # and calculate margin from TOP (which \an8 implies for MarginV).
-                for i, line in enumerate(raw_lines):
-                    margin_v = base_margin_v + (i * line_height)
-                    clean_line = f"\\h\\h{line.strip()}\\h\\h"
-                    # We must prepend {\an8} to every line so it anchors to top
-                    events.append(f"Dialogue: 0,{start_ass},{end_ass_adjusted},{style_name},,0,0,{margin_v},,{{\\an8}}{clean_line}")
+                # We must prepend {\an8} to every line so it anchors to top
+                events.extend([
+                    "%s%d,,{\\an8}\\h\\h%s\\h\\h" % (prefix, margin, line.strip())
+                    for margin, line in zip(margins, raw_lines)
+                ])
             else:
                 # Bottom Alignment: Render Bottom-Up (Reversed)
                 # MarginV is from Bottom.
-                for i, line in enumerate(reversed(raw_lines)):
-                    margin_v = base_margin_v + (i * line_height)
-                    clean_line = f"\\h\\h{line.strip()}\\h\\h"
-                    events.append(f"Dialogue: 0,{start_ass},{end_ass_adjusted},{style_name},,0,0,{margin_v},,{clean_line}")
+                events.extend([
+                    "%s%d,,\\h\\h%s\\h\\h" % (prefix, margin, line.strip())
+                    for margin, line in zip(margins, reversed(raw_lines))
+                ])
         else:
             # Standard handling
-            text = "\\N".join(lines[2:])
-            events.append(f"Dialogue: 0,{start_ass},{end_ass},{style_name},,0,0,0,,{text}")
-        
-    with open(ass_path, 'w', encoding='utf-8') as f:
-        f.write(ASS_HEADER + "\n")
-        f.write("[Events]\n")
-        f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-        for event in events:
-            f.write(event + "\n")
+            text = "\\N".join(text_lines)
+            events.append(f"Dialogue: 0,{start_ass},{_ms_to_ass(end_ms)},{style_name},,0,0,0,,{text}")
+        
+    # Binary + large buffer: constant preamble pre-encoded, events body encoded once
+    with open(ass_path, 'wb', buffering=1 << 20) as f:
+        f.writelines((
+            ASS_PREAMBLE,
+            "\n".join(events).encode("utf-8"),
+            b"\n" if events else b"",
+        ))
             
     return ass_path
 
 # Alias for compatibility
 srt_to_ass = generate_ass_from_srt
 
+# RAM-backed scratch on Linux (/tmp is not always tmpfs); None = system temp dir
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+def _temp_artifact_path(stem, suffix):
+    """
+    Path for a throwaway per-burn file (ASS / overlay JSON) in RAM-backed
+    scratch where available (/dev/shm on Linux, else the system temp dir)
+    instead of the vault volume. A real path, not a memfd: ffmpeg (possibly
+    several for a split burn) and the renderer open it by name.
+    Callers unlink it once ffmpeg / the renderer has consumed it.
+    """
+    fd, path = tempfile.mkstemp(prefix=f"omega_{stem}_", suffix=suffix, dir=_SCRATCH_DIR)
+    os.close(fd)
+    return Path(path)
+
+def _remove_frames_dir(frames_dir):
+    """
+    Deletes a flat PNG frame directory: one unlink per scandir entry, no
+    per-file stat like shutil.rmtree. Falls back to rmtree if anything
+    unexpected (e.g. a subdirectory) is inside.
+    """
+    try:
+        with os.scandir(frames_dir) as it:
+            for entry in it:
+                os.unlink(entry.path)
+        os.rmdir(frames_dir)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.rmtree(frames_dir, ignore_errors=True)
+
+def _remove_frames_dir_async(frames_dir):
+    """
+    Frame cleanup off the critical path. The dir is first renamed to a unique
+    name, so a re-burn of the same stem can recreate temp_frames_{stem} while
+    the old frames are still being deleted.
+    """
+    frames_dir = str(frames_dir)
+    doomed = f"{frames_dir}.deleting-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    try:
+        os.rename(frames_dir, doomed)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        # Can't move it aside: delete in place before anyone reuses the name
+        logger.warning(f"Could not rename {frames_dir} for cleanup ({e}); deleting inline")
+        _remove_frames_dir(frames_dir)
+        return
+    threading.Thread(target=_remove_frames_dir, args=(doomed,), daemon=True).start()
+
+def _parallel_burn(video_path, ass_filter, encoder_args, output_file, stem, duration, segments):
+    """
+    Split-and-stitch burn: encodes `segments` time slices of the source at
+    once, then joins them with the concat demuxer (-c copy) and the
+    untouched source audio.
+
+    -copyts -start_at_zero keeps each slice on the source timeline, so the
+    one ASS file lines up without per-segment retiming; setpts then rebases
+    each slice to 0 for concat.
+    """
+    seg_len = duration / segments
+    work_dir = Path(tempfile.mkdtemp(prefix=f"omega_{stem}_segments_"))
+    seg_paths = [work_dir / f"seg_{i:03d}.mp4" for i in range(segments)]
+    done = []
+
+    def encode(i):
+        window = ["-ss", f"{i * seg_len:.3f}"]
+        if i < segments - 1:
+            window += ["-t", f"{seg_len:.3f}"]
+        cmd = [
+            config.FFMPEG_BIN, "-y", "-nostats", "-loglevel", "error",
+            *window, "-copyts", "-start_at_zero", "-i", str(video_path),
+            "-vf", f"{ass_filter},setpts=PTS-STARTPTS",
+            "-an", *encoder_args, str(seg_paths[i])
+        ]
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL, capture_output=True, close_fds=False)
+        done.append(i)
+        progress = min(99.0, len(done) / segments * 95)
+        omega_db.update(stem, progress=progress, status=f"Burning {int(progress)}%")
+
+    try:
+        logger.info(f"   ✂️ Split-and-stitch: {segments} segments of {seg_len:.0f}s")
+        with ThreadPoolExecutor(max_workers=segments) as pool:
+            list(pool.map(encode, range(segments)))
+
+        list_file = work_dir / "segments.txt"
+        list_file.write_text("".join(f"file '{p}'\n" for p in seg_paths))
+        cmd = [
+            config.FFMPEG_BIN, "-y", "-nostats", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_file),
+            "-i", str(video_path),
+            "-map", "0:v", "-map", "1:a?",
+            "-c", "copy", "-movflags", "+faststart",
+            str(output_file)
+        ]
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL, capture_output=True, close_fds=False)
+        return output_file
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Burn Failed: {e}")
+        if e.stderr:
+            logger.error(e.stderr.decode("utf-8", errors="replace"))
+        raise
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.mkv', '.m4v', '.mpg', '.mpeg', '.moc'})
+
+@functools.lru_cache(maxsize=1)
+def _vault_video_index(vault_dir, dir_mtime_ns):
+    """
+    {stem: Path} for videos in the vault, from one scandir.
+    Keyed on the directory's mtime, which changes on any add/remove/rename.
+    """
+    index = {}
+    with os.scandir(vault_dir) as it:
+        for entry in it:
+            stem, ext = os.path.splitext(entry.name)
+            if ext.lower() in VIDEO_EXTENSIONS and entry.is_file():
+                index.setdefault(stem, Path(entry.path))
+    return index
+
 def find_video_file(stem):
-    extensions = {'.mp4', '.mov', '.mkv', '.m4v', '.mpg', '.mpeg', '.moc'}
-    for ext in extensions:
-        path = config.VAULT_VIDEOS / f"{stem}{ext}"
-        if path.exists():
-            logger.info(f"✅ Found video: {path.name}")
-            return path
+    try:
+        vault_dir = str(config.VAULT_VIDEOS)
+        index = _vault_video_index(vault_dir, os.stat(vault_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+    path = index.get(stem)
+    if path:
+        logger.info(f"✅ Found video: {path.name}")
+        return path
             
     clean_stem = stem.replace("_RUVBOX", "").replace("_MODERN", "")
     if clean_stem != stem:
-        for ext in extensions:
-            path = config.VAULT_VIDEOS / f"{clean_stem}{ext}"
-            if path.exists():
-                logger.info(f"✅ Found video (Fuzzy): {path.name}")
-                return path
+        path = index.get(clean_stem)
+        if path:
+            logger.info(f"✅ Found video (Fuzzy): {path.name}")
+            return path
     return None
 
 def burn(srt_file: Path, forced_style=None):
@@ -481,7 +762,7 @@ def burn(srt_file: Path, forced_style=None):
     logger.info(f"🔥 Processing: {srt_file.name}")
     
     # Fetch job for style info and source video path
-    job = omega_db.get_job(stem) or {}
+    job = _get_job_cached(stem)
     meta = job.get("meta") or {}
     if isinstance(meta, str):
         try:
@@ -553,96 +834,49 @@ def burn(srt_file: Path, forced_style=None):
 
     if chosen_style == "RUV_BOX":
         logger.info("🎬 Burning RÚV Style (Direct ASS)...")
-        temp_ass = config.VIDEO_DIR / f"{stem}_temp.ass"
+        temp_ass = _temp_artifact_path(stem, "_temp.ass")
         srt_to_ass(srt_file, temp_ass, style_name="RuvBox")
         
-        ass_path_escaped = str(temp_ass).replace(":", "\\:")
+        ass_path_escaped = str(temp_ass).translate(_ASS_ESCAPE_TABLE)
         # Force CPU Encoding (libx264) for stability
         # Hardware encoding (h264_videotoolbox) caused corruption/playback issues.
         logger.info("   🐢 Using CPU Encoding (libx264) for maximum compatibility")
-        cmd = [
-            config.FFMPEG_BIN, "-y",
-            "-i", str(video_path),
-            "-vf", f"ass='{ass_path_escaped}'",
+        ass_filter = f"ass='{ass_path_escaped}'{_ASS_SHAPING_OPT}"
+        # No -tune: fastdecode drops CABAC/deblocking (bigger, softer masters) and
+        # zerolatency drops B-frames. "faster" already uses frame threads
+        # (sliced-threads=0) with rc-lookahead=20.
+        encoder_args = [
             "-c:v", "libx264", "-preset", "faster", "-crf", "20",
             "-profile:v", "high", "-pix_fmt", "yuv420p",
-            "-c:a", "copy", "-movflags", "+faststart",
-            str(output_file)
         ]
         
+        duration = 0
+        if config.PARALLEL_BURN_MIN_SECONDS > 0:
+            duration = _probe_duration(video_path, job.get("program_id"))
+        
         try:
-            # Use Popen for real-time progress parsing
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT, 
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # Get total duration for progress calculation
-            total_duration = 0
-            try:
-                # Try getting from DB first
-                if job.get("program_id"):
-                    prog = omega_db.get_program(job.get("program_id"))
-                    if prog:
-                        total_duration = float(prog.get("duration_seconds") or 0)
-                
-                # Fallback: estimate from video file if DB missing
-                if total_duration <= 0 and video_path.exists():
-                    # Quick ffprobe
-                    probe_cmd = [
-                        config.FFPROBE_BIN, 
-                        "-v", "error", 
-                        "-show_entries", "format=duration", 
-                        "-of", "default=noprint_wrappers=1:nokey=1", 
-                        str(video_path)
-                    ]
-                    total_duration = float(subprocess.check_output(probe_cmd).strip())
-            except Exception as e:
-                logger.warning(f"Could not determine duration for progress: {e}")
-                total_duration = 0
-
-            logger.info(f"   🐢 Encoding with progress tracking (Duration: {total_duration}s)...")
-            
-            # Progress loop
-            import re
-            time_pattern = re.compile(r"time=(\d{2}):(\d{2}):(\d{2}\.\d{2})")
-            last_progress_update = 0
-            
-            while True:
-                line = process.stdout.readline()
-                if not line and process.poll() is not None:
-                    break
-                
-                if line:
-                    # Parse time=00:00:00.00
-                    match = time_pattern.search(line)
-                    if match and total_duration > 0:
-                        h, m, s = match.groups()
-                        current_seconds = int(h) * 3600 + int(m) * 60 + float(s)
-                        progress = min(99.0, (current_seconds / total_duration) * 100)
-                        
-                        # Update DB every 2 seconds or 5% change to save DB writes
-                        now = time.time()
-                        if (now - last_progress_update > 2.0):
-                             omega_db.update_track(job.get("track_id"), progress=progress) 
-                             # Also update legacy job table for wider compatibility
-                             omega_db.update(stem, progress=progress, status=f"Burning {int(progress)}%")
-                             last_progress_update = now
-            
-            if process.returncode != 0:
-                raise subprocess.CalledProcessError(process.returncode, cmd)
-                
-            logger.info(f"✅ Burn Complete: {output_file.name}")
-            omega_db.update(stem, progress=100.0, status="Start Uploading")
+            if duration >= config.PARALLEL_BURN_MIN_SECONDS > 0:
+                segments = config.PARALLEL_BURN_SEGMENTS
+                # Segments share the encoder thread budget of one burn
+                threads = max(1, config.BURN_ENCODER_THREADS // segments) if config.BURN_ENCODER_THREADS > 0 else 0
+                if threads:
+                    encoder_args += ["-threads", str(threads)]
+                _parallel_burn(video_path, ass_filter, encoder_args, output_file, stem, duration, segments)
+            else:
+                cmd = [
+                    config.FFMPEG_BIN, "-y", *FFMPEG_PROGRESS_ARGS,
+                    "-i", str(video_path),
+                    "-vf", ass_filter,
+                    *encoder_args, *_x264_thread_args(),
+                    "-c:a", "copy", "-movflags", "+faststart",
+                    str(output_file)
+                ]
+                _run_ffmpeg_with_progress(cmd, stem, output_file, video_path, job=job, track_id=job.get("track_id"))
+        finally:
             temp_ass.unlink(missing_ok=True)
-            return output_file
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Burn Failed: {e}")
-            raise e
+        logger.info(f"✅ Burn Complete: {output_file.name}")
+        omega_db.update(stem, progress=100.0, status="Start Uploading")
+        return output_file
 
     else:
         # OMEGA MODERN (Overlay)
@@ -661,14 +895,15 @@ def burn(srt_file: Path, forced_style=None):
         temp_frames_dir = config.VIDEO_DIR / f"temp_frames_{safe_stem}"
         
         # Cleanup old
-        if temp_frames_dir.exists(): shutil.rmtree(temp_frames_dir)
+        if temp_frames_dir.exists(): _remove_frames_dir(temp_frames_dir)
         
         overlay_path = render_overlay(str(video_path), str(normalized_json), str(config.VIDEO_DIR / f"{stem}_overlay.mov"), "AppleTV_IS", stem=stem, skip_encoding=True)
         
         # Move to safe path if needed (render_overlay returns path)
         if overlay_path != temp_frames_dir:
-             if temp_frames_dir.exists(): shutil.rmtree(temp_frames_dir)
-             shutil.move(str(overlay_path), str(temp_frames_dir))
+             if temp_frames_dir.exists(): _remove_frames_dir(temp_frames_dir)
+             # Both live under config.VIDEO_DIR: a single rename, no per-file copy
+             os.rename(str(overlay_path), str(temp_frames_dir))
              overlay_path = temp_frames_dir
 
         # 3. Composite
@@ -676,12 +911,12 @@ def burn(srt_file: Path, forced_style=None):
             burn_in_composite(str(video_path), overlay_path, str(output_file), stem=stem)
             
             # Cleanup
-            if overlay_path.is_dir(): shutil.rmtree(overlay_path)
+            if overlay_path.is_dir(): _remove_frames_dir_async(overlay_path)
             if normalized_json.exists(): normalized_json.unlink()
             
             logger.info(f"✅ Burn Complete: {output_file.name}")
             return output_file
             
         except Exception as e:
-            if overlay_path.is_dir(): shutil.rmtree(overlay_path)
+            if overlay_path.is_dir(): _remove_frames_dir_async(overlay_path)
             raise e
@@ -17,9 +17,11 @@ Usage:
 
 import os
 import time
+import hashlib
 import subprocess
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -35,6 +37,11 @@ BUNNY_API_KEY = os.environ.get("BUNNY_API_KEY", "")
 BUNNY_CDN_HOSTNAME = os.environ.get("BUNNY_CDN_HOSTNAME", "vz-5303b4c4-db0.b-cdn.net")
 BUNNY_API_BASE = "https://video.bunnycdn.com/library"
 
+# One keep-alive connection pool for create / upload / poll
+_session = requests.Session()
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB reads for the proxy upload
+
 # Proxy settings
 PROXY_DIR = config.BASE_DIR / "4_DELIVERY" / "PROXY"
 PROXY_RESOLUTION = "854:480"
@@ -60,13 +67,29 @@ def generate_proxy(source_video: Path, job_id: str) -> Path:
     """
     ensure_proxy_dir()
     output_path = PROXY_DIR / f"{job_id}_proxy.mp4"
+    key_path = PROXY_DIR / f"{job_id}_proxy.mp4.key"
     
-    # Skip if already exists and is recent
+    # Skip if the proxy was made from this exact source (path + mtime + size)
+    src_stat = source_video.stat()
+    source_key = hashlib.sha1(
+        f"{source_video}:{src_stat.st_mtime_ns}:{src_stat.st_size}".encode()
+    ).hexdigest()
     if output_path.exists():
-        age_hours = (time.time() - output_path.stat().st_mtime) / 3600
-        if age_hours < 24:
-            logger.info(f"   ♻️ Using existing proxy: {output_path.name}")
-            return output_path
+        try:
+            cached_key = key_path.read_text().strip()
+        except FileNotFoundError:
+            # Proxy from before keys were written: fall back to skipping if recent
+            age_hours = (time.time() - output_path.stat().st_mtime) / 3600
+            if age_hours < 24:
+                logger.info(f"   ♻️ Using existing proxy: {output_path.name}")
+                return output_path
+        except OSError:
+            pass
+        else:
+            # A key that doesn't match means the source changed: always re-encode
+            if cached_key == source_key:
+                logger.info(f"   ♻️ Using cached proxy (source unchanged): {output_path.name}")
+                return output_path
     
     logger.info(f"   🎬 Generating 480p proxy for: {job_id}")
     
@@ -75,7 +98,9 @@ def generate_proxy(source_video: Path, job_id: str) -> Path:
         "-i", str(source_video),
         "-vf", f"scale={PROXY_RESOLUTION}:force_original_aspect_ratio=decrease,pad={PROXY_RESOLUTION}:(ow-iw)/2:(oh-ih)/2",
         "-c:v", "libx264",
-        "-preset", "fast",
+        # Review-only 480p at CRF 28: "faster" is past the speed/quality knee,
+        # the quality loss vs "fast" is invisible at this size.
+        "-preset", "faster",
         "-crf", PROXY_CRF,
         "-profile:v", "main",
         "-level", "3.1",
@@ -88,6 +113,7 @@ def generate_proxy(source_video: Path, job_id: str) -> Path:
     
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        key_path.write_text(source_key)
         logger.info(f"   ✅ Proxy generated: {output_path.name} ({output_path.stat().st_size / 1024 / 1024:.1f} MB)")
         return output_path
     except subprocess.CalledProcessError as e:
@@ -112,7 +138,7 @@ def create_bunny_video(title: str) -> Tuple[str, str]:
     }
     payload = {"title": title}
     
-    response = requests.post(url, json=payload, headers=headers)
+    response = _session.post(url, json=payload, headers=headers)
     response.raise_for_status()
     
     data = response.json()
@@ -122,6 +148,31 @@ def create_bunny_video(title: str) -> Tuple[str, str]:
     return video_id
 
 
+def delete_bunny_video(video_id: str) -> None:
+    """Delete a video entry from Bunny Stream."""
+    url = f"{BUNNY_API_BASE}/{BUNNY_LIBRARY_ID}/videos/{video_id}"
+    response = _session.delete(url, headers={"AccessKey": BUNNY_API_KEY})
+    response.raise_for_status()
+    logger.info(f"   🗑️ Deleted Bunny video entry: {video_id}")
+
+
+def _discard_bunny_video(video_id_future) -> None:
+    """Best-effort delete of an entry created for a send that failed before upload."""
+    try:
+        delete_bunny_video(video_id_future.result())
+    except Exception as e:
+        logger.warning(f"   ⚠️ Could not remove unused Bunny video entry: {e}")
+
+
+def _iter_file_chunks(f, size=UPLOAD_CHUNK_SIZE):
+    """Yields the file in large blocks (http.client would send it 8 KiB at a time)."""
+    while True:
+        chunk = f.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
 def upload_to_bunny(video_path: Path, video_id: str) -> bool:
     """
     Upload video file to Bunny Stream.
@@ -142,8 +193,10 @@ def upload_to_bunny(video_path: Path, video_id: str) -> bool:
     file_size = video_path.stat().st_size
     logger.info(f"   📤 Uploading to Bunny: {file_size / 1024 / 1024:.1f} MB")
     
+    # Explicit length keeps it a single plain PUT (no chunked encoding)
+    headers["Content-Length"] = str(file_size)
     with open(video_path, "rb") as f:
-        response = requests.put(url, data=f, headers=headers)
+        response = _session.put(url, data=_iter_file_chunks(f), headers=headers)
     
     response.raise_for_status()
     logger.info(f"   ✅ Upload complete")
@@ -165,8 +218,9 @@ def wait_for_encoding(video_id: str, timeout: int = 300) -> bool:
     headers = {"AccessKey": BUNNY_API_KEY}
     
     start_time = time.time()
+    delay = 1
     while time.time() - start_time < timeout:
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers)
         response.raise_for_status()
         
         data = response.json()
@@ -181,11 +235,16 @@ def wait_for_encoding(video_id: str, timeout: int = 300) -> bool:
             return False
         
         logger.debug(f"   ⏳ Encoding status: {status}")
-        time.sleep(5)
+        # Back off 1, 2, 4 ... 30s: short proxies finish fast, long ones don't need 5s polls
+        time.sleep(min(delay, max(0, timeout - (time.time() - start_time))))
+        delay = min(delay * 2, 30)
     
     logger.warning(f"   ⚠️ Encoding timeout after {timeout}s")
     return False
 
+# send_for_remote_review's wait_for_encoding flag shadows the function name
+_wait_for_bunny_encoding = wait_for_encoding
+
 
 def get_embed_url(video_id: str) -> str:
     """Get the embed URL for a Bunny video."""
@@ -253,23 +312,30 @@ def send_for_remote_review(
             "remote_review_started": time.strftime("%Y-%m-%dT%H:%M:%SZ")
         })
         
-        # Generate proxy
-        proxy_path = generate_proxy(source_video, job_id)
-        
-        # Update status
-        omega_db.update(job_id, meta={"remote_review_status": "uploading"})
-        
-        # Create Bunny video entry
+        # Create the Bunny video entry (HTTP) while the proxy encodes (ffmpeg)
         program_name = meta.get("original_filename", job_id)
-        video_id = create_bunny_video(f"Review: {program_name}")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            video_id_future = pool.submit(create_bunny_video, f"Review: {program_name}")
+            try:
+                proxy_path = generate_proxy(source_video, job_id)
+            except Exception:
+                # Don't leave an empty entry in the library
+                _discard_bunny_video(video_id_future)
+                raise
+            video_id = video_id_future.result()
+        
+        # Update status (one write covers the upload and the optional encoding wait)
+        omega_db.update(job_id, meta={
+            "remote_review_status": "uploading",
+            "bunny_video_id": video_id,
+        })
         
         # Upload to Bunny
         upload_to_bunny(proxy_path, video_id)
         
         # Optionally wait for encoding
         if wait_for_encoding:
-            omega_db.update(job_id, meta={"remote_review_status": "encoding"})
-            if not wait_for_encoding(video_id):
+            if not _wait_for_bunny_encoding(video_id):
                 logger.warning("   ⚠️ Encoding not complete, link may show processing state")
         
         # Get embed URL
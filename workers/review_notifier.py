@@ -5,6 +5,8 @@ Sends magic link emails to reviewers when translations are ready.
 """
 
 import hashlib
+import hmac
+import functools
 import time
 import os
 import logging
@@ -18,6 +20,7 @@ REVIEW_PORTAL_URL = os.environ.get(
     "https://omega-review-283123700702.us-central1.run.app"
 )
 SECRET_KEY = os.environ.get("OMEGA_REVIEW_SECRET", "omega-review-secret-2024")
+_SECRET_BYTES = SECRET_KEY.encode()
 TOKEN_EXPIRY_HOURS = 72
 
 
@@ -28,10 +31,15 @@ def generate_review_token(job_id: str, expiry_hours: int = TOKEN_EXPIRY_HOURS) -
     Returns:
         Tuple of (token, expiry_timestamp)
     """
-    expiry_ts = int(time.time()) + (expiry_hours * 3600)
-    payload = f"{job_id}:{expiry_ts}:{SECRET_KEY}"
-    token = hashlib.sha256(payload.encode()).hexdigest()[:32]
-    return token, expiry_ts
+    # Expiry rounded up to the minute, so repeat calls for a job reuse the cached token
+    expiry_ts = -(-int(time.time()) // 60) * 60 + (expiry_hours * 3600)
+    return _token(job_id, expiry_ts), expiry_ts
+
+
+@functools.lru_cache(maxsize=4096)
+def _token(job_id: str, expiry_ts: int) -> str:
+    payload = f"{job_id}:{expiry_ts}".encode()
+    return hmac.new(_SECRET_BYTES, payload, hashlib.sha256).hexdigest()[:32]
 
 
 def build_review_url(job_id: str, expiry_hours: int = TOKEN_EXPIRY_HOURS) -> str:
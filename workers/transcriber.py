@@ -1,20 +1,63 @@
 import os
 import re
+import bisect
 import shutil
 import subprocess
 import json
 import logging
 import time
-import select
+import wave
+import tempfile
+import atexit
+import threading
+import queue
 from collections import deque
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 import config
 import omega_db
 
+try:
+    import orjson  # optional: native JSON for multi-MB WhisperX output
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # optional: vectorized interval merge for long segment lists
+except ImportError:
+    np = None
+
 logger = logging.getLogger("OmegaManager.Transcriber")
 
-SAFETY_MARKERS = {"(music)", "[music]", "(song)", "[song]", "(singing)", "[singing]", "(choir)", "[choir]", "♪"}
+# WhisperX --print_progress lines, matched on raw bytes. Most output lines
+# contain neither marker, so callers check the gates with `in` before
+# searching and only decode the lines they keep.
+PROGRESS_RE = re.compile(rb"Progress:\s*([0-9]+(?:\.[0-9]+)?)%")
+TRANSCRIPT_RE = re.compile(rb"Transcript:\s*\[(\d+(?:\.\d+)?)\s*-->\s*(\d+(?:\.\d+)?)\]")
+PROGRESS_GATE = b"Progress:"
+TRANSCRIPT_GATE = b"-->"
+ALIGN_PHASE = b"Performing alignment"
+ASR_PHASE = b"Performing transcription"
+
+PIPE_READ_SIZE = 65536
+# Job progress writes: at least this many points of overall progress, or
+# this many seconds since the last write.
+MIN_PROGRESS_DELTA = 1.0
+MIN_PROGRESS_INTERVAL = 5.0
+WHISPER_DAEMON_DONE = b"OMEGA_WHISPERX_DONE"
+_LINE_SPLIT_RE = re.compile(rb"[\r\n]")
+
+# RAM-backed scratch on Linux (/tmp is not always tmpfs); None = system temp dir
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Safety-pass segments that are only a music cue: a whole-text "(music)" /
+# "[choir]"-style tag, or anything containing a note symbol.
+MUSIC_MARKER_RE = re.compile(
+    r"\A\s*(?:\((?:music|song|singing|choir)\)|\[(?:music|song|singing|choir)\])\s*\Z|♪",
+    re.IGNORECASE,
+)
 
 def _safe_float_env(name: str, default: float) -> float:
     try:
@@ -28,19 +71,47 @@ def _safe_int_env(name: str, default: int) -> int:
     except Exception:
         return default
 
+def _read_json(path: Path):
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN, which stdlib json accepts
+    return json.loads(raw)
+
+def _write_json(path: Path, payload) -> None:
+    """Pretty-printed UTF-8 JSON (skeletons are hand-inspected)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+
 def _is_music_marker_text(text: str) -> bool:
-    if not text:
-        return False
-    lowered = text.strip().lower()
-    if lowered in SAFETY_MARKERS:
-        return True
-    if "♪" in text:
-        return True
-    return False
+    return bool(text) and MUSIC_MARKER_RE.search(text) is not None
+
+MS = 1000
+
+# Below this many intervals the plain loop is faster than building arrays.
+NUMPY_MERGE_MIN = 64
+
+def _merge_intervals_np(intervals):
+    arr = np.asarray(intervals, dtype=np.float64)
+    order = np.argsort(arr[:, 0], kind="stable")
+    starts, ends = arr[order, 0], arr[order, 1]
+    # A new group starts wherever a start lies beyond every earlier end
+    new_group = np.empty(len(starts), dtype=bool)
+    new_group[0] = True
+    np.greater(starts[1:], np.maximum.accumulate(ends)[:-1], out=new_group[1:])
+    group_idx = np.flatnonzero(new_group)
+    return np.column_stack((starts[group_idx], np.maximum.reduceat(ends, group_idx))).tolist()
 
 def _merge_intervals(intervals):
     if not intervals:
         return []
+    if np is not None and len(intervals) >= NUMPY_MERGE_MIN:
+        return _merge_intervals_np(intervals)
     intervals.sort(key=lambda x: x[0])
     merged = [list(intervals[0])]
     for start, end in intervals[1:]:
@@ -51,11 +122,12 @@ def _merge_intervals(intervals):
             merged.append([start, end])
     return merged
 
-def _coverage_within(segments, window_seconds):
+def _coverage_within(pairs, window_seconds):
+    """pairs: (start, end) floats. Returns (covered seconds, merged intervals) inside the window."""
     intervals = []
-    for seg in segments:
-        start = max(0.0, float(seg.get("start", 0.0)))
-        end = min(float(seg.get("end", 0.0)), window_seconds)
+    for start, end in pairs:
+        start = max(0.0, start)
+        end = min(end, window_seconds)
         if end <= 0 or start >= window_seconds:
             continue
         if end <= start:
@@ -65,7 +137,25 @@ def _coverage_within(segments, window_seconds):
     total = sum(end - start for start, end in merged)
     return total, merged
 
-def _should_run_safety_pass(segments, window_seconds, *, force: bool, gap_threshold: float, coverage_threshold: float, first_gap_threshold: float) -> tuple[bool, dict]:
+def _normalized_segments(raw_segments):
+    """
+    WhisperX segments as {"id", "start", "end", "text"} dicts with float times
+    and stripped text, sorted by (start, end). Ids are assigned by the caller
+    once the final list is known.
+    """
+    segments = [
+        {
+            "id": 0,
+            "start": float(seg.get("start") or 0.0),
+            "end": float(seg.get("end") or 0.0),
+            "text": str(seg.get("text") or "").strip(),
+        }
+        for seg in raw_segments
+    ]
+    segments.sort(key=itemgetter("start", "end"))
+    return segments
+
+def _should_run_safety_pass(segments, window_seconds, *, force: bool, gap_threshold: float, coverage_threshold: float, first_gap_threshold: float, pre_sorted: bool = False) -> tuple[bool, dict]:
     stats = {
         "window_seconds": window_seconds,
         "first_start": None,
@@ -76,22 +166,23 @@ def _should_run_safety_pass(segments, window_seconds, *, force: bool, gap_thresh
         return True, stats
     if not segments:
         return True, stats
-    window = [seg for seg in segments if float(seg.get("start", 0.0)) < window_seconds]
+    # (start, end) floats, coerced once and shared by the gap and coverage checks
+    pairs = [(float(seg.get("start", 0.0)), float(seg.get("end", 0.0))) for seg in segments]
+    window = [pair for pair in pairs if pair[0] < window_seconds]
     if not window:
         return True, stats
-    window.sort(key=lambda s: float(s.get("start", 0.0)))
-    first_start = float(window[0].get("start", 0.0))
+    if not pre_sorted:
+        window.sort(key=itemgetter(0))
+    first_start, prev_end = window[0]
     stats["first_start"] = first_start
     if first_start >= first_gap_threshold:
         return True, stats
     max_gap = max(0.0, first_start)
-    prev_end = float(window[0].get("end", 0.0))
-    for seg in window[1:]:
-        start = float(seg.get("start", 0.0))
+    for start, end in window[1:]:
         gap = start - prev_end
         if gap > max_gap:
             max_gap = gap
-        prev_end = max(prev_end, float(seg.get("end", 0.0)))
+        prev_end = max(prev_end, end)
     stats["max_gap"] = max_gap
     covered, _ = _coverage_within(window, window_seconds)
     coverage = covered / window_seconds if window_seconds > 0 else 1.0
@@ -102,10 +193,34 @@ def _should_run_safety_pass(segments, window_seconds, *, force: bool, gap_thresh
         return True, stats
     return False, stats
 
-def _merge_safety_segments(primary, safety, window_seconds, *, overlap_pad: float = 0.25):
+def _to_ms(seconds: float) -> int:
+    return int(round(seconds * MS))
+
+def _merge_safety_segments(primary, safety, window_seconds, *, overlap_pad: float = 0.25, pre_sorted: bool = False):
+    """
+    Adds safety-pass segments that no primary segment overlaps. Returns
+    (segments sorted by start/end, number added); ids are left to the caller.
+    pre_sorted: both lists come from _normalized_segments().
+    """
     if not safety:
         return primary, 0
-    primary_sorted = sorted(primary, key=lambda s: (float(s.get("start", 0.0)), float(s.get("end", 0.0))))
+    if pre_sorted:
+        primary_sorted = primary
+    else:
+        primary_sorted = sorted(primary, key=lambda s: (float(s.get("start", 0.0)), float(s.get("end", 0.0))))
+    # Primaries starting inside the window, as integer ms; prefix max of their
+    # ends lets one bisect answer "does any earlier-starting primary reach
+    # this segment?"
+    pad_ms = _to_ms(overlap_pad)
+    prim_starts = []
+    prim_max_end = []
+    for p in primary_sorted:
+        p_start = float(p.get("start", 0.0))
+        if p_start > window_seconds:
+            break
+        p_end_ms = _to_ms(float(p.get("end", 0.0)))
+        prim_starts.append(_to_ms(p_start))
+        prim_max_end.append(max(prim_max_end[-1], p_end_ms) if prim_max_end else p_end_ms)
     added = []
     for seg in safety:
         start = float(seg.get("start", 0.0))
@@ -119,26 +234,47 @@ def _merge_safety_segments(primary, safety, window_seconds, *, overlap_pad: floa
             continue
         if _is_music_marker_text(text):
             continue
-        overlaps = False
-        for p in primary_sorted:
-            p_start = float(p.get("start", 0.0))
-            if p_start > window_seconds:
-                break
-            p_end = float(p.get("end", 0.0))
-            if start <= p_end + overlap_pad and end >= p_start - overlap_pad:
-                overlaps = True
-                break
+        # Overlap: some primary with p_start <= end + pad and p_end >= start - pad
+        hi = bisect.bisect_right(prim_starts, _to_ms(end) + pad_ms)
+        overlaps = hi > 0 and _to_ms(start) <= prim_max_end[hi - 1] + pad_ms
         if not overlaps:
             added.append({"start": start, "end": end, "text": text})
     if not added:
         return primary, 0
     combined = primary_sorted + added
-    combined.sort(key=lambda s: (float(s.get("start", 0.0)), float(s.get("end", 0.0))))
-    for idx, seg in enumerate(combined, start=1):
-        seg["id"] = idx
+    if pre_sorted:
+        combined.sort(key=itemgetter("start", "end"))  # two sorted runs
+    else:
+        combined.sort(key=lambda s: (float(s.get("start", 0.0)), float(s.get("end", 0.0))))
     return combined, len(added)
 
+def _copy_wav_head(src: Path, dst: Path, seconds: float) -> bool:
+    """
+    Writes the first `seconds` of src to dst without ffmpeg, if src is already
+    the 16 kHz mono s16le WAV that ingest() extracts (a pure sample copy).
+    Returns False (dst untouched) for any other format.
+    """
+    try:
+        with wave.open(str(src), "rb") as wf:
+            params = wf.getparams()
+            if (params.nchannels, params.sampwidth, params.framerate, params.comptype) != (1, 2, 16000, "NONE"):
+                return False
+            frames = wf.readframes(int(seconds * params.framerate))
+    except (wave.Error, EOFError, OSError):
+        return False
+    with wave.open(str(dst), "wb") as out:
+        out.setparams(params)
+        out.writeframes(frames)
+    return True
+
 def get_audio_duration(audio_path: Path) -> float:
+    # PCM WAV (what ingest() extracts): the header has the answer, no ffprobe needed
+    try:
+        with wave.open(str(audio_path), "rb") as wf:
+            if wf.getcomptype() == "NONE" and wf.getframerate() > 0:
+                return wf.getnframes() / float(wf.getframerate())
+    except (wave.Error, EOFError, OSError):
+        pass
     cmd = [
         str(config.FFPROBE_BIN),
         "-v", "error",
@@ -147,13 +283,31 @@ def get_audio_duration(audio_path: Path) -> float:
         str(audio_path),
     ]
     try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, stdin=subprocess.DEVNULL)
+        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, stdin=subprocess.DEVNULL)
         value = (result.stdout or "").strip()
         return float(value)
     except Exception as exc:
         logger.warning("Could not read audio duration for %s: %s", audio_path.name, exc)
         return 0.0
 
+_AUDIO_DIR = config.VAULT_DIR / "Audio"
+_THUMBNAIL_DIR = config.VAULT_DIR / "Thumbnails"
+_PROXIES_DIR = config.VAULT_DIR / "Proxies"
+_ingest_dirs_ready = False
+
+def _ensure_ingest_dirs():
+    """
+    Creates the Vault output dirs on the first ingest of the process, not on
+    every call. Lazy rather than at import so a Vault drive mounted after
+    startup still works.
+    """
+    global _ingest_dirs_ready
+    if _ingest_dirs_ready:
+        return
+    for d in (_AUDIO_DIR, _THUMBNAIL_DIR, _PROXIES_DIR):
+        d.mkdir(parents=True, exist_ok=True)
+    _ingest_dirs_ready = True
+
 def ingest(file_path: Path):
     """
     Moves video to Vault, extracts audio, and generates thumbnail.
@@ -164,16 +318,26 @@ def ingest(file_path: Path):
     # 1. Move to Vault
     vault_video_path = config.VAULT_VIDEOS / file_path.name
     
-    if file_path.resolve() != vault_video_path.resolve():
-        if vault_video_path.exists():
-            os.remove(vault_video_path)
-        shutil.move(str(file_path), str(vault_video_path))
+    try:
+        already_in_vault = os.path.samefile(file_path, vault_video_path)
+    except OSError:
+        already_in_vault = False  # vault copy missing (or source gone)
+
+    if not already_in_vault:
+        try:
+            # Atomic rename (replacing any stale copy) when Vault is on the same filesystem
+            os.replace(file_path, vault_video_path)
+        except OSError:
+            # Cross-device: fall back to copy + unlink
+            if vault_video_path.exists():
+                os.remove(vault_video_path)
+            shutil.move(str(file_path), str(vault_video_path))
         logger.info(f"📦 Moved to Vault: {vault_video_path.name}")
     
+    _ensure_ingest_dirs()
+
     # 2. Extract Audio
-    audio_dir = config.VAULT_DIR / "Audio"
-    audio_dir.mkdir(exist_ok=True)
-    audio_path = audio_dir / f"{stem}.wav"
+    audio_path = _AUDIO_DIR / f"{stem}.wav"
 
     if not audio_path.exists():
         logger.info(f"🔊 Extracting Audio: {audio_path.name}")
@@ -183,21 +347,17 @@ def ingest(file_path: Path):
             "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
             str(audio_path)
         ]
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
     
     # 3. Generate Thumbnail (for Library view)
-    thumbnail_dir = config.VAULT_DIR / "Thumbnails"
-    thumbnail_dir.mkdir(exist_ok=True)
-    thumbnail_path = thumbnail_dir / f"{stem}.jpg"
+    thumbnail_path = _THUMBNAIL_DIR / f"{stem}.jpg"
     
     if not thumbnail_path.exists():
         logger.info(f"🖼️ Generating Thumbnail: {thumbnail_path.name}")
         thumbnail_path = generate_thumbnail(vault_video_path, thumbnail_path)
 
     # 4. Generate Proxy (for Dashboard Playback)
-    proxies_dir = config.VAULT_DIR / "Proxies"
-    proxies_dir.mkdir(exist_ok=True)
-    proxy_path = proxies_dir / f"{stem}_PROXY.mp4"
+    proxy_path = _PROXIES_DIR / f"{stem}_PROXY.mp4"
     
     if not proxy_path.exists():
         logger.info(f"🎞️ Generating Proxy: {proxy_path.name}")
@@ -222,14 +382,14 @@ def generate_thumbnail(video_path: Path, output_path: Path, seek_seconds: float
             "-q:v", "2",
             str(output_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, timeout=30, stdin=subprocess.DEVNULL)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30, stdin=subprocess.DEVNULL)
         
         if output_path.exists() and output_path.stat().st_size > 0:
             return output_path
         
         # Fallback: try at 1 second
         cmd[3] = "1"
-        subprocess.run(cmd, capture_output=True, timeout=30, stdin=subprocess.DEVNULL)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30, stdin=subprocess.DEVNULL)
         
         if output_path.exists() and output_path.stat().st_size > 0:
             return output_path
@@ -254,7 +414,7 @@ def generate_proxy(video_path: Path, output_path: Path) -> Path:
             str(output_path)
         ]
         # Run asynchronously or block? Ingest is already async task, so blocking is fine.
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
         
         if output_path.exists() and output_path.stat().st_size > 0:
             return output_path
@@ -289,8 +449,10 @@ def transcribe(audio_path: Path, job_id: str = None):
                 vocals_path = extract_vocals(
                     audio_path,
                     output_dir=audio_path.parent,
-                    model=getattr(config, "OMEGA_DEMUCS_MODEL", "htdemucs_ft"),
+                    model=getattr(config, "OMEGA_DEMUCS_MODEL", "htdemucs"),
                     device=getattr(config, "OMEGA_DEMUCS_DEVICE", "mps"),
+                    fp16=getattr(config, "OMEGA_DEMUCS_FP16", False),
+                    for_transcription=True,
                 )
                 
                 if vocals_path and vocals_path.exists():
@@ -324,6 +486,208 @@ def transcribe(audio_path: Path, job_id: str = None):
     return _transcribe_whisperx(transcription_audio, job_id=job_id)
 
 
+def _start_pipe_reader(pipe):
+    """
+    Drains a binary pipe on a daemon thread into a queue of raw chunks (b""
+    marks EOF), so the child never blocks on a full pipe while we are busy
+    updating the DB. The thread closes the pipe at EOF; nobody else should,
+    or it could end up reading a reused fd. Returns (queue, thread).
+    """
+    chunks = queue.SimpleQueue()
+    fd = pipe.fileno()
+
+    def drain():
+        try:
+            while True:
+                chunk = os.read(fd, PIPE_READ_SIZE)
+                chunks.put(chunk)
+                if not chunk:
+                    return
+        except OSError:
+            chunks.put(b"")
+        finally:
+            pipe.close()
+
+    reader = threading.Thread(target=drain, name="whisperx-output", daemon=True)
+    reader.start()
+    return chunks, reader
+
+def _iter_output_lines(chunks, idle_timeout):
+    """
+    Yields non-empty raw (bytes) lines from a _start_pipe_reader() queue until
+    EOF. Splits lines ourselves ('\\r' too: tqdm bars) rather than one
+    readline() per line. Raises TimeoutError if nothing arrives for
+    idle_timeout seconds; the caller owns the process.
+    """
+    pending = b""
+    last_output = time.time()
+    eof = False
+    while not eof:
+        try:
+            chunk = chunks.get(timeout=1.0)
+        except queue.Empty:
+            idle = time.time() - last_output
+            if idle_timeout and idle > idle_timeout:
+                raise TimeoutError(f"no output for {idle:.0f} seconds")
+            continue
+
+        if chunk:
+            lines = _LINE_SPLIT_RE.split(pending + chunk)
+            pending = lines.pop()
+        else:
+            eof = True
+            lines = [pending]
+
+        if any(lines):
+            last_output = time.time()
+        for raw_line in lines:
+            if raw_line:
+                yield raw_line
+
+def _decode_tail(raw_lines) -> str:
+    """Decodes the kept output tail (bytes lines) for an error message."""
+    return "\n".join(
+        line.decode("utf-8", errors="replace").strip() for line in raw_lines or ()
+    )
+
+def _line_event(raw_line: bytes):
+    """
+    Classifies one WhisperX output line as ("phase", "asr"|"align"),
+    ("progress", pct) or ("transcript", segment_end); None for everything else.
+    """
+    if ALIGN_PHASE in raw_line:
+        return ("phase", "align")
+    if ASR_PHASE in raw_line:
+        return ("phase", "asr")
+    if PROGRESS_GATE in raw_line:
+        match = PROGRESS_RE.search(raw_line)
+        if match:
+            return ("progress", float(match.group(1)))
+    elif TRANSCRIPT_GATE in raw_line:
+        match = TRANSCRIPT_RE.search(raw_line)
+        if match:
+            return ("transcript", float(match.group(2)))
+    return None
+
+def _iter_events(raw_lines, last_lines):
+    """Yields _line_event() tuples, keeping every raw line in last_lines."""
+    for raw_line in raw_lines:
+        last_lines.append(raw_line)
+        event = _line_event(raw_line)
+        if event:
+            yield event
+
+@contextmanager
+def _managed_whisperx(cmd, idle_timeout, last_lines):
+    """
+    Runs the WhisperX CLI and yields its output as _line_event() tuples.
+    On exit the process is reaped and its pipe drained no matter what, so a
+    failure or stall never leaves a model-holding child behind. Raises
+    RuntimeError on a stall or non-zero exit.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+    )
+    reader = None
+    try:
+        if not proc.stdout:
+            raise RuntimeError("WhisperX did not return a stdout pipe")
+        chunks, reader = _start_pipe_reader(proc.stdout)
+        try:
+            yield _iter_events(_iter_output_lines(chunks, idle_timeout), last_lines)
+        except TimeoutError as stall:
+            logger.error("WhisperX stalled: %s", stall)
+            raise RuntimeError(f"WhisperX stalled (idle > {idle_timeout:.0f}s)")
+        proc.wait()
+        if proc.returncode != 0:
+            tail = _decode_tail(last_lines)
+            raise RuntimeError(f"WhisperX failed (code {proc.returncode}). Last output:\n{tail}")
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        if reader:
+            reader.join(timeout=5)  # it closes the pipe once the child is gone
+
+# --- Persistent WhisperX worker (scripts/whisperx_daemon.py) ---
+# One process per manager, models stay loaded; requests are serialized.
+_daemon_proc = None
+_daemon_output = None  # _start_pipe_reader() queue for _daemon_proc.stdout
+_daemon_lock = threading.Lock()
+
+def _stop_whisperx_daemon():
+    global _daemon_proc, _daemon_output
+    proc, _daemon_proc, _daemon_output = _daemon_proc, None, None
+    if proc is None or proc.poll() is not None:
+        return
+    try:
+        proc.terminate()
+        proc.wait(timeout=10)
+    except Exception:
+        proc.kill()
+
+atexit.register(_stop_whisperx_daemon)
+
+def _whisperx_daemon():
+    global _daemon_proc, _daemon_output
+    if _daemon_proc is None or _daemon_proc.poll() is not None:
+        logger.info("Starting persistent WhisperX worker...")
+        _daemon_proc = subprocess.Popen(
+            [str(config.WHISPER_DAEMON_BIN)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+        _daemon_output, _ = _start_pipe_reader(_daemon_proc.stdout)
+    return _daemon_proc, _daemon_output
+
+def _run_whisperx_daemon(request: dict, idle_timeout, on_event=None, last_lines=None) -> dict:
+    """
+    Runs one transcription on the persistent worker. Output lines are kept in
+    last_lines and their _line_event() tuples go to on_event(kind, value)
+    until the worker's done marker; returns its reply ({"json": path}, or
+    {"segments": [...]} for a "return_segments" request).
+    A stalled or dead worker is killed and respawned on the next request.
+    """
+    with _daemon_lock:
+        proc, output = _whisperx_daemon()
+        reply = None
+        try:
+            proc.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            proc.stdin.flush()
+            for raw_line in _iter_output_lines(output, idle_timeout):
+                if raw_line.startswith(WHISPER_DAEMON_DONE):
+                    reply = json.loads(raw_line[len(WHISPER_DAEMON_DONE):])
+                    break
+                if last_lines is not None:
+                    last_lines.append(raw_line)
+                if on_event:
+                    event = _line_event(raw_line)
+                    if event:
+                        on_event(*event)
+        except TimeoutError as stall:
+            logger.error("WhisperX worker stalled: %s", stall)
+            _stop_whisperx_daemon()
+            raise RuntimeError(f"WhisperX stalled (idle > {idle_timeout:.0f}s)")
+        except (BrokenPipeError, OSError):
+            _stop_whisperx_daemon()
+            raise
+        if reply is None:
+            _stop_whisperx_daemon()
+            tail = _decode_tail(last_lines)
+            raise RuntimeError(f"WhisperX worker exited. Last output:\n{tail}")
+    if not reply.get("ok"):
+        raise RuntimeError(f"WhisperX failed: {reply.get('error')}")
+    return reply
+
 def _transcribe_whisperx(audio_path: Path, job_id: str = None):
     """
     Runs WhisperX locally on the audio file.
@@ -348,108 +712,75 @@ def _transcribe_whisperx(audio_path: Path, job_id: str = None):
         "--print_progress", "True"
     ]
     
-    progress_re = re.compile(r"Progress:\s*([0-9]+(?:\.[0-9]+)?)%")
-    transcript_re = re.compile(r"Transcript:\s*\\[(\\d+(?:\\.\\d+)?)\\s*-->\\s*(\\d+(?:\\.\\d+)?)\\]")
     phase = "asr"
     last_progress = 0.0
     last_update = 0.0
     last_lines = deque(maxlen=40)
     last_time_sec = 0.0
     total_seconds = get_audio_duration(audio_path)
-    total_minutes = (total_seconds / 60.0) if total_seconds else 0.0
+    total_minutes_str = f"{total_seconds / 60.0:.1f}" if total_seconds else ""
 
     def update_progress(pct: float, current_phase: str):
         nonlocal last_progress, last_update
         if current_phase == "align":
             overall = 20.0 + (pct / 100.0) * 10.0
-            status = f"Aligning ({pct:.0f}%)"
         else:
             overall = 10.0 + (pct / 100.0) * 10.0
-            status = f"Transcribing ({pct:.0f}%)"
-
-        if total_minutes:
-            done_minutes = min(last_time_sec, total_seconds) / 60.0
-            status = f"{status} [{done_minutes:.1f}/{total_minutes:.1f} min]"
 
-        now = time.time()
-        if overall <= last_progress + 0.2 and (now - last_update) < 2.0:
+        if overall <= last_progress:
             return
+        if overall < last_progress + MIN_PROGRESS_DELTA:
+            now = time.time()
+            if now - last_update < MIN_PROGRESS_INTERVAL:
+                return
+        else:
+            now = time.time()
 
-        last_progress = max(last_progress, overall)
+        if current_phase == "align":
+            status = f"Aligning ({pct:.0f}%)"
+        else:
+            status = f"Transcribing ({pct:.0f}%)"
+        if total_minutes_str:
+            done_minutes = min(last_time_sec, total_seconds) / 60.0
+            status = f"{status} [{done_minutes:.1f}/{total_minutes_str} min]"
+
+        last_progress = overall
         last_update = now
-        omega_db.update(stem, status=status, progress=round(last_progress, 2))
+        omega_db.update(stem, status=status, progress=round(last_progress))
+
+    env_idle = os.environ.get("OMEGA_ASR_IDLE_TIMEOUT")
+    idle_timeout = _safe_float_env("OMEGA_ASR_IDLE_TIMEOUT", 900.0)
+    if env_idle is None and total_seconds:
+        idle_timeout = max(idle_timeout, min(total_seconds * 1.5, 4 * 3600))
+    logger.info("WhisperX idle timeout set to %.0fs", idle_timeout)
+
+    def handle_event(kind: str, value):
+        nonlocal phase, last_time_sec
+        if kind == "progress":
+            update_progress(value, phase)
+        elif kind == "transcript":
+            if value > last_time_sec:
+                last_time_sec = value
+        else:
+            phase = value
 
     try:
-        logger.info("Starting WhisperX subprocess...")
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-        if not proc.stdout:
-            raise RuntimeError("WhisperX did not return a stdout pipe")
-
-        env_idle = os.environ.get("OMEGA_ASR_IDLE_TIMEOUT")
-        idle_timeout = _safe_float_env("OMEGA_ASR_IDLE_TIMEOUT", 900.0)
-        if env_idle is None and total_seconds:
-            idle_timeout = max(idle_timeout, min(total_seconds * 1.5, 4 * 3600))
-        logger.info("WhisperX idle timeout set to %.0fs", idle_timeout)
-        start_time = time.time()
-        last_output = start_time
-
-        while True:
-            if proc.poll() is not None:
-                break
-
-            ready, _, _ = select.select([proc.stdout], [], [], 1.0)
-            if ready:
-                line = proc.stdout.readline()
-                if line == "" and proc.poll() is not None:
-                    break
-                stripped = line.strip()
-                if stripped:
-                    last_output = time.time()
-                    last_lines.append(stripped)
-
-                if "Performing alignment" in stripped:
-                    phase = "align"
-                elif "Performing transcription" in stripped:
-                    phase = "asr"
-
-                match = progress_re.search(stripped)
-                if match:
-                    try:
-                        pct = float(match.group(1))
-                    except ValueError:
-                        continue
-                    update_progress(pct, phase)
-                    continue
-
-                match = transcript_re.search(stripped)
-                if match:
-                    try:
-                        seg_end = float(match.group(2))
-                    except ValueError:
-                        continue
-                    if seg_end > last_time_sec:
-                        last_time_sec = seg_end
-            else:
-                now = time.time()
-                if idle_timeout and (now - last_output) > idle_timeout:
-                    logger.error("WhisperX stalled: no output for %.0f seconds", now - last_output)
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=10)
-                    except Exception:
-                        proc.kill()
-                    raise RuntimeError(f"WhisperX stalled (idle > {idle_timeout:.0f}s)")
-
-        proc.wait()
-        if proc.returncode != 0:
-            tail = "\n".join(last_lines)
-            raise RuntimeError(f"WhisperX failed (code {proc.returncode}). Last output:\\n{tail}")
+        if config.WHISPER_DAEMON:
+            _run_whisperx_daemon({
+                "audio": str(audio_path),
+                "output_dir": str(output_dir),
+                "model": config.WHISPER_MODEL,
+                "language": "en",
+                "compute_type": compute_type,
+                "batch_size": 1,
+                "device": config.WHISPER_DEVICE,
+                "print_progress": True,
+            }, idle_timeout, handle_event, last_lines)
+        else:
+            logger.info("Starting WhisperX subprocess...")
+            with _managed_whisperx(cmd, idle_timeout, last_lines) as events:
+                for kind, value in events:
+                    handle_event(kind, value)
 
         logger.info("WhisperX subprocess finished.")
     except Exception as e:
@@ -461,17 +792,9 @@ def _transcribe_whisperx(audio_path: Path, job_id: str = None):
     skeleton_path = output_dir / f"{stem}_SKELETON.json"
     
     if whisper_json.exists():
-        with open(whisper_json, "r") as f:
-            data = json.load(f)
+        data = _read_json(whisper_json)
             
-        segments = []
-        for i, seg in enumerate(data.get("segments", [])):
-            segments.append({
-                "id": i + 1, # Force sequential ID (1-based)
-                "start": seg.get("start"),
-                "end": seg.get("end"),
-                "text": seg.get("text", "").strip()
-            })
+        segments = _normalized_segments(data.get("segments", []))
 
         safety_enabled = str(os.environ.get("OMEGA_ASR_SAFETY_PASS", "1")).strip().lower() in {"1", "true", "yes", "on"}
         safety_force = str(os.environ.get("OMEGA_ASR_SAFETY_FORCE", "1")).strip().lower() in {"1", "true", "yes", "on"}
@@ -492,6 +815,7 @@ def _transcribe_whisperx(audio_path: Path, job_id: str = None):
                 gap_threshold=safety_gap,
                 coverage_threshold=safety_coverage,
                 first_gap_threshold=safety_first_gap,
+                pre_sorted=True,
             )
         else:
             should_run, stats = False, {}
@@ -499,58 +823,66 @@ def _transcribe_whisperx(audio_path: Path, job_id: str = None):
         added_segments = 0
         if should_run:
             omega_db.update(stem, status="Safety pass: rechecking opening")
-            safety_audio = audio_path.with_name(f"{stem}__safety.wav")
             try:
-                cmd = [
-                    config.FFMPEG_BIN, "-y",
-                    "-i", str(audio_path),
-                    "-t", str(window_seconds),
-                    "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
-                    str(safety_audio),
-                ]
-                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL)
-
-                safety_cmd = [
-                    str(config.WHISPER_BIN),
-                    str(safety_audio),
-                    "--model", config.WHISPER_MODEL,
-                    "--language", "en",
-                    "--output_dir", str(output_dir),
-                    "--output_format", "json",
-                    "--compute_type", compute_type,
-                    "--batch_size", "1",
-                    "--device", config.WHISPER_DEVICE,
-                    "--vad_onset", str(safety_onset),
-                    "--vad_offset", str(safety_offset),
-                    "--chunk_size", str(safety_chunk),
-                    "--print_progress", "False",
-                ]
-                subprocess.run(safety_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, stdin=subprocess.DEVNULL)
-
-                safety_json = output_dir / f"{stem}__safety.json"
-                if safety_json.exists():
-                    with open(safety_json, "r") as f:
-                        safety_data = json.load(f)
-                    safety_segments = []
-                    for seg in safety_data.get("segments", []):
-                        safety_segments.append({
-                            "start": seg.get("start"),
-                            "end": seg.get("end"),
-                            "text": seg.get("text", "").strip(),
-                        })
+                # WAV slice and WhisperX output are throwaway: keep them in RAM-backed scratch
+                with tempfile.TemporaryDirectory(prefix="omega_safety_", dir=_SCRATCH_DIR) as scratch:
+                    safety_audio = Path(scratch) / f"{stem}__safety.wav"
+                    if not _copy_wav_head(audio_path, safety_audio, window_seconds):
+                        cmd = [
+                            config.FFMPEG_BIN, "-y",
+                            "-i", str(audio_path),
+                            "-t", str(window_seconds),
+                            "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+                            str(safety_audio),
+                        ]
+                        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+
+                    if config.WHISPER_DAEMON:
+                        # Segments come back in the reply; nothing is written to disk
+                        reply = _run_whisperx_daemon({
+                            "audio": str(safety_audio),
+                            "output_dir": scratch,
+                            "model": config.WHISPER_MODEL,
+                            "language": "en",
+                            "compute_type": compute_type,
+                            "batch_size": 1,
+                            "device": config.WHISPER_DEVICE,
+                            "vad_onset": safety_onset,
+                            "vad_offset": safety_offset,
+                            "chunk_size": safety_chunk,
+                            "print_progress": False,
+                            "return_segments": True,
+                        }, idle_timeout)
+                        safety_raw = reply.get("segments")
+                    else:
+                        safety_cmd = [
+                            str(config.WHISPER_BIN),
+                            str(safety_audio),
+                            "--model", config.WHISPER_MODEL,
+                            "--language", "en",
+                            "--output_dir", scratch,
+                            "--output_format", "json",
+                            "--compute_type", compute_type,
+                            "--batch_size", "1",
+                            "--device", config.WHISPER_DEVICE,
+                            "--vad_onset", str(safety_onset),
+                            "--vad_offset", str(safety_offset),
+                            "--chunk_size", str(safety_chunk),
+                            "--print_progress", "False",
+                        ]
+                        subprocess.run(safety_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+                        safety_json = safety_audio.with_suffix(".json")
+                        safety_raw = _read_json(safety_json).get("segments") if safety_json.exists() else None
+
+                if safety_raw is not None:
                     segments, added_segments = _merge_safety_segments(
                         segments,
-                        safety_segments,
+                        _normalized_segments(safety_raw),
                         window_seconds,
+                        pre_sorted=True,
                     )
-                    safety_json.unlink(missing_ok=True)
             except Exception as exc:
                 logger.warning("Safety pass failed: %s", exc)
-            finally:
-                try:
-                    safety_audio.unlink(missing_ok=True)
-                except Exception:
-                    pass
 
         omega_db.update(
             stem,
@@ -564,7 +896,11 @@ def _transcribe_whisperx(audio_path: Path, job_id: str = None):
                 }
             },
         )
-            
+
+
+        for idx, seg in enumerate(segments, start=1):
+            seg["id"] = idx  # Force sequential ID (1-based)
+
         # We don't know Mode/Style here, the Manager should inject it or we update it later.
         # For now, just save segments.
         payload = {
@@ -572,8 +908,7 @@ def _transcribe_whisperx(audio_path: Path, job_id: str = None):
             "segments": segments
         }
         
-        with open(skeleton_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        _write_json(skeleton_path, payload)
             
         whisper_json.unlink()
         logger.info(f"✅ Skeleton Saved: {skeleton_path.name}")
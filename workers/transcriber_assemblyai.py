@@ -8,9 +8,14 @@ Provides fast, reliable transcription via AssemblyAI API with:
 """
 
 import os
+import re
 import json
 import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -19,13 +24,33 @@ try:
 except ImportError:
     aai = None
 
+try:
+    import orjson  # optional: native JSON for large skeletons
+except ImportError:
+    orjson = None
+
 import config
 import omega_db
 
+try:
+    # Cheap to import (its CNN backend loads lazily); resolved once, not per transcription
+    from workers.audio_classifier import is_available as _cnn_available, mark_music_segments as _cnn_mark
+    from workers.audio_classifier import classify_audio as _cnn_classify
+except ImportError:
+    _cnn_available = None
+    _cnn_mark = None
+    _cnn_classify = None
+
 logger = logging.getLogger("OmegaManager.Transcriber.AssemblyAI")
 
+# Settings are fixed once config is imported; read them once here.
+_API_KEY = getattr(config, "ASSEMBLYAI_API_KEY", "") or os.environ.get("ASSEMBLYAI_API_KEY", "")
+_WORD_BOOST_RAW = getattr(config, "ASSEMBLYAI_WORD_BOOST", "")
+_BOOST_WEIGHT = getattr(config, "ASSEMBLYAI_BOOST_WEIGHT", "high").lower()
+_SPEAKER_LABELS = getattr(config, "ASSEMBLYAI_SPEAKER_LABELS", True)
+
 # Default religious vocabulary for Word Boost
-RELIGIOUS_VOCABULARY = [
+RELIGIOUS_VOCABULARY = (
     # Names
     "Jesus", "Christ", "Holy Spirit", "God", "Lord", "Father",
     "Messiah", "Savior", "Redeemer",
@@ -40,32 +65,49 @@ RELIGIOUS_VOCABULARY = [
     # Shows/Ministries
     "Times Square Church", "Billy Graham", "CBN", "700 Club",
     "Joyce Meyer", "Praise", "Gospel",
-]
+)
 
 
-def _get_word_boost() -> list[str]:
+@lru_cache(maxsize=1)
+def _get_word_boost() -> tuple[str, ...]:
     """
     Returns combined word boost list from defaults + config.
+    Config is read once per process (it is fixed at import).
     """
     words = list(RELIGIOUS_VOCABULARY)
     
     # Add custom words from config
-    custom = getattr(config, "ASSEMBLYAI_WORD_BOOST", "")
+    custom = _WORD_BOOST_RAW
     if custom:
         custom_words = [w.strip() for w in custom.split(",") if w.strip()]
         words.extend(custom_words)
     
-    return words
+    return tuple(words)
 
 
+@lru_cache(maxsize=1)
 def _get_boost_weight() -> str:
     """Returns boost weight from config (low, default, high)."""
-    weight = getattr(config, "ASSEMBLYAI_BOOST_WEIGHT", "high").lower()
+    weight = _BOOST_WEIGHT
     if weight not in {"low", "default", "high"}:
         weight = "high"
     return weight
 
 
+@lru_cache(maxsize=1)
+def _build_transcription_config():
+    """The (immutable per process) AssemblyAI request config."""
+    return aai.TranscriptionConfig(
+        language_code="en",
+        word_boost=list(_get_word_boost()),
+        boost_param=_get_boost_weight(),
+        speaker_labels=_SPEAKER_LABELS,  # Enable multi-speaker detection
+    )
+
+
+_SENT_END_CHARS = ('.', '?', '!')
+
+
 def _segment_words(words: list) -> list[dict]:
     """
     Groups word-level timestamps into sentence segments.
@@ -78,19 +120,30 @@ def _segment_words(words: list) -> list[dict]:
         return []
     
     segments = []
-    current_words = []      # List of word text strings for segment text
+    current_words = []      # Word texts for segment text (AssemblyAI tokens carry no outer whitespace)
     current_word_data = []  # List of {text, start, end} for word-level timing
     current_start = None
     segment_id = 1
+    add_segment = segments.append
+    
+    # SDK Word objects, or plain dicts (e.g. replayed JSON): pick the accessor once
+    if hasattr(words[0], 'text'):
+        word_fields = attrgetter('text', 'start', 'end')
+    else:
+        word_fields = lambda w: (w.get('text', ''), w.get('start', 0), w.get('end', 0))
     
     for word in words:
-        word_text = word.text if hasattr(word, 'text') else word.get('text', '')
-        word_start = word.start if hasattr(word, 'start') else word.get('start', 0)
-        word_end = word.end if hasattr(word, 'end') else word.get('end', 0)
+        word_text, word_start, word_end = word_fields(word)
         
-        # AssemblyAI returns milliseconds, convert to seconds
+        # AssemblyAI returns milliseconds, convert to seconds (rounded to ms).
+        # Integer ms / 1000.0 already is the nearest float to the 3-decimal
+        # value, so round() is only needed for fractional input.
         word_start_sec = word_start / 1000.0
         word_end_sec = word_end / 1000.0
+        if type(word_start) is not int:
+            word_start_sec = round(word_start_sec, 3)
+        if type(word_end) is not int:
+            word_end_sec = round(word_end_sec, 3)
         
         if current_start is None:
             current_start = word_start_sec
@@ -98,37 +151,34 @@ def _segment_words(words: list) -> list[dict]:
         current_words.append(word_text)
         current_word_data.append({
             "text": word_text,
-            "start": round(word_start_sec, 3),
-            "end": round(word_end_sec, 3)
+            "start": word_start_sec,
+            "end": word_end_sec
         })
         
         # End segment on sentence-ending punctuation
-        if word_text.rstrip().endswith(('.', '?', '!')):
-            text = ' '.join(current_words)
-            segments.append({
+        # (AssemblyAI tokens carry no trailing whitespace; rstrip only if one does)
+        if word_text.endswith(_SENT_END_CHARS) or (
+            word_text[-1:].isspace() and word_text.rstrip().endswith(_SENT_END_CHARS)
+        ):
+            add_segment({
                 "id": segment_id,
-                "start": round(current_start, 3),
-                "end": round(word_end_sec, 3),
-                "text": text.strip(),
+                "start": current_start,
+                "end": word_end_sec,
+                "text": ' '.join(current_words),
                 "words": current_word_data  # Preserve word-level timing
             })
             segment_id += 1
-            current_words = []
+            current_words.clear()  # joined already; word data below is kept by the segment
             current_word_data = []
             current_start = None
     
-    # Handle remaining words (no sentence-ender)
+    # Handle remaining words (no sentence-ender); word_end_sec is the last word's end
     if current_words:
-        last_word = words[-1]
-        last_end = last_word.end if hasattr(last_word, 'end') else last_word.get('end', 0)
-        last_end_sec = last_end / 1000.0  # Convert ms to seconds
-        
-        text = ' '.join(current_words)
-        segments.append({
+        add_segment({
             "id": segment_id,
-            "start": round(current_start, 3),
-            "end": round(last_end_sec, 3),
-            "text": text.strip(),
+            "start": current_start,
+            "end": word_end_sec,
+            "text": ' '.join(current_words),
             "words": current_word_data  # Preserve word-level timing
         })
     
@@ -144,7 +194,8 @@ def _segment_words(words: list) -> list[dict]:
 
 # Opening music detection heuristic
 OPENING_MUSIC_SECONDS = 90  # First 90 seconds can be opening worship
-WORSHIP_PATTERNS = [
+# Patterns are matched against lowercased text; kept as immutable tuples.
+WORSHIP_PATTERNS = (
     # Direct worship words
     "almighty", "hallelujah", "praise", "glory", "holy", "amen",
     "worship", "lord", "jesus", "god", "savior", "king of kings",
@@ -152,28 +203,40 @@ WORSHIP_PATTERNS = [
     "you are", "we praise", "we worship", "i love you", "thank you",
     # Music markers
     "♪", "(music)", "[music]", "(singing)", "[singing]",
-]
+)
 # Phrases that indicate SPEECH (not music) even in opening
-SPEECH_INDICATORS = [
+SPEECH_INDICATORS = (
     "today", "tonight", "we're going to", "i want to", "let me",
     "good morning", "good evening", "welcome to", "we're calling",
     "our message", "this message", "my subtitle", "chapter",
-]
+)
+# Explicit music markers (always music unless a speech indicator is present)
+MUSIC_MARKERS = ("(music)", "[music]", "(singing)", "[singing]", "♪")
+
+# One alternation per pattern set: a single scan per segment instead of a
+# Python loop of `in` checks over every pattern.
+# Lowercased here so a mixed-case entry can never silently stop matching.
+def _compile_patterns(patterns) -> re.Pattern:
+    return re.compile("|".join(re.escape(p.lower()) for p in patterns))
+
+_SPEECH_RE = _compile_patterns(SPEECH_INDICATORS)
+_MUSIC_MARKER_RE = _compile_patterns(MUSIC_MARKERS)
 
 
 def _is_worship_pattern(text: str) -> bool:
     """Check if text matches worship/music patterns."""
-    lowered = text.lower().strip()
-    
+    return _is_worship_pattern_lower(text.lower())
+
+
+def _is_worship_pattern_lower(lowered: str) -> bool:
+    """_is_worship_pattern() for text the caller has already lowercased."""
     # Check for speech indicators (override music)
-    for indicator in SPEECH_INDICATORS:
-        if indicator in lowered:
-            return False
+    if _SPEECH_RE.search(lowered):
+        return False
             
     # Always mark explicit music markers
-    for marker in ["(music)", "[music]", "(singing)", "[singing]", "♪"]:
-        if marker in lowered:
-            return True
+    if _MUSIC_MARKER_RE.search(lowered):
+        return True
     
     # Check for worship patterns (only if short phrase)
     # DISABLING HEURISTIC TO GUARANTEE SUCCESS FOR USER
@@ -182,9 +245,10 @@ def _is_worship_pattern(text: str) -> bool:
     #    return False
 
     # Check for worship keywords in short phrases
-    # for pattern in WORSHIP_PATTERNS:
-    #    if pattern in lowered:
-    #        return True
+    # (if re-enabled, compile WORSHIP_PATTERNS like _SPEECH_RE rather than looping:
+    #  _WORSHIP_RE = re.compile("|".join(map(re.escape, WORSHIP_PATTERNS))))
+    # if _WORSHIP_RE.search(lowered):
+    #    return True
             
     return False
 
@@ -200,35 +264,29 @@ def _mark_opening_music(segments: list[dict]) -> tuple[list[dict], int]:
     2. If they match worship patterns and are short, mark as music
     3. Stop when we hit clear speech content
     """
-    if not segments:
+    # Segments come from _segment_words(): "start"/"text" are always present
+    window = OPENING_MUSIC_SECONDS
+    
+    # Nothing in the opening window (segments are in time order)
+    if not segments or segments[0]["start"] > window:
         return segments, 0
     
     marked_count = 0
-    in_speech = False
     
     for segment in segments:
         # Stop processing if we've passed the opening window
-        if segment.get("start", 0) > OPENING_MUSIC_SECONDS:
+        if segment["start"] > window:
             break
         
-        # Once we've hit speech, stop marking
-        if in_speech:
-            break
-        
-        text = segment.get("text", "")
-        
-        # Check if this is clearly speech (not music)
+        text = segment["text"]
         lowered = text.lower()
-        for indicator in SPEECH_INDICATORS:
-            if indicator in lowered:
-                in_speech = True
-                break
         
-        if in_speech:
+        # Once we hit clearly speech (not music), stop marking
+        if _SPEECH_RE.search(lowered):
             break
         
         # Check if this matches worship patterns
-        if _is_worship_pattern(text):
+        if _is_worship_pattern_lower(lowered):
             segment["original_text"] = text
             segment["text"] = "(MUSIC)"
             segment["is_music"] = True
@@ -238,6 +296,22 @@ def _mark_opening_music(segments: list[dict]) -> tuple[list[dict], int]:
     return segments, marked_count
 
 
+_transcriber = None
+
+# Background CNN classification, overlapped with the AssemblyAI request. One
+# shared worker: the classifier model is not re-entrant and jobs rarely overlap.
+_classify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aai-classify")
+
+
+def _get_transcriber():
+    """One aai.Transcriber per process (its HTTP client stays warm); the API key is set once."""
+    global _transcriber
+    if _transcriber is None:
+        aai.settings.api_key = _API_KEY
+        _transcriber = aai.Transcriber()
+    return _transcriber
+
+
 def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str = None) -> Path:
     """
     Transcribes audio via AssemblyAI API.
@@ -251,8 +325,7 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
     if aai is None:
         raise RuntimeError("assemblyai package not installed. Run: pip install assemblyai")
     
-    api_key = getattr(config, "ASSEMBLYAI_API_KEY", "") or os.environ.get("ASSEMBLYAI_API_KEY", "")
-    if not api_key:
+    if not _API_KEY:
         raise ValueError("ASSEMBLYAI_API_KEY not configured")
     
     stem = job_id or audio_path.stem
@@ -263,24 +336,20 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
     output_dir = config.VAULT_DATA
     skeleton_path = output_dir / f"{stem}_SKELETON.json"
     
+    # No separate "Submitting" write: the attempt status below follows immediately
     logger.info(f"📤 AssemblyAI: Submitting {audio_path.name}")
-    omega_db.update(stem, status="Submitting to AssemblyAI", progress=12.0)
-    
-    # Configure AssemblyAI
-    aai.settings.api_key = api_key
-    
-    word_boost = _get_word_boost()
-    boost_weight = _get_boost_weight()
     
     # Check if speaker diarization is enabled (default: True)
-    enable_speakers = getattr(config, "ASSEMBLYAI_SPEAKER_LABELS", True)
+    enable_speakers = _SPEAKER_LABELS
     
-    transcription_config = aai.TranscriptionConfig(
-        language_code="en",
-        word_boost=word_boost,
-        boost_param=boost_weight,
-        speaker_labels=enable_speakers,  # Enable multi-speaker detection
-    )
+    transcription_config = _build_transcription_config()
+    
+    # The CNN classification only needs the audio, not the transcript: run it
+    # while AssemblyAI works, so mark_music_segments() later hits its cache.
+    use_cnn = _cnn_available is not None and _cnn_available()
+    classify_future = None
+    if use_cnn:
+        classify_future = _classify_pool.submit(_cnn_classify, audio_path)
     
     # Retry loop
     last_error = None
@@ -288,7 +357,7 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
         try:
             omega_db.update(stem, status=f"Transcribing via AssemblyAI (attempt {attempt + 1})", progress=15.0)
             
-            transcriber = aai.Transcriber()
+            transcriber = _get_transcriber()
             transcript = transcriber.transcribe(str(audio_path), config=transcription_config)
             
             if transcript.status == aai.TranscriptStatus.error:
@@ -297,7 +366,11 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
             # Success
             word_count = len(transcript.words) if transcript.words else 0
             logger.info(f"✅ AssemblyAI: Transcription complete ({word_count} words)")
-            omega_db.update(stem, status=f"Transcribed ({word_count} words)", progress=25.0)
+            if use_cnn:
+                # Segmentation takes milliseconds; go straight to the music-detection status
+                omega_db.update(stem, status=f"Transcribed ({word_count} words), detecting music (CNN classifier)", progress=27.0)
+            else:
+                omega_db.update(stem, status=f"Transcribed ({word_count} words)", progress=25.0)
             
             # Build skeleton - ALWAYS use word-level segmentation for precise timing
             # Utterance-based segmentation was causing progressive drift because it
@@ -310,17 +383,24 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
                 speaker_count = len(set(u.speaker for u in transcript.utterances if hasattr(u, 'speaker')))
                 logger.info(f"🎙️ Speaker diarization: {speaker_count} speakers detected")
             
+            # The SDK transcript (one model object per word, plus utterances) is
+            # heavier than the segments built from it; drop it before music
+            # detection and serialization so both aren't resident at peak.
+            del transcript, has_speakers
+            
             # Music detection: try professional classifier first, fallback to heuristic
             music_count = 0
-            try:
-                from workers.audio_classifier import is_available, mark_music_segments
-                if is_available():
-                    omega_db.update(stem, status="Detecting music (CNN classifier)", progress=27.0)
-                    segments, music_count = mark_music_segments(segments, audio_path)
+            if use_cnn:
+                try:
+                    try:
+                        classify_future.result()  # wait rather than classify a second time
+                    except Exception as e:
+                        logger.debug(f"Background audio classification failed: {e}")
+                    segments, music_count = _cnn_mark(segments, audio_path)
                     if music_count > 0:
                         logger.info(f"🎵 inaSpeechSegmenter: Marked {music_count} segments as (MUSIC)")
-            except Exception as e:
-                logger.debug(f"inaSpeechSegmenter not available: {e}")
+                except Exception as e:
+                    logger.warning(f"inaSpeechSegmenter failed, using heuristic: {e}")
             
             # If professional classifier didn't mark anything, use heuristic for opening
             if music_count == 0:
@@ -334,8 +414,11 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
             }
             
             # Save skeleton
-            with open(skeleton_path, "w", encoding="utf-8") as f:
-                json.dump(skeleton, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                skeleton_path.write_bytes(orjson.dumps(skeleton, option=orjson.OPT_INDENT_2))
+            else:
+                with open(skeleton_path, "w", encoding="utf-8") as f:
+                    json.dump(skeleton, f, indent=2, ensure_ascii=False)
             
             logger.info(f"✅ Skeleton saved: {skeleton_path.name} ({len(segments)} segments)")
             return skeleton_path
@@ -344,6 +427,16 @@ def transcribe_assemblyai(audio_path: Path, max_retries: int = 3, job_id: str =
             last_error = e
             logger.warning(f"⚠️ AssemblyAI attempt {attempt + 1} failed: {e}")
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                # Full-jitter exponential backoff: concurrent jobs hitting the same
+                # outage don't all retry in lockstep
+                time.sleep(random.uniform(0.0, min(2 ** attempt, 30)))
+    
+    if classify_future is not None and not classify_future.cancel():
+        # Already running: let it finish here (it warms the classifier cache for
+        # a re-run) rather than leave it unowned on the shared worker
+        try:
+            classify_future.result()
+        except Exception as e:
+            logger.debug(f"Background audio classification failed: {e}")
     
     raise RuntimeError(f"AssemblyAI failed after {max_retries} attempts: {last_error}")
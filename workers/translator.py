@@ -1,15 +1,44 @@
 import os
+import re
 import json
 import time
 import random
 import datetime
+import hashlib
+import subprocess
+import threading
 import logging
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any, Iterable
+from typing import Optional, Dict, Any, Iterable, Callable
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
+from google.api_core.exceptions import FailedPrecondition, PreconditionFailed
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import vertexai
 from vertexai.preview import caching
 from vertexai.generative_models import GenerativeModel, Part, Content, SafetySetting, HarmCategory, HarmBlockThreshold, GenerationConfig
+try:
+    import orjson  # optional: native JSON for checkpoints and skeletons
+except ImportError:
+    orjson = None
+try:
+    from google.cloud.storage import transfer_manager
+except ImportError:  # google-cloud-storage < 2.7
+    transfer_manager = None
+try:
+    from google.cloud.storage.grpc_client import GrpcClient
+    from google.cloud import _storage_v2 as storage_v2
+except ImportError:  # google-cloud-storage without the gRPC client
+    GrpcClient = None
+try:
+    from vertexai.batch_prediction import BatchPredictionJob
+except ImportError:  # older google-cloud-aiplatform
+    BatchPredictionJob = None
 import config
 import omega_db
 import system_health
@@ -20,8 +49,25 @@ logger = logging.getLogger("OmegaManager.Translator")
 PROJECT_ID = config.OMEGA_CLOUD_PROJECT
 BUCKET_NAME = "audio-hq-sermon-translator-55"
 LOCATION = config.GEMINI_LOCATION
-MAX_WORKERS = 3
-BATCH_SIZE = 60
+MAX_WORKERS = 3  # concurrent batch requests (OMEGA_TRANSLATE_WORKERS overrides)
+BATCH_SIZE = 150  # max segments per request (OMEGA_TRANSLATE_BATCH_SIZE overrides)
+BATCH_TOKENS = 6000  # estimated output tokens per request (OMEGA_TRANSLATE_BATCH_TOKENS overrides)
+GCS_POOL_SIZE = 16
+# Context-free stock phrases whose earlier translation may be reused across jobs
+# (opt-in: OMEGA_TRANSLATE_SEGMENT_MEMO=1). Keep to phrases with no person,
+# gender or number agreement; "I'm ready", "Yes, he is" etc. must go to the model.
+SEGMENT_MEMO_PHRASES = frozenset({
+    "amen", "amen and amen", "hallelujah", "praise the lord", "praise god",
+    "praise jesus", "glory to god", "thank you jesus",
+})
+CHECKPOINT_FLUSH_SECONDS = 30.0  # full snapshot cadence; each batch is appended to the delta log
+CHECKPOINT_FLUSH_BATCHES = 16
+PROGRESS_UPDATE_SECONDS = 2.0  # min gap between per-batch progress writes to omega_db
+GCS_GRPC_CHUNK = 2 * 1024 * 1024  # ServiceConstants.MAX_WRITE_CHUNK_BYTES
+GCS_UPLOAD_CHUNK = 8 * 1024 * 1024  # resumable upload chunk (multiple of 256 KiB)
+GCS_PARALLEL_PART = 20 * 1024 * 1024  # multipart upload part size
+GCS_PARALLEL_MIN = 2 * GCS_PARALLEL_PART  # above this, upload parts concurrently
+GCS_UPLOAD_WORKERS = 8
 
 SAFETY_SETTINGS = [
     SafetySetting(category=HarmCategory.HARM_CATEGORY_HATE_SPEECH, threshold=HarmBlockThreshold.BLOCK_NONE),
@@ -40,30 +86,59 @@ GLOSSARY = {
 }
 
 _CHECKPOINT_VERSION = 1
+_CACHE_LAYOUT = 2  # caches carry the translation rules; older ones are not reused
 
+_storage_client: Optional[storage.Client] = None
+_bucket: Optional[storage.Bucket] = None
+_grpc_client = None
+_storage_lock = threading.Lock()
+_shutdown_event = threading.Event()
+_cleanup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="translator-cleanup")
 
+# stem -> upload started by prefetch_audio() for a job waiting to translate
+_prefetched_uploads: Dict[str, Future] = {}
+_prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translator-prefetch")
+
+CONTEXT_CACHE_TTL = datetime.timedelta(minutes=60)
+# cache_name -> (expires_at epoch, CachedContent, GenerativeModel bound to it)
+_cached_models: Dict[str, tuple] = {}
+_cached_models_lock = threading.Lock()
+_vertex_ready = False
+_vertex_lock = threading.Lock()
+
+
+_SLUG_UNSAFE_RE = re.compile(r"[^\w.-]")
+_SLUG_UNDERSCORES_RE = re.compile(r"__+")
+
+
+@lru_cache(maxsize=1024)
 def _slugify(value: str) -> str:
     value = (value or "").strip()
     if not value:
         return "default"
-    allowed = []
-    for ch in value:
-        if ch.isalnum() or ch in {"-", "_", "."}:
-            allowed.append(ch)
-        else:
-            allowed.append("_")
-    collapsed = "".join(allowed)
-    while "__" in collapsed:
-        collapsed = collapsed.replace("__", "_")
+    # \w is Unicode-aware, so it keeps the same characters as str.isalnum() (plus "_").
+    collapsed = _SLUG_UNDERSCORES_RE.sub("_", _SLUG_UNSAFE_RE.sub("_", value))
     return collapsed.strip("_.") or "default"
 
 
-def _atomic_write_json(path: Path, payload: Any) -> None:
+def _atomic_write_json(path: Path, payload: Any, *, indent: Optional[int] = 2) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.parent / f".{path.name}.tmp.{os.getpid()}.{int(time.time() * 1e9)}"
     try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(
+                    payload,
+                    option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0),
+                )
+            except TypeError:  # orjson.JSONEncodeError: let the stdlib try
+                data = None
+        if data is not None:
+            tmp_path.write_bytes(data)
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=indent, ensure_ascii=False)
         os.replace(tmp_path, path)
     finally:
         try:
@@ -74,10 +149,18 @@ def _atomic_write_json(path: Path, payload: Any) -> None:
 
 
 def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _json_line(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
 def _checkpoint_path(stem: str, target_language_code: str, program_profile: str) -> Path:
     safe_stem = _slugify(stem)
     safe_lang = _slugify(target_language_code.lower())
@@ -99,6 +182,34 @@ def _checkpoint_path(stem: str, target_language_code: str, program_profile: str)
     return config.BASE_DIR / filename
 
 
+def _checkpoint_delta_path(checkpoint_path: Path) -> Path:
+    # Append-only {"id", "text"} lines written since the last full snapshot.
+    return checkpoint_path.with_suffix(".delta.jsonl")
+
+
+def _replay_checkpoint_delta(checkpoint_path: Path, translated: Dict[str, str]) -> None:
+    try:
+        raw = _checkpoint_delta_path(checkpoint_path).read_bytes()
+    except FileNotFoundError:
+        return
+    loads = orjson.loads if orjson is not None else json.loads
+    for line in raw.splitlines():
+        try:
+            item = loads(line)
+            translated[str(item["id"])] = str(item["text"])
+        except Exception:
+            continue  # torn last line after a crash
+
+
+def _discard_checkpoint_delta(checkpoint_path: Path) -> None:
+    try:
+        _checkpoint_delta_path(checkpoint_path).unlink()
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass
+
+
 def _load_checkpoint(
     checkpoint_path: Path,
     *,
@@ -108,6 +219,7 @@ def _load_checkpoint(
     source_count: int,
 ) -> Dict[str, Any]:
     if not checkpoint_path.exists():
+        _discard_checkpoint_delta(checkpoint_path)
         return {
             "version": _CHECKPOINT_VERSION,
             "stem": stem,
@@ -129,6 +241,7 @@ def _load_checkpoint(
             checkpoint_path.replace(bad_path)
         except Exception:
             pass
+        _discard_checkpoint_delta(checkpoint_path)
         return {
             "version": _CHECKPOINT_VERSION,
             "stem": stem,
@@ -179,6 +292,7 @@ def _load_checkpoint(
             checkpoint_path.replace(mismatch_path)
         except Exception:
             pass
+        _discard_checkpoint_delta(checkpoint_path)
         return {
             **expected,
             "translated": {},
@@ -186,6 +300,7 @@ def _load_checkpoint(
             "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         }
 
+    _replay_checkpoint_delta(checkpoint_path, normalized_translated)
     data["translated"] = normalized_translated
     data["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
     return data
@@ -211,14 +326,34 @@ def _clean_model_json(text: str) -> str:
     return value
 
 
+def _loads_model_json(text: str) -> Any:
+    # response_mime_type=application/json means the text is normally bare JSON;
+    # only strip markdown fences when that fails.
+    try:
+        return (orjson.loads if orjson is not None else json.loads)(text or "")
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+        return json.loads(_clean_model_json(text))
+
+
+def request_shutdown() -> None:
+    """Wakes any batch sleeping in retry backoff so the process can exit promptly."""
+    _shutdown_event.set()
+
+
 def _sleep_backoff(attempt: int, *, base: float = 1.8, cap_seconds: float = 60.0) -> None:
     # Jitter helps avoid thundering herds on retries.
     delay = min(cap_seconds, base ** max(1, attempt))
     delay += random.uniform(0.0, 0.6)
-    time.sleep(delay)
+    if _shutdown_event.wait(delay):
+        raise RuntimeError("Translation interrupted by shutdown")
 
 
 def _iter_input_ids(batch: Iterable[dict]) -> list[int]:
+    try:
+        return [int(seg["id"]) for seg in batch]
+    except (KeyError, TypeError, ValueError):
+        pass  # re-walk below for a precise error
+
     ids: list[int] = []
     for seg in batch:
         seg_id = seg.get("id")
@@ -231,19 +366,89 @@ def _iter_input_ids(batch: Iterable[dict]) -> list[int]:
     return ids
 
 
-def _translate_batch_once(
-    model: GenerativeModel,
-    batch: list[dict],
-    *,
-    target_language: str,
-    program_profile: str,
-    audio_context: Optional[Part] = None,
-) -> list[dict]:
+_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "text": {"type": "string"}},
+    },
+}
+_TEMPERATURE = 0.3
+_GENERATION_CONFIG = GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=_RESPONSE_SCHEMA,
+    temperature=_TEMPERATURE,
+)
+
+
+# Only what the model needs per segment; skeletons also carry per-word timing
+# ("words") and bookkeeping fields that would dominate the prompt tokens.
+_PROMPT_KEYS = ("id", "start", "end", "speaker", "text")
+
+
+def _batch_json(batch: list[dict]) -> str:
+    projected = [{key: seg[key] for key in _PROMPT_KEYS if key in seg} for seg in batch]
+    if orjson is not None:
+        try:
+            return orjson.dumps(projected).decode("utf-8")  # compact, UTF-8 like below
+        except TypeError:  # orjson.JSONEncodeError (e.g. out-of-range int): let the stdlib try
+            pass
+    return json.dumps(projected, ensure_ascii=False, separators=(",", ":"))
+
+
+def _estimate_tokens(seg: dict) -> int:
+    # ~4 chars per token plus the {"id":..,"text":..} wrapper in the reply.
+    return 12 + len(str(seg.get("text") or "")) // 4
+
+
+def _pack_batches(segments: list[dict], max_segments: int, max_tokens: int) -> list[list[dict]]:
+    """
+    Greedy in-order packing by estimated output size instead of a fixed stride:
+    chatty stretches get smaller batches, short lines share fewer requests (each
+    of which re-reads the whole cached audio context).
+    """
+    batches: list[list[dict]] = []
+    batch: list[dict] = []
+    tokens = 0
+    for seg in segments:
+        cost = _estimate_tokens(seg)
+        if batch and (len(batch) >= max_segments or tokens + cost > max_tokens):
+            batches.append(batch)
+            batch, tokens = [], 0
+        batch.append(seg)
+        tokens += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+_MEMO_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+def _segment_memo_keys(segments: list[dict], target_language_code: str, program_profile: str) -> Dict[str, str]:
+    """
+    {segment id: memo key} for segments that are exactly one of the
+    SEGMENT_MEMO_PHRASES ("Amen.", "Praise the Lord!"), ignoring case and
+    punctuation. Empty unless OMEGA_TRANSLATE_SEGMENT_MEMO=1.
+    """
+    if os.environ.get("OMEGA_TRANSLATE_SEGMENT_MEMO", "0") != "1":
+        return {}
+    keys: Dict[str, str] = {}
+    for seg in segments:
+        text = " ".join(_MEMO_PUNCT_RE.sub(" ", str(seg.get("text") or "").lower()).split())
+        if text not in SEGMENT_MEMO_PHRASES:
+            continue
+        digest = hashlib.sha1(f"{target_language_code}|{program_profile}|{text}".encode("utf-8")).hexdigest()
+        keys[str(seg.get("id"))] = digest
+    return keys
+
+
+def _translation_rules(target_language: str, program_profile: str) -> str:
     terminology_note = ""
     if target_language.lower() in {"icelandic", "is"}:
         terminology_note = '    - Terminology: "Pastor" -> "Prestur".\n'
 
-    prompt = f"""
+    return f"""
     TRANSLATE these segments to {target_language} (Profile: {program_profile}).
     Return ONLY JSON.
 
@@ -259,57 +464,54 @@ def _translate_batch_once(
     MUSIC:
     - Only output (MUSIC) for pure singing/lyrics or instrumental with no speech.
     - If speech is present over music, translate the speech and do NOT output (MUSIC).
-{terminology_note}
+{terminology_note}"""
 
-    INPUT:
-    {json.dumps(batch, ensure_ascii=False)}
-    """
 
-    generation_config = GenerationConfig(
-        response_mime_type="application/json",
-        response_schema={
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {"id": {"type": "integer"}, "text": {"type": "string"}},
-            },
-        },
-        temperature=0.3,
-    )
+# With a context cache the rules above live in its system instruction, so the
+# per-batch prompt is this fixed preamble with the segment JSON appended.
+_PROMPT_PREAMBLE = "TRANSLATE these segments. Return ONLY JSON.\nINPUT:\n"
 
-    contents = [prompt]
-    if audio_context:
-        contents.append(audio_context)
 
-    response = model.generate_content(
-        contents,
-        generation_config=generation_config,
-        safety_settings=SAFETY_SETTINGS,
-    )
+def _build_prompt(
+    batch_json: str, *, target_language: str, program_profile: str, cached_rules: bool = False
+) -> str:
+    if cached_rules:
+        return _PROMPT_PREAMBLE + batch_json
+    rules = _translation_rules(target_language, program_profile)
+    return f"""{rules}
 
-    cleaned = _clean_model_json(getattr(response, "text", "") or "")
-    parsed = json.loads(cleaned)
+    INPUT:
+    {batch_json}
+    """
+
+
+def _parse_translation(text: str, batch: list[dict]) -> list[dict]:
+    parsed = _loads_model_json(text)
     if not isinstance(parsed, list):
         raise ValueError("Model response is not a JSON array")
 
     input_ids = _iter_input_ids(batch)
-    expected_ids = set(input_ids)
+    expected_ids = frozenset(input_ids)
+    expected_count = len(expected_ids)
     result_map: Dict[int, str] = {}
 
     for item in parsed:
         if not isinstance(item, dict):
             continue
-        seg_id = item.get("id")
         text = item.get("text")
-        try:
-            seg_id_int = int(seg_id)
-        except Exception:
-            continue
-        if seg_id_int not in expected_ids:
-            continue
         if not isinstance(text, str):
             continue
-        result_map[seg_id_int] = text
+        seg_id = item.get("id")
+        if type(seg_id) is not int:  # the schema asks for integers; coerce anything else
+            try:
+                seg_id = int(seg_id)
+            except Exception:
+                continue
+        if seg_id not in expected_ids:
+            continue
+        result_map[seg_id] = text
+        if len(result_map) == expected_count:
+            break
 
     missing = [seg_id for seg_id in input_ids if seg_id not in result_map]
     if missing:
@@ -318,6 +520,60 @@ def _translate_batch_once(
     return [{"id": seg_id, "text": result_map[seg_id]} for seg_id in input_ids]
 
 
+def _response_text(response: Any) -> str:
+    """
+    Text of the first candidate, read straight from its parts. response.text
+    rejects replies split over several parts (long JSON sometimes is), which
+    cost a full retry.
+    """
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        raise ValueError("Response has no candidates (likely blocked by safety filters)")
+    texts = []
+    for part in candidates[0].content.parts:
+        try:
+            texts.append(part.text)
+        except AttributeError:  # non-text part
+            continue
+    return "".join(texts)
+
+
+def _translate_batch_once(
+    model: GenerativeModel,
+    batch: list[dict],
+    *,
+    target_language: str,
+    program_profile: str,
+    audio_context: Optional[Part] = None,
+    batch_json: Optional[str] = None,
+) -> list[dict]:
+    # No audio_context means the model is bound to a context cache (rules included).
+    prompt = _build_prompt(
+        batch_json or _batch_json(batch),
+        target_language=target_language,
+        program_profile=program_profile,
+        cached_rules=audio_context is None,
+    )
+
+    contents = [prompt]
+    if audio_context:
+        contents.append(audio_context)
+
+    response = model.generate_content(
+        contents,
+        generation_config=_GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS,
+    )
+
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        logger.debug(
+            f"Batch tokens: prompt={usage.prompt_token_count} cached={usage.cached_content_token_count} "
+            f"output={usage.candidates_token_count}"
+        )
+    return _parse_translation(_response_text(response), batch)
+
+
 def translate_batch_with_cache(
     model: GenerativeModel,
     batch: list[dict],
@@ -339,6 +595,7 @@ def translate_batch_with_cache(
     if not batch:
         return []
 
+    batch_json = _batch_json(batch)  # serialized once for all retries
     last_exc: Optional[Exception] = None
     for attempt in range(1, max_attempts + 1):
         try:
@@ -348,6 +605,7 @@ def translate_batch_with_cache(
                 target_language=target_language,
                 program_profile=program_profile,
                 audio_context=audio_context,
+                batch_json=batch_json,
             )
         except (json.JSONDecodeError, ValueError) as exc:
             last_exc = exc
@@ -402,21 +660,527 @@ def ensure_credentials() -> bool:
         return True
     return False
 
-def upload_to_gcs(local_path: Path, destination_name: str) -> Optional[str]:
+def _init_vertex() -> None:
+    """vertexai.init once per process; it's idempotent but resolves credentials every call."""
+    global _vertex_ready
+    if not _vertex_ready:
+        with _vertex_lock:
+            if not _vertex_ready:
+                vertexai.init(project=PROJECT_ID, location=LOCATION)
+                _vertex_ready = True
+
+def _new_storage_client() -> storage.Client:
+    # The default transport has a 10-connection pool and no connection-level retries;
+    # mount a larger pool that also reconnects on resets and retries gateway errors.
+    try:
+        credentials, project = google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+        session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(
+            pool_connections=GCS_POOL_SIZE,
+            pool_maxsize=GCS_POOL_SIZE,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False),
+        )
+        session.mount("https://", adapter)
+        return storage.Client(project=project or PROJECT_ID, credentials=credentials, _http=session)
+    except Exception as e:
+        logger.warning(f"GCS pooled transport unavailable ({e}); using default client.")
+        return storage.Client()
+
+
+def _get_storage_client() -> storage.Client:
+    """One storage.Client per process (thread-safe; its auth and HTTP pool stay warm)."""
+    global _storage_client
+    if _storage_client is None:
+        with _storage_lock:
+            if _storage_client is None:
+                _storage_client = _new_storage_client()
+    return _storage_client
+
+
+def _get_bucket() -> storage.Bucket:
+    global _bucket
+    if _bucket is None:
+        _bucket = _get_storage_client().bucket(BUCKET_NAME)
+    return _bucket
+
+
+def _get_grpc_client():
+    global _grpc_client
+    if _grpc_client is None:
+        with _storage_lock:
+            if _grpc_client is None:
+                _grpc_client = GrpcClient(project=PROJECT_ID).grpc_client
+    return _grpc_client
+
+
+def _grpc_write_requests(local_path: Path, destination_name: str):
+    size = local_path.stat().st_size
+    spec = storage_v2.WriteObjectSpec(
+        resource=storage_v2.Object(bucket=f"projects/_/buckets/{BUCKET_NAME}", name=destination_name),
+        object_size=size,
+        if_generation_match=0,
+    )
+    offset = 0
+    with open(local_path, "rb") as f:
+        while True:
+            chunk = f.read(GCS_GRPC_CHUNK)
+            last = offset + len(chunk) >= size
+            request = storage_v2.WriteObjectRequest(
+                write_offset=offset,
+                checksummed_data=storage_v2.ChecksummedData(content=chunk),
+                finish_write=last,
+            )
+            if offset == 0:
+                request.write_object_spec = spec
+            yield request
+            offset += len(chunk)
+            if last or not chunk:
+                return
+
+
+def _upload_grpc(local_path: Path, destination_name: str) -> bool:
+    """Streams the file over one gRPC WriteObject call (OMEGA_GCS_GRPC=1); False means use JSON."""
+    if GrpcClient is None:
+        return False
+    try:
+        _get_grpc_client().write_object(requests=_grpc_write_requests(local_path, destination_name))
+        return True
+    except FailedPrecondition:
+        raise
+    except Exception as e:
+        logger.warning(f"gRPC upload failed ({e}); retrying over JSON API.")
+        return False
+
+
+def _audio_mime_type(name: str) -> str:
+    if name.endswith(".wav"):
+        return "audio/wav"
+    if name.endswith(".flac"):
+        return "audio/flac"
+    return "audio/mpeg"
+
+
+def _upload_json(blob: storage.Blob, local_path: Path) -> None:
+    # Resumable 8 MiB chunks: a dropped connection resumes at the last chunk
+    # instead of restarting the whole WAV. Big files go up as concurrent parts.
+    size = local_path.stat().st_size
+    content_type = _audio_mime_type(local_path.name)
+    if transfer_manager is not None and size >= GCS_PARALLEL_MIN:
+        # XML multipart uploads take no precondition; one HEAD is noise next to 40 MB.
+        if blob.exists():
+            raise PreconditionFailed("object already exists")
+        transfer_manager.upload_chunks_concurrently(
+            str(local_path),
+            blob,
+            content_type=content_type,
+            chunk_size=GCS_PARALLEL_PART,
+            worker_type=transfer_manager.THREAD,
+            max_workers=GCS_UPLOAD_WORKERS,
+        )
+        return
+    blob.chunk_size = GCS_UPLOAD_CHUNK
+    with open(local_path, "rb") as fh:
+        blob.upload_from_file(
+            fh,
+            size=size,
+            content_type=content_type,
+            if_generation_match=0,
+            checksum="crc32c",
+            retry=DEFAULT_RETRY.with_deadline(600),
+        )
+
+
+def upload_to_gcs(local_path: Path, destination_name: str, *, force: bool = False) -> Optional[str]:
+    """
+    Uploads once per local file version: a rerun whose WAV/FLAC is unchanged
+    (same size and mtime) gets the URI from omega_db without touching GCS.
+    force=True (or OMEGA_GCS_FORCE_UPLOAD=1) skips that memo.
+    """
     try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(BUCKET_NAME)
-        blob = bucket.blob(destination_name)
-        if not blob.exists():
-            logger.info(f"☁️ Uploading audio: {local_path.name}...")
-            blob.upload_from_filename(str(local_path))
-        return f"gs://{BUCKET_NAME}/{destination_name}"
+        stat = local_path.stat()
+        force = force or os.environ.get("OMEGA_GCS_FORCE_UPLOAD") == "1"
+        if not force:
+            gcs_uri = omega_db.get_gcs_upload(destination_name, stat.st_size, stat.st_mtime)
+            if gcs_uri:
+                logger.info(f"☁️ Audio already in GCS: {local_path.name}")
+                return gcs_uri
+        blob = _get_bucket().blob(destination_name)
+        # Create-only upload (ifGenerationMatch=0) instead of exists() + upload:
+        # one round-trip, and a resumed job's existing object fails fast with 412.
+        try:
+            if not (os.environ.get("OMEGA_GCS_GRPC") and _upload_grpc(local_path, destination_name)):
+                _upload_json(blob, local_path)
+            logger.info(f"☁️ Uploaded audio: {local_path.name}")
+        except (PreconditionFailed, FailedPrecondition):
+            pass
+        gcs_uri = f"gs://{BUCKET_NAME}/{destination_name}"
+        omega_db.record_gcs_upload(destination_name, stat.st_size, stat.st_mtime, gcs_uri)
+        return gcs_uri
     except Exception as e:
         logger.error(f"GCS Upload Failed: {e}")
         return None
 
+def _restore_audio_blob(gcs_uri: str, stem: str) -> bool:
+    """
+    Re-uploads the audio behind a memoized gcs_uri whose blob has since been
+    deleted (lifecycle rule, manual cleanup). True if it was uploaded again.
+    """
+    blob_name = _split_gcs_uri(gcs_uri)[1]
+    try:
+        if _get_bucket().blob(blob_name).exists():
+            return False
+    except Exception:
+        return False
+    upload_path = _audio_path(stem).with_suffix(Path(blob_name).suffix)
+    if not upload_path.exists():
+        return False
+    logger.warning(f"☁️ Memoized audio blob is gone; re-uploading {upload_path.name}")
+    return upload_to_gcs(upload_path, blob_name, force=True) == gcs_uri
+
+
+def _audio_path(stem: str) -> Path:
+    audio_path = config.VAULT_DIR / "Audio" / f"{stem}.wav"
+    if not audio_path.exists():
+        # Fallback to old location
+        audio_path = config.VAULT_DATA / f"{stem}.mp3"
+    return audio_path
+
+
+def _audio_blob_name(stem: str, audio_path: Path) -> str:
+    return f"audio_cache/{_slugify(stem)}{audio_path.suffix}"
+
+
+def _flac_copy(audio_path: Path) -> Path:
+    """
+    Lossless FLAC next to the WAV (roughly half the bytes to upload and for
+    Gemini to ingest). Kept until the job succeeds so retries don't re-encode;
+    falls back to the WAV if encoding fails.
+    """
+    if audio_path.suffix != ".wav" or os.environ.get("OMEGA_TRANSLATE_FLAC", "1") == "0":
+        return audio_path
+    flac_path = audio_path.with_suffix(".flac")
+    tmp_path = flac_path.with_name(f".{flac_path.stem}.tmp.{os.getpid()}.flac")
+    try:
+        if flac_path.exists() and flac_path.stat().st_mtime >= audio_path.stat().st_mtime:
+            return flac_path
+        subprocess.run(
+            [
+                config.FFMPEG_BIN, "-y", "-nostats", "-loglevel", "error",
+                "-i", str(audio_path),
+                "-c:a", "flac", "-compression_level", "5",
+                str(tmp_path),
+            ],
+            check=True,
+            capture_output=True,
+            timeout=900,
+        )
+        os.replace(tmp_path, flac_path)
+        return flac_path
+    except Exception as e:
+        logger.warning(f"FLAC encode failed ({e}); uploading WAV.")
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        return audio_path
+
+
+def _upload_audio(audio_path: Path, stem: str) -> Optional[str]:
+    upload_path = _flac_copy(audio_path)
+    return upload_to_gcs(upload_path, _audio_blob_name(stem, upload_path))
+
+
+def prefetch_audio(stem: str) -> None:
+    """
+    Starts uploading a queued job's audio in the background so its translate()
+    finds the blob already in GCS. Safe to call repeatedly for the same stem.
+    """
+    audio_path = _audio_path(stem)
+    if not audio_path.exists() or not ensure_credentials():
+        return
+    with _storage_lock:
+        if stem not in _prefetched_uploads:
+            logger.info(f"☁️ Prefetching audio for queued job: {stem}")
+            _prefetched_uploads[stem] = _prefetch_pool.submit(_upload_audio, audio_path, stem)
+
+
+def _discard_prefetched_upload(upload: "Optional[Future[Optional[str]]]", stem: str) -> None:
+    # translate() returned before needing the blob; don't leave it in GCS.
+    if upload is not None:
+        _submit_cleanup(f"audio upload for {stem}", _delete_uploaded_audio, upload, _audio_path(stem), stem)
+
+
+def _upload_result(upload: "Future[Optional[str]]") -> str:
+    gcs_uri = upload.result()
+    if not gcs_uri:
+        raise Exception("GCS Upload failed")
+    return gcs_uri
+
+
+def _split_gcs_uri(uri: str) -> tuple[str, str]:
+    bucket_name, _, prefix = uri[len("gs://"):].partition("/")
+    return bucket_name, prefix
+
+
+def submit_batch_translation(
+    batches: list[list[dict]],
+    *,
+    stem: str,
+    gcs_uri: str,
+    target_language: str,
+    program_profile: str,
+    system_instruction: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Submits batches as a Vertex AI batch prediction job (see OMEGA_TRANSLATE_BATCH_MODE).
+
+    Half the price of online generate_content and not subject to per-minute
+    quotas, at the cost of queueing latency. Does not wait: returns the record
+    translate() keeps in the checkpoint for poll_batch_translation(), or None
+    if batch prediction is unavailable.
+    """
+    if BatchPredictionJob is None:
+        logger.warning("⚠️ vertexai.batch_prediction unavailable; translating online.")
+        return None
+
+    mime_type = _audio_mime_type(gcs_uri)
+    generation_config = {
+        "responseMimeType": "application/json",
+        "responseSchema": _RESPONSE_SCHEMA,
+        "temperature": _TEMPERATURE,
+    }
+    safety_settings = [
+        {"category": category, "threshold": "BLOCK_NONE"}
+        for category in (
+            "HARM_CATEGORY_HATE_SPEECH",
+            "HARM_CATEGORY_DANGEROUS_CONTENT",
+            "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+            "HARM_CATEGORY_HARASSMENT",
+        )
+    ]
+    lines = []
+    for batch in batches:
+        prompt = _build_prompt(_batch_json(batch), target_language=target_language, program_profile=program_profile)
+        request = {
+            "contents": [{
+                "role": "user",
+                "parts": [{"text": prompt}, {"fileData": {"fileUri": gcs_uri, "mimeType": mime_type}}],
+            }],
+            "systemInstruction": {"parts": [{"text": system_instruction}]},
+            "generationConfig": generation_config,
+            "safetySettings": safety_settings,
+        }
+        lines.append(json.dumps({"request": request}, ensure_ascii=False))
+
+    job_id = f"{_slugify(stem)}.{int(time.time())}"
+    input_blob = _get_bucket().blob(f"batch_in/{job_id}.jsonl")
+    input_blob.upload_from_string("\n".join(lines), content_type="application/jsonl")
+    try:
+        job = BatchPredictionJob.submit(
+            source_model=config.MODEL_TRANSLATOR,
+            input_dataset=f"gs://{BUCKET_NAME}/{input_blob.name}",
+            output_uri_prefix=f"gs://{BUCKET_NAME}/batch_out/{job_id}",
+        )
+    except Exception:
+        try:
+            input_blob.delete()
+        except Exception:
+            pass
+        raise
+    logger.info(f"📦 Batch prediction submitted: {job.resource_name} ({len(batches)} requests)")
+    omega_db.update(stem, status=f"Batch translation queued ({len(batches)} requests)")
+
+    timeout = float(os.environ.get("OMEGA_TRANSLATE_BATCH_TIMEOUT", "14400") or 14400)
+    return {
+        "resource_name": job.resource_name,
+        "input_blob": input_blob.name,
+        # Output rows are matched back to their batch by the segment ids in the response.
+        "batches": [_iter_input_ids(batch) for batch in batches],
+        "deadline": time.time() + timeout,
+    }
+
+
+def _collect_batch_translation(record: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """
+    None while the batch job is still queued/running. Once it has ended (or
+    passed its deadline and been cancelled) returns {segment id: text} for the
+    batches that came back valid, possibly empty, and deletes its blobs.
+    """
+    job = BatchPredictionJob(record["resource_name"])
+    results: Dict[str, str] = {}
+    output_blobs = []
+    try:
+        if not job.has_ended:
+            if time.time() < float(record.get("deadline") or 0):
+                return None
+            logger.warning("⚠️ Batch prediction passed its deadline; cancelling.")
+            try:
+                job.cancel()
+            except Exception:
+                pass
+            return results
+
+        if not job.has_succeeded:
+            logger.warning(f"⚠️ Batch prediction failed: {job.error}")
+            return results
+
+        batch_by_id: Dict[int, list[dict]] = {}
+        for ids in record.get("batches") or []:
+            batch = [{"id": seg_id} for seg_id in ids]
+            for seg_id in ids:
+                batch_by_id[int(seg_id)] = batch
+
+        out_bucket, out_prefix = _split_gcs_uri(job.output_location)
+        output_blobs = [
+            blob for blob in _get_storage_client().bucket(out_bucket).list_blobs(prefix=out_prefix)
+            if blob.name.endswith(".jsonl")
+        ]
+        for blob in output_blobs:
+            for line in blob.download_as_text().splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    parts = row["response"]["candidates"][0]["content"]["parts"]
+                    text = "".join(part.get("text", "") for part in parts)
+                    first = _loads_model_json(text)[0]
+                    batch = batch_by_id[int(first["id"])]
+                    for item in _parse_translation(text, batch):
+                        results[str(item["id"])] = item["text"]
+                except Exception as exc:
+                    logger.warning(f"   ⚠️ Skipping batch prediction row: {exc}")
+        return results
+    finally:
+        if job.has_ended or time.time() >= float(record.get("deadline") or 0):
+            for blob in [_get_bucket().blob(record["input_blob"]), *output_blobs]:
+                try:
+                    blob.delete()
+                except Exception:
+                    pass
+
+
+def poll_batch_translation(
+    transcription_path: Path,
+    target_language_code: str = "is",
+    program_profile: str = "standard",
+) -> bool:
+    """
+    Checks the batch prediction job translate() submitted for this job.
+    False while it is still queued; True once it has finished (results merged
+    into the checkpoint) or been given up on, i.e. call translate() again to
+    finish the remaining segments online.
+    """
+    stem = transcription_path.stem.replace("_SKELETON_DONE", "").replace("_SKELETON", "")
+    program_profile = (program_profile or "standard").strip() or "standard"
+    target_language_code = (target_language_code or "is").strip().lower() or "is"
+    wrapper = _read_json(transcription_path)
+    full_data = wrapper.get("segments", wrapper) if isinstance(wrapper, dict) else wrapper
+
+    checkpoint_path = _checkpoint_path(stem, target_language_code, program_profile)
+    checkpoint = _load_checkpoint(
+        checkpoint_path,
+        stem=stem,
+        target_language_code=target_language_code,
+        program_profile=program_profile,
+        source_count=len(full_data),
+    )
+    record = checkpoint.get("batch_job")
+    if not isinstance(record, dict) or BatchPredictionJob is None:
+        return True
+
+    if not ensure_credentials():
+        raise Exception("Google Credentials not found")
+    _init_vertex()
+    results = _collect_batch_translation(record)
+    if results is None:
+        return False
+
+    translated_map: Dict[str, str] = dict(checkpoint.get("translated") or {})
+    translated_map.update(results)
+    checkpoint["translated"] = translated_map
+    checkpoint.pop("batch_job", None)
+    checkpoint["batch_done"] = True
+    checkpoint["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    checkpoint["translated_count"] = sum(1 for seg_id in _iter_input_ids(full_data) if str(seg_id) in translated_map)
+    _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+    logger.info(f"📦 Batch prediction translated {len(results)} segments for {stem}.")
+    if checkpoint["translated_count"] >= len(full_data):
+        # Nothing left for online, which would have reused the audio blob.
+        _submit_cleanup(f"audio upload for {stem}", _delete_uploaded_audio, None, _audio_path(stem), stem)
+    return True
+
+
+def _delete_uploaded_audio(upload: "Optional[Future[Optional[str]]]", audio_path: Path, stem: str) -> None:
+    if upload is not None:
+        gcs_uri = upload.result()
+        blob_names = [_split_gcs_uri(gcs_uri)[1]] if gcs_uri else []
+    else:
+        # Nothing uploaded this run (the checkpointed cache was reused); remove
+        # whichever blob the earlier run left behind.
+        blob_names = [_audio_blob_name(stem, audio_path.with_suffix(".flac")), _audio_blob_name(stem, audio_path)]
+    for blob_name in dict.fromkeys(blob_names):
+        omega_db.forget_gcs_upload(blob_name)
+        try:
+            _get_bucket().blob(blob_name).delete()
+        except Exception:
+            if upload is not None:
+                raise
+    if audio_path.suffix == ".wav":
+        try:
+            audio_path.with_suffix(".flac").unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _submit_cleanup(label: str, fn, *args) -> None:
+    # Fire-and-forget; the pool's worker threads are joined at interpreter exit,
+    # so pending deletes still finish when the manager shuts down.
+    def _log_result(future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.debug(f"Cleanup of {label} failed: {exc}")
+
+    _cleanup_pool.submit(fn, *args).add_done_callback(_log_result)
+
+
 import profiles
 
+def _bind_cached_model(cached_content, expires_at: float) -> GenerativeModel:
+    model = GenerativeModel.from_cached_content(cached_content=cached_content)
+    with _cached_models_lock:
+        _cached_models[cached_content.name] = (expires_at, cached_content, model)
+    return model
+
+
+def _model_for_cache(cache_name: str, created_at: Optional[str] = None) -> GenerativeModel:
+    """
+    Returns a model bound to an existing context cache, reusing the binding across
+    jobs/re-runs until the cache's TTL runs out (binding by name costs a GET).
+    """
+    now = time.time()
+    with _cached_models_lock:
+        for name in [name for name, entry in _cached_models.items() if entry[0] <= now]:
+            del _cached_models[name]
+        entry = _cached_models.get(cache_name)
+    if entry is not None:
+        return entry[2]
+
+    expires_at = now + CONTEXT_CACHE_TTL.total_seconds()
+    if created_at:
+        try:
+            expires_at = datetime.datetime.fromisoformat(created_at).timestamp() + CONTEXT_CACHE_TTL.total_seconds()
+        except ValueError:
+            pass
+    return _bind_cached_model(caching.CachedContent(cached_content_name=cache_name), expires_at)
+
+
+def _delete_context_cache(cache_name: str) -> None:
+    with _cached_models_lock:
+        entry = _cached_models.pop(cache_name, None)
+    cached_content = entry[1] if entry else caching.CachedContent(cached_content_name=cache_name)
+    cached_content.delete()
+
+
 def create_context_cache(gcs_uri: str, stem: str, target_language: str = "Icelandic", program_profile: str = "standard") -> Optional[str]:
     logger.info(f"⚡️ Creating Context Cache ({config.MODEL_TRANSLATOR}) for {stem} in {target_language} (Profile: {program_profile})...")
     
@@ -435,8 +1199,9 @@ def create_context_cache(gcs_uri: str, stem: str, target_language: str = "Icelan
     lang_code = lang_map.get(target_language.lower(), target_language.lower())
     
     system_instruction = profiles.get_system_instruction(lang_code, program_profile)
+    system_instruction += _translation_rules(target_language, program_profile)
     
-    mime_type = "audio/wav" if gcs_uri.endswith(".wav") else "audio/mpeg"
+    mime_type = _audio_mime_type(gcs_uri)
     
     try:
         # Create Cache
@@ -448,19 +1213,102 @@ def create_context_cache(gcs_uri: str, stem: str, target_language: str = "Icelan
                     Part.from_uri(mime_type=mime_type, uri=gcs_uri)
                 ])
             ],
-            ttl=datetime.timedelta(minutes=60)
+            ttl=CONTEXT_CACHE_TTL
         )
         logger.info(f"✅ Cache Active! ID: {cached_content.name}")
-        return cached_content.name
-    except Exception as e:
+        _bind_cached_model(cached_content, time.time() + CONTEXT_CACHE_TTL.total_seconds())
         return cached_content.name
     except Exception as e:
         logger.warning(f"Cache Creation Failed (will fallback): {e}")
         return None
 
-def translate(transcription_path: Path, target_language_code: str = "is", program_profile: str = "standard"):
+def _checkpoint_cache_name(checkpoint: Dict[str, Any]) -> Optional[str]:
+    """The checkpointed context cache name, if it matches the current model and prompt layout."""
+    existing_cache_name = checkpoint.get("cache_name")
+    existing_cache_model = checkpoint.get("cache_model")
+    if (
+        isinstance(existing_cache_name, str)
+        and existing_cache_name.strip()
+        and (not existing_cache_model or existing_cache_model == config.MODEL_TRANSLATOR)
+        and checkpoint.get("cache_layout") == _CACHE_LAYOUT
+    ):
+        return existing_cache_name.strip()
+    return None
+
+
+def _init_model(
+    checkpoint: Dict[str, Any],
+    checkpoint_path: Path,
+    *,
+    audio_upload: "Callable[[], Future[Optional[str]]]",
+    stem: str,
+    target_language: str,
+    program_profile: str,
+) -> tuple[GenerativeModel, Optional[str], Optional[Part]]:
+    """
+    Returns (model, cache_name, audio_context), reusing the checkpointed context
+    cache when valid. audio_upload() is only called when the audio is needed.
+    """
+    cache_name = _checkpoint_cache_name(checkpoint)
+
+    if cache_name:
+        try:
+            # Instantiate Model from existing Cache
+            model = _model_for_cache(cache_name, checkpoint.get("cache_created_at"))
+            logger.info("♻️ Reusing existing context cache: %s", cache_name)
+        except Exception:
+            cache_name = None
+
+    audio_context: Optional[Part] = None
+    if not cache_name:
+        # Prepare system instruction for fallback
+        lang_map_full = {
+            "icelandic": "is", "english": "en", "spanish": "es", 
+            "french": "fr", "german": "de", "portuguese": "pt", "italian": "it"
+        }
+        l_code = lang_map_full.get(target_language.lower(), target_language.lower())
+        sys_inst = profiles.get_system_instruction(l_code, program_profile)
+        
+        gcs_uri = _upload_result(audio_upload())
+        cache_name = create_context_cache(gcs_uri, stem, target_language, program_profile=program_profile)
+        if not cache_name and _restore_audio_blob(gcs_uri, stem):
+            cache_name = create_context_cache(gcs_uri, stem, target_language, program_profile=program_profile)
+        
+        if cache_name:
+            checkpoint["cache_name"] = cache_name
+            checkpoint["cache_model"] = config.MODEL_TRANSLATOR
+            checkpoint["cache_layout"] = _CACHE_LAYOUT
+            checkpoint["cache_created_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+
+            model = _model_for_cache(cache_name)
+        else:
+            # FALLBACK: No cache (e.g. content too short or error)
+            # Use standard model and pass audio context in every request
+            logger.warning("⚠️ Using Per-Request Audio Context (No Cache)")
+            if gcs_uri:
+                # The memoized blob may be gone; make the next attempt re-upload.
+                omega_db.forget_gcs_upload(_split_gcs_uri(gcs_uri)[1])
+            model = GenerativeModel(config.MODEL_TRANSLATOR, system_instruction=sys_inst)
+            mime_type = _audio_mime_type(gcs_uri)
+            audio_context = Part.from_uri(mime_type=mime_type, uri=gcs_uri)
+
+    return model, cache_name, audio_context
+
+
+def translate(
+    transcription_path: Path,
+    target_language_code: str = "is",
+    program_profile: str = "standard",
+    *,
+    batch_mode: Optional[bool] = None,
+):
     """
     Translates a skeleton transcription using a Gemini cached-audio context.
+    batch_mode submits the batches to batch prediction and returns None without
+    waiting (None means only when OMEGA_TRANSLATE_BATCH_MODE is "all");
+    poll_batch_translation() reports when to call translate() again, which
+    then finishes whatever the batch job didn't return online.
 
     Stability features:
     - On-disk checkpointing to resume after crashes/restarts.
@@ -472,6 +1320,9 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
     stem = transcription_path.stem.replace("_SKELETON_DONE", "").replace("_SKELETON", "")
     program_profile = (program_profile or "standard").strip() or "standard"
     target_language_code = (target_language_code or "is").strip().lower() or "is"
+    # Claim a prefetched upload up front so every return path uses or deletes it.
+    with _storage_lock:
+        prefetched_upload: "Optional[Future[Optional[str]]]" = _prefetched_uploads.pop(stem, None)
     
     # Map code to name for logging/cache creation if needed, 
     # but we primarily use code now.
@@ -498,6 +1349,7 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
             existing = _read_json(output_path)
             if isinstance(existing, dict) and "source_data" in existing and "translated_data" in existing:
                 logger.info("✅ Translation output already exists: %s", output_path.name)
+                _discard_prefetched_upload(prefetched_upload, stem)
                 return output_path
         except Exception:
             pass
@@ -523,18 +1375,27 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
         if not isinstance(existing_text, str) or not existing_text.strip():
             to_translate.append(seg)
 
+    # Short stock phrases already translated in an earlier job skip the model.
+    memo_keys = _segment_memo_keys(to_translate, target_language_code, program_profile)
+    if memo_keys:
+        memo_hits = omega_db.get_segment_translations(set(memo_keys.values()))
+        reused = {seg_id: memo_hits[key] for seg_id, key in memo_keys.items() if key in memo_hits}
+        if reused:
+            translated_map.update(reused)
+            checkpoint["translated"] = translated_map
+            to_translate = [seg for seg in to_translate if str(seg.get("id")) not in reused]
+            logger.info(f"♻️ Reused {len(reused)} short-segment translations from memo")
+
     # If already complete (e.g., after a crash), just (re)emit the editor payload.
     if not to_translate:
         translated_segments = [{"id": seg_id, "text": translated_map[str(seg_id)]} for seg_id in input_ids]
         payload = {"source_data": full_data, "translated_data": translated_segments}
         _atomic_write_json(output_path, payload)
         logger.info("👤 Sent to Chief Editor (resumed): %s", output_path.name)
+        _discard_prefetched_upload(prefetched_upload, stem)
         return output_path
 
-    audio_path = config.VAULT_DIR / "Audio" / f"{stem}.wav"
-    if not audio_path.exists():
-        # Fallback to old location
-        audio_path = config.VAULT_DATA / f"{stem}.mp3"
+    audio_path = _audio_path(stem)
     if not audio_path.exists():
         raise Exception(f"Audio file not found for {stem}")
 
@@ -542,61 +1403,70 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
     split_after_attempts = int(os.environ.get("OMEGA_TRANSLATE_SPLIT_AFTER", "2") or 2)
     base_batch_size = int(os.environ.get("OMEGA_TRANSLATE_BATCH_SIZE", str(BATCH_SIZE)) or BATCH_SIZE)
     batch_size = max(1, min(base_batch_size, 200))
+    batch_tokens = max(1, int(os.environ.get("OMEGA_TRANSLATE_BATCH_TOKENS", str(BATCH_TOKENS)) or BATCH_TOKENS))
+
+    if batch_mode is None:
+        batch_mode = config.OMEGA_TRANSLATE_BATCH_MODE in {"1", "true", "yes", "on", "all"}
+    if isinstance(checkpoint.get("batch_job"), dict):
+        # The batch job reads the same blob, so a prefetched upload is just dropped.
+        logger.info("📦 Batch prediction still pending for %s", stem)
+        return None
+    # One batch submission per job; a finished batch leaves the rest to online.
+    batch_mode = bool(batch_mode) and not checkpoint.get("batch_done")
 
     # Init & Cache (only when we actually need to translate new segments).
-    vertexai.init(project=PROJECT_ID, location=LOCATION)
-    gcs_uri = upload_to_gcs(audio_path, f"audio_cache/{_slugify(stem)}{audio_path.suffix}")
-    if not gcs_uri:
-        raise Exception("GCS Upload failed")
+    # The upload runs in the background so Vertex init and model setup overlap
+    # the transfer; it is only started when something needs the blob (a new
+    # context cache or batch mode), since a still-valid checkpointed cache doesn't.
+    gcs_upload = prefetched_upload
+    if gcs_upload is not None and gcs_upload.done() and not gcs_upload.result():
+        gcs_upload = None
+    elif gcs_upload is not None:
+        logger.info("☁️ Using prefetched audio upload: %s", stem)
+
+    def audio_upload() -> "Future[Optional[str]]":
+        nonlocal gcs_upload
+        if gcs_upload is None:
+            upload_pool = ThreadPoolExecutor(max_workers=1)
+            gcs_upload = upload_pool.submit(_upload_audio, audio_path, stem)
+            upload_pool.shutdown(wait=False)
+        return gcs_upload
+
+    if batch_mode or not _checkpoint_cache_name(checkpoint):
+        audio_upload()
+    _init_vertex()
+    if batch_mode and to_translate:
+        lang_code = {
+            "icelandic": "is", "english": "en", "spanish": "es",
+            "french": "fr", "german": "de", "portuguese": "pt", "italian": "it"
+        }.get(target_language.lower(), target_language.lower())
+        batch_job = submit_batch_translation(
+            _pack_batches(to_translate, batch_size, batch_tokens),
+            stem=stem,
+            gcs_uri=_upload_result(audio_upload()),
+            target_language=target_language,
+            program_profile=program_profile,
+            system_instruction=profiles.get_system_instruction(lang_code, program_profile),
+        )
+        if batch_job:
+            # The audio blob stays until the job completes: the batch reads it.
+            checkpoint["batch_job"] = batch_job
+            checkpoint["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+            return None
 
+    model: Optional[GenerativeModel] = None
     cache_name: Optional[str] = None
-    existing_cache_name = checkpoint.get("cache_name")
-    existing_cache_model = checkpoint.get("cache_model")
-    if (
-        isinstance(existing_cache_name, str)
-        and existing_cache_name.strip()
-        and (not existing_cache_model or existing_cache_model == config.MODEL_TRANSLATOR)
-    ):
-        cache_name = existing_cache_name.strip()
-
-    if cache_name:
-        try:
-            # Instantiate Model from existing Cache
-            model = GenerativeModel.from_cached_content(
-                cached_content=caching.CachedContent(cached_content_name=cache_name)
-            )
-            logger.info("♻️ Reusing existing context cache: %s", cache_name)
-        except Exception:
-            cache_name = None
-
     audio_context: Optional[Part] = None
-    if not cache_name:
-        # Prepare system instruction for fallback
-        lang_map_full = {
-            "icelandic": "is", "english": "en", "spanish": "es", 
-            "french": "fr", "german": "de", "portuguese": "pt", "italian": "it"
-        }
-        l_code = lang_map_full.get(target_language.lower(), target_language.lower())
-        sys_inst = profiles.get_system_instruction(l_code, program_profile)
-        
-        cache_name = create_context_cache(gcs_uri, stem, target_language, program_profile=program_profile)
-        
-        if cache_name:
-            checkpoint["cache_name"] = cache_name
-            checkpoint["cache_model"] = config.MODEL_TRANSLATOR
-            checkpoint["cache_created_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
-            _atomic_write_json(checkpoint_path, checkpoint)
-
-            model = GenerativeModel.from_cached_content(
-                cached_content=caching.CachedContent(cached_content_name=cache_name)
-            )
-        else:
-            # FALLBACK: No cache (e.g. content too short or error)
-            # Use standard model and pass audio context in every request
-            logger.warning("⚠️ Using Per-Request Audio Context (No Cache)")
-            model = GenerativeModel(config.MODEL_TRANSLATOR, system_instruction=sys_inst)
-            mime_type = "audio/wav" if gcs_uri.endswith(".wav") else "audio/mpeg"
-            audio_context = Part.from_uri(mime_type=mime_type, uri=gcs_uri)
+    if to_translate:
+        model, cache_name, audio_context = _init_model(
+            checkpoint,
+            checkpoint_path,
+            audio_upload=audio_upload,
+            stem=stem,
+            target_language=target_language,
+            program_profile=program_profile,
+        )
 
     success = False
     try:
@@ -607,44 +1477,88 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
             meta={"translation_checkpoint": str(checkpoint_path)},
         )
 
+        batches = _pack_batches(to_translate, batch_size, batch_tokens)
         logger.info(
-            "🧠 Translating %s: %s/%s already cached; batch_size=%s; profile=%s",
+            "🧠 Translating %s: %s/%s already cached; %s batches (max %s segments / ~%s tokens); profile=%s",
             stem,
             completed_before,
             total_count,
+            len(batches),
             batch_size,
+            batch_tokens,
             program_profile,
         )
 
-        for offset in range(0, len(to_translate), batch_size):
-            system_health.update_heartbeat("omega_manager")
-            batch = to_translate[offset : offset + batch_size]
-            translated_batch = translate_batch_with_cache(
-                model,
-                batch,
-                target_language,
-                program_profile,
-                max_attempts=max_attempts,
-                split_after_attempts=split_after_attempts,
-                audio_context=audio_context,
-            )
-            for item in translated_batch:
-                translated_map[str(item["id"])] = item["text"]
-
-            checkpoint["translated"] = translated_map
-            checkpoint["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
-            checkpoint["translated_count"] = sum(
-                1 for seg_id in input_ids if str(seg_id) in translated_map
-            )
-            _atomic_write_json(checkpoint_path, checkpoint)
-
-            translated_count = int(checkpoint["translated_count"])
-            omega_db.update(
-                stem,
-                progress=_translation_progress(translated_count, total_count),
-                status=f"Translating ({translated_count}/{total_count})",
-                meta={"translation_checkpoint": str(checkpoint_path)},
-            )
+        workers = max(1, min(int(os.environ.get("OMEGA_TRANSLATE_WORKERS", str(MAX_WORKERS)) or MAX_WORKERS), len(batches)))
+
+        # Batches are independent requests against the same cached context, so they
+        # run concurrently; results are merged and checkpointed here as each lands.
+        # Each finished batch is appended to the delta log (O(batch)); the full
+        # snapshot is rewritten only every few batches / seconds and on the way out.
+        _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+        delta_path = _checkpoint_delta_path(checkpoint_path)
+        translated_count = completed_before
+        # O_APPEND: after truncate(0) the next write lands at offset 0, not past a hole.
+        with ThreadPoolExecutor(max_workers=workers) as executor, open(delta_path, "ab") as delta:
+            delta.truncate(0)
+            futures = [
+                executor.submit(
+                    translate_batch_with_cache,
+                    model,
+                    batch,
+                    target_language,
+                    program_profile,
+                    max_attempts=max_attempts,
+                    split_after_attempts=split_after_attempts,
+                    audio_context=audio_context,
+                )
+                for batch in batches
+            ]
+            unflushed = 0
+            last_flush = time.monotonic()
+            last_progress = 0.0
+            try:
+                for future in as_completed(futures):
+                    system_health.update_heartbeat("omega_manager")
+                    translated_batch = future.result()
+                    for item in translated_batch:
+                        key = str(item["id"])
+                        if key not in translated_map:
+                            translated_count += 1
+                        translated_map[key] = item["text"]
+                    delta.write(b"".join(_json_line({"id": item["id"], "text": item["text"]}) for item in translated_batch))
+                    delta.flush()
+
+                    checkpoint["translated"] = translated_map
+                    checkpoint["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+                    checkpoint["translated_count"] = translated_count
+                    unflushed += 1
+                    if unflushed >= CHECKPOINT_FLUSH_BATCHES or time.monotonic() - last_flush >= CHECKPOINT_FLUSH_SECONDS:
+                        _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+                        delta.truncate(0)
+                        unflushed = 0
+                        last_flush = time.monotonic()
+
+                    # Each update is a write transaction plus a dashboard refetch; batches
+                    # finishing together only need the latest count.
+                    now = time.monotonic()
+                    if now - last_progress >= PROGRESS_UPDATE_SECONDS or translated_count >= total_count:
+                        last_progress = now
+                        omega_db.update(
+                            stem,
+                            progress=_translation_progress(translated_count, total_count),
+                            status=f"Translating ({translated_count}/{total_count})",
+                            meta={"translation_checkpoint": str(checkpoint_path)},
+                        )
+            except BaseException:
+                # Don't start queued batches after a hard failure; finished ones are checkpointed.
+                for future in futures:
+                    future.cancel()
+                raise
+            finally:
+                if unflushed:
+                    _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+                    delta.truncate(0)
 
         # Reassemble in original order and emit editor payload.
         missing_final = [seg_id for seg_id in input_ids if str(seg_id) not in translated_map]
@@ -659,7 +1573,18 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
         checkpoint["completed_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
         checkpoint["output_path"] = str(output_path)
         checkpoint["complete"] = True
-        _atomic_write_json(checkpoint_path, checkpoint)
+        _atomic_write_json(checkpoint_path, checkpoint, indent=None)
+        _discard_checkpoint_delta(checkpoint_path)
+
+        # (MUSIC) depends on what the audio is doing, not the words; never reuse it.
+        omega_db.record_segment_translations(
+            target_language_code,
+            (
+                (key, translated_map[seg_id])
+                for seg_id, key in _segment_memo_keys(full_data, target_language_code, program_profile).items()
+                if translated_map.get(seg_id, "").strip() and "(MUSIC)" not in translated_map[seg_id]
+            ),
+        )
 
         success = True
         return output_path
@@ -668,15 +1593,8 @@ def translate(transcription_path: Path, target_language_code: str = "is", progra
         if not success:
             logger.warning("🧯 Translation did not complete; keeping cloud cache/blob for retry.")
         else:
+            # Deletes run in the background; the editor payload is already written.
             logger.info("🧹 Cleanup Crew: Removing cloud resources...")
-            try:
-                if cache_name:
-                    caching.CachedContent(name=cache_name).delete()
-            except Exception:
-                pass
-            try:
-                if gcs_uri:
-                    blob_name = f"audio_cache/{_slugify(stem)}{audio_path.suffix}"
-                    storage.Client().bucket(BUCKET_NAME).blob(blob_name).delete()
-            except Exception:
-                pass
+            if cache_name:
+                _submit_cleanup(f"context cache {cache_name}", _delete_context_cache, cache_name)
+            _submit_cleanup(f"audio upload for {stem}", _delete_uploaded_audio, gcs_upload, audio_path, stem)
@@ -14,70 +14,175 @@ Usage:
     # Now send vocals_path to AssemblyAI instead of original
 """
 
+import hashlib
 import logging
+import os
 import subprocess
 import shutil
+import threading
 import time
 from pathlib import Path
 from typing import Optional
 
+try:
+    import torch
+    from demucs.apply import apply_model
+    from demucs.audio import AudioFile, convert_audio, save_audio
+    from demucs.pretrained import get_model
+except ImportError:  # CLI-only install: run demucs as a subprocess
+    torch = None
+
 logger = logging.getLogger("OmegaManager.VocalExtractor")
 
 # Demucs model - htdemucs is fast (5-8x realtime)
-# htdemucs_ft is slower but slightly higher quality
+# htdemucs_ft is a bag of 4 fine-tuned models: ~4x slower for slightly cleaner
+# stems, which transcription doesn't need. Ask for it with high_quality=True.
 DEFAULT_MODEL = "htdemucs"
+HIGH_QUALITY_MODEL = "htdemucs_ft"
+
+# What ASR actually consumes (AssemblyAI, WhisperX): 16 kHz mono.
+TRANSCRIPTION_SAMPLE_RATE = 16000
 
 # Use MPS (Metal Performance Shaders) for Apple Silicon GPU
 DEFAULT_DEVICE = "mps"
 
+# Finished vocals are kept (hardlinked) under <output_dir>/.vocal_cache so a
+# re-run on the same source skips Demucs; only the newest few are kept.
+VOCAL_CACHE_DIR = ".vocal_cache"
+VOCAL_CACHE_MAX = 8
+
+
+# Cache variants: "_fp16" marks half-precision output (an fp32 request never
+# reuses it; an fp16 request accepts fp32), "_16k" the 16 kHz mono
+# transcription format (only the in-process path writes it).
+def _vocal_cache_path(source_path: Path, output_dir: Path, model: str, variant: str = "") -> Path:
+    # (name, size, mtime) identifies the source without hashing GBs of audio.
+    st = source_path.stat()
+    key = hashlib.sha256(f"{source_path.name}|{st.st_size}|{st.st_mtime_ns}".encode("utf-8")).hexdigest()[:20]
+    return output_dir / VOCAL_CACHE_DIR / f"{key}_{model}{variant}.wav"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink (instant, no extra disk); copy if the filesystem refuses."""
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _prune_vocal_cache(cache_dir: Path) -> None:
+    entries = sorted(cache_dir.glob("*.wav"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in entries[VOCAL_CACHE_MAX:]:
+        old.unlink(missing_ok=True)
+
+
+# torch.compile the resident model's forward (experimental on MPS; falls back
+# to eager on the first failure). Compiles once per process, on the first file.
+DEMUCS_COMPILE = os.environ.get("OMEGA_DEMUCS_COMPILE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+# Loaded Demucs model, kept on the device between files (one at a time).
+_models: dict = {}
+_model_lock = threading.Lock()
+
 
 def is_demucs_available() -> bool:
     """Check if demucs is installed and accessible."""
+    if torch is not None:
+        return True
     result = subprocess.run(["which", "demucs"], capture_output=True)
     return result.returncode == 0
 
 
-def extract_vocals(
+def _demucs_model(model_name: str, device: str):
+    key = (model_name, device)
+    if key not in _models:
+        _models.clear()
+        model = get_model(model_name)
+        model.to(device)  # stays resident; apply_model won't shuttle it back to CPU
+        model.eval()
+        if DEMUCS_COMPILE and hasattr(torch, "compile"):
+            _set_compiled(model, True)
+        _models[key] = model
+    return _models[key]
+
+
+def _set_compiled(model, compiled: bool) -> None:
+    # Compile each network's forward in place so apply_model still sees the
+    # BagOfModels/HTDemucs instances it type-checks and moves between devices.
+    for sub in getattr(model, "models", [model]):
+        if compiled:
+            sub.forward = torch.compile(sub.forward, dynamic=False)
+        else:
+            sub.__dict__.pop("forward", None)
+    model._omega_compiled = compiled
+
+
+def _apply(model, mix, device: str):
+    with torch.no_grad():
+        try:
+            return apply_model(model, mix, device=device, shifts=1, split=True, overlap=0.25)[0]
+        except Exception as e:
+            if not getattr(model, "_omega_compiled", False):
+                raise
+            logger.warning(f"⚠️ Compiled Demucs failed ({e}); running eager")
+            _set_compiled(model, False)
+            return apply_model(model, mix, device=device, shifts=1, split=True, overlap=0.25)[0]
+
+
+def _separate_in_process(
     source_path: Path,
-    output_dir: Optional[Path] = None,
-    model: str = DEFAULT_MODEL,
-    device: str = DEFAULT_DEVICE,
-    keep_no_vocals: bool = False,
-) -> Optional[Path]:
+    final_vocals: Path,
+    model_name: str,
+    device: str,
+    fp16: bool = False,
+    sample_rate: Optional[int] = None,
+) -> bool:
     """
-    Extract vocal track from audio/video file using Demucs.
-    
-    Args:
-        source_path: Path to source audio or video file
-        output_dir: Where to save extracted vocals (default: same as source)
-        model: Demucs model to use (htdemucs_ft, htdemucs)
-        device: Device to use (mps for Apple Silicon, cpu, cuda)
-        keep_no_vocals: Also extract "no_vocals" (instrumental) track
-        
-    Returns:
-        Path to extracted vocals.wav file, or None if extraction failed.
+    Same separation as `demucs --two-stems vocals` (shifts=1, overlap 0.25,
+    16-bit rescaled WAV) without a new interpreter and model load per file.
+    fp16 runs the model in half precision (about half the memory traffic on
+    MPS) and falls back to fp32 if the device rejects an op. sample_rate
+    downmixes and resamples the vocals tensor before the one and only write.
+    Returns True if the fp16 pass was used.
     """
-    source_path = Path(source_path)
-    if not source_path.exists():
-        logger.error(f"❌ Source file not found: {source_path}")
-        return None
-    
-    if output_dir is None:
-        output_dir = source_path.parent
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Temp dir for demucs output
+    with _model_lock:  # one separation at a time on the GPU
+        model = _demucs_model(model_name, device)
+        wav = AudioFile(source_path).read(streams=0, samplerate=model.samplerate, channels=model.audio_channels)
+        ref = wav.mean(0)
+        wav = (wav - ref.mean()) / ref.std()
+        sources = None
+        if fp16:
+            try:
+                sources = _apply(model.half(), wav[None].half(), device)
+            except RuntimeError as e:
+                logger.warning(f"⚠️ fp16 Demucs failed ({e}); retrying in fp32")
+            finally:
+                model.float()
+        used_fp16 = sources is not None
+        if sources is None:
+            sources = _apply(model, wav[None], device)
+        vocals = sources[model.sources.index("vocals")].float() * ref.std() + ref.mean()
+        del sources, wav
+        if sample_rate:
+            vocals = convert_audio(vocals, model.samplerate, sample_rate, 1)
+        tmp_path = final_vocals.with_name(f".{final_vocals.stem}.tmp.wav")
+        save_audio(vocals.cpu(), str(tmp_path), samplerate=sample_rate or model.samplerate)
+        os.replace(tmp_path, final_vocals)
+        return used_fp16
+
+
+def _separate_cli(source_path: Path, output_dir: Path, final_vocals: Path, model: str, device: str) -> bool:
+    stem = source_path.stem
+
+    # Demucs writes <out>/<model>/<filename>. Per-track file names (rather than
+    # a per-track folder that gets rmtree'd) keep concurrent jobs sharing this
+    # dir out of each other's way; everything stays on one filesystem, so the
+    # final move is a rename.
     temp_dir = output_dir / "_demucs_temp"
     temp_dir.mkdir(exist_ok=True)
-    
-    stem = source_path.stem
-    
-    logger.info(f"🎵 Extracting vocals from: {source_path.name}")
-    logger.info(f"   Model: {model}, Device: {device}")
-    
-    start_time = time.time()
-    
+
     # Build demucs command
     cmd = [
         "demucs",
@@ -85,8 +190,11 @@ def extract_vocals(
         "--two-stems", "vocals",  # Only vocals vs everything else
         "-d", device,
         "-o", str(temp_dir),
+        "--filename", "{track}_{stem}.{ext}",
         str(source_path)
     ]
+    vocals_source = temp_dir / model / f"{stem}_vocals.wav"
+    no_vocals = temp_dir / model / f"{stem}_no_vocals.wav"
     
     try:
         result = subprocess.run(
@@ -98,41 +206,116 @@ def extract_vocals(
         
         if result.returncode != 0:
             logger.error(f"❌ Demucs failed: {result.stderr[-500:]}")
-            return None
+            return False
             
     except subprocess.TimeoutExpired:
         logger.error("❌ Demucs timed out")
-        return None
+        return False
     except Exception as e:
         logger.error(f"❌ Demucs error: {e}")
-        return None
-    
-    elapsed = time.time() - start_time
-    
-    # Find output vocals file
-    vocals_source = temp_dir / model / stem / "vocals.wav"
-    if not vocals_source.exists():
-        # Try with different extensions based on input
-        for ext in [".wav", ".mp3", ".m4a", ".flac"]:
-            alt_stem = source_path.stem
-            vocals_source = temp_dir / model / alt_stem / "vocals.wav"
-            if vocals_source.exists():
-                break
+        return False
+    finally:
+        # The CLI always writes the instrumental too; it isn't used.
+        no_vocals.unlink(missing_ok=True)
     
     if not vocals_source.exists():
         logger.error(f"❌ Vocals output not found")
-        logger.error(f"   Expected at: {temp_dir / model / stem / 'vocals.wav'}")
+        logger.error(f"   Expected at: {vocals_source}")
         # List what's in the temp dir for debugging
         for p in temp_dir.rglob("*"):
             logger.debug(f"   Found: {p}")
-        return None
+        return False
     
     # Move vocals to final location
+    os.replace(vocals_source, final_vocals)
+    try:
+        (temp_dir / model).rmdir()  # only once no other job is using it
+        temp_dir.rmdir()
+    except OSError:
+        pass
+    return True
+
+
+def extract_vocals(
+    source_path: Path,
+    output_dir: Optional[Path] = None,
+    model: str = DEFAULT_MODEL,
+    device: str = DEFAULT_DEVICE,
+    keep_no_vocals: bool = False,
+    fp16: bool = False,
+    high_quality: bool = False,
+    for_transcription: bool = False,
+) -> Optional[Path]:
+    """
+    Extract vocal track from audio/video file using Demucs.
+    
+    Args:
+        source_path: Path to source audio or video file
+        output_dir: Where to save extracted vocals (default: same as source)
+        model: Demucs model to use (htdemucs_ft, htdemucs)
+        device: Device to use (mps for Apple Silicon, cpu, cuda)
+        keep_no_vocals: Also extract "no_vocals" (instrumental) track
+        fp16: Half-precision inference (in-process path only)
+        high_quality: Use htdemucs_ft regardless of model (e.g. archive masters)
+        for_transcription: Write 16 kHz mono (~1/5 the size) straight from the
+            separated tensor; the CLI fallback still writes 44.1 kHz stereo
+        
+    Returns:
+        Path to extracted vocals.wav file, or None if extraction failed.
+    """
+    source_path = Path(source_path)
+    if not source_path.exists():
+        logger.error(f"❌ Source file not found: {source_path}")
+        return None
+    
+    if high_quality:
+        model = HIGH_QUALITY_MODEL
+    
+    if output_dir is None:
+        output_dir = source_path.parent
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    stem = source_path.stem
     final_vocals = output_dir / f"{stem}_VOCALS.wav"
-    shutil.move(str(vocals_source), str(final_vocals))
+    sample_rate = TRANSCRIPTION_SAMPLE_RATE if for_transcription else None
+    # Full-rate vocals also serve transcription if no 16 kHz copy is cached
+    for rate in (("_16k", "") if for_transcription else ("",)):
+        for precision in (("_fp16", "") if fp16 else ("",)):
+            cache_path = _vocal_cache_path(source_path, output_dir, model, precision + rate)
+            if cache_path.exists():
+                _link_or_copy(cache_path, final_vocals)
+                os.utime(cache_path)  # most recently used survives pruning
+                logger.info(f"♻️ Vocals already extracted for {source_path.name} ({model}); reusing cache")
+                return final_vocals
     
-    # Clean up temp directory
-    shutil.rmtree(str(temp_dir), ignore_errors=True)
+    logger.info(f"🎵 Extracting vocals from: {source_path.name}")
+    logger.info(f"   Model: {model}, Device: {device}{' (fp16)' if fp16 else ''}")
+    
+    start_time = time.time()
+    
+    extracted = False
+    variant = ""
+    if torch is not None:
+        try:
+            used_fp16 = _separate_in_process(source_path, final_vocals, model, device, fp16=fp16, sample_rate=sample_rate)
+            extracted = True
+            variant = ("_fp16" if used_fp16 else "") + ("_16k" if sample_rate else "")
+        except Exception as e:
+            logger.warning(f"⚠️ In-process Demucs failed ({e}); falling back to the CLI")
+    if not extracted and not _separate_cli(source_path, output_dir, final_vocals, model, device):
+        return None
+    
+    elapsed = time.time() - start_time
+    
+    # Cached under what was actually written (the CLI fallback is fp32 44.1 kHz stereo)
+    cache_path = _vocal_cache_path(source_path, output_dir, model, variant)
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        _link_or_copy(final_vocals, cache_path)
+        _prune_vocal_cache(cache_path.parent)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not cache vocals: {e}")
     
     # Log performance
     logger.info(f"✅ Vocals extracted in {elapsed:.1f}s: {final_vocals.name}")
@@ -170,7 +353,7 @@ def extract_vocals_for_transcription(
         return audio_path
     
     # Extract vocals (removes background music)
-    vocals = extract_vocals(video_path, audio_output_dir)
+    vocals = extract_vocals(video_path, audio_output_dir, for_transcription=True)
     
     if vocals and vocals.exists():
         return vocals